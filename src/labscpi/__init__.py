@@ -4,13 +4,13 @@ __rules_version__ = "0.5.0"
 from .oscilloscope_scpi import (
     Oscilloscope, Measure, ChannelUnit, TriggerSweepMode, MathOperator,
 )
-from .psu_scpi import PowerSupply
+from .psu_scpi import PowerSupply, PowerSupplyGroup
 from .eload_scpi import ElectronicLoad
 
 
 
 __all__ = [
     "Oscilloscope","Measure","ChannelUnit","TriggerSweepMode","MathOperator",
-    "PowerSupply","ElectronicLoad",
+    "PowerSupply","PowerSupplyGroup","ElectronicLoad",
 
 ]
@@ -0,0 +1,104 @@
+# _fastparse.py
+# Optional numba-compiled parser for short ASCII numeric replies ("1.234E+00\n").
+# Only used when numba is installed; callers fall back to float() otherwise.
+
+from __future__ import annotations
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None  # optional
+
+_NAN = float("nan")
+
+# Exact powers of ten representable as float64 (Clinger fast path bound)
+_POW10 = (
+    1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9, 1e10, 1e11,
+    1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22,
+)
+
+
+def _parse_ascii_f64(buf: bytes) -> float:
+    """
+    Parse "<ws>[+-]digits[.digits][(e|E)[+-]digits]<ws|,|;>..." from ASCII bytes.
+
+    Uses the exact path: significand < 2**53 and |exp10| <= 22, so one
+    multiply/divide by an exact power of ten is correctly rounded. Returns
+    NaN whenever that does not hold (or the text is not a plain number);
+    the caller must then use float().
+    """
+    n = len(buf)
+    i = 0
+    while i < n and (buf[i] == 32 or buf[i] == 9):
+        i += 1
+    neg = False
+    if i < n and (buf[i] == 43 or buf[i] == 45):  # '+' / '-'
+        neg = buf[i] == 45
+        i += 1
+    mant = 0
+    sig = 0      # significant digits accumulated in mant
+    exp10 = 0
+    ndig = 0
+    while i < n and 48 <= buf[i] <= 57:
+        if mant or buf[i] != 48:
+            if sig == 15:
+                return _NAN
+            mant = mant * 10 + (buf[i] - 48)
+            sig += 1
+        ndig += 1
+        i += 1
+    if i < n and buf[i] == 46:  # '.'
+        i += 1
+        while i < n and 48 <= buf[i] <= 57:
+            if mant or buf[i] != 48:
+                if sig == 15:
+                    return _NAN
+                mant = mant * 10 + (buf[i] - 48)
+                sig += 1
+            exp10 -= 1
+            ndig += 1
+            i += 1
+    if ndig == 0:
+        return _NAN
+    if i < n and (buf[i] == 69 or buf[i] == 101):  # 'E' / 'e'
+        i += 1
+        eneg = False
+        if i < n and (buf[i] == 43 or buf[i] == 45):
+            eneg = buf[i] == 45
+            i += 1
+        e = 0
+        edig = 0
+        while i < n and 48 <= buf[i] <= 57:
+            if e < 10000:
+                e = e * 10 + (buf[i] - 48)
+            edig += 1
+            i += 1
+        if edig == 0:
+            return _NAN
+        exp10 += -e if eneg else e
+    # only whitespace or a field separator may follow
+    if i < n and not (buf[i] == 32 or buf[i] == 9 or buf[i] == 10 or buf[i] == 13
+                      or buf[i] == 44 or buf[i] == 59):
+        return _NAN
+    if mant == 0:
+        v = 0.0
+    elif 0 <= exp10 <= 22:
+        v = mant * _POW10[exp10]
+    elif -22 <= exp10 < 0:
+        v = mant / _POW10[-exp10]
+    else:
+        return _NAN
+    return -v if neg else v
+
+
+if njit is not None:
+    try:
+        parse_ascii_f64 = njit(cache=True)(_parse_ascii_f64)
+        # njit compiles (and writes its cache) on the first call, so make that
+        # call here: a cache that can't be used fails inside this try
+        parse_ascii_f64(b"1")
+    except Exception:
+        # e.g. read-only install: no place to store the compiled cache
+        parse_ascii_f64 = njit(_parse_ascii_f64)
+else:
+    parse_ascii_f64 = None
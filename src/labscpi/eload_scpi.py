@@ -3,15 +3,34 @@
 # Mirrors psu_scpi.PowerSupply structure and ergonomics.
 
 from __future__ import annotations
-from typing import Optional, Any, Dict, Type, Tuple
+from typing import Optional, Any, Dict, Type, Tuple, Iterable, Iterator
+from contextlib import contextmanager
+import functools
 import logging
 import re
+import threading
+import time
 
 try:
     import pyvisa  # type: ignore
 except Exception:
     pyvisa = None  # installed by the user
 
+try:
+    import numpy as np  # type: ignore
+except Exception:
+    np = None  # optional, only for query_binary_raw()
+
+try:
+    import ahocorasick  # type: ignore  # pyahocorasick, optional
+except Exception:
+    ahocorasick = None
+
+try:
+    from ._fastparse import parse_ascii_f64 as _fast_f64  # None without numba
+except Exception:
+    _fast_f64 = None
+
 # ---------------------------
 # Exceptions (mirror psu_scpi)
 # ---------------------------
@@ -24,59 +43,201 @@ class NotSupportedError(ELoadError): ...
 # ---------------------------
 # Utilities (mirror psu_scpi)
 # ---------------------------
+_NOT_CONNECTED = "Instrument not connected. Call connect() first."
+
 def require_connected(fn):
+    @functools.wraps(fn)
     def wrapper(self, *a, **k):
         if not self._connected:
-            raise NotConnectedError("Instrument not connected. Call connect() first.")
+            raise NotConnectedError(_NOT_CONNECTED)
         return fn(self, *a, **k)
-    wrapper.__name__ = fn.__name__
-    wrapper.__doc__ = fn.__doc__
     return wrapper
 
-_NUM_RE = re.compile(r'[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?')
+_NUM_RE = re.compile(r'\s*([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)')
+_num_match = _NUM_RE.match    # anchored: "1.23V", "1.23 A,0"
+_num_search = _NUM_RE.search  # prefixed: "CURR 1.23"
 def _parse_number(resp: str) -> float:
-    m = _NUM_RE.search(resp)
+    if _fast_f64 is not None and len(resp) < 32:
+        v = _fast_f64(resp.encode("ascii", "replace"))
+        if v == v:  # NaN means "not decided", use the paths below
+            return v
+    # Fast path: replies are usually "<float>\n" or "<float>,<status>\n"
+    try:
+        return float(resp.split(",", 1)[0])
+    except ValueError:
+        pass
+    m = _num_match(resp) or _num_search(resp)
     if not m:
         raise ValueError(f"no numeric value in response: {resp!r}")
-    return float(m.group(0))
+    return float(m.group(1))
+
+# Setpoint heads where only the last value matters (see _Session.coalesce_ms)
+_COALESCE_HEADS = frozenset({"SOUR:CURR", "SOUR:VOLT", "SOUR:POW", "INP"})
+_TRUE_TOKENS = frozenset(("1", "ON", "TRUE", "YES"))
+# Setpoint templates: %-formatting is cheaper than f-strings. %s sends the value
+# as the f-string did (shortest round-trip repr for floats), without rounding
+_CMD_CURR = "SOUR:CURR %s"
+_CMD_VOLT = "SOUR:VOLT %s"
+_CMD_POW = "SOUR:POW %s"
+# Read-only queries that never need a SYST:ERR? poll afterwards
+_QUIET_QUERIES = ("SYST:ERR?", "MEAS:", "FETC:", "READ:")
 
 # ---------------------------
 # Low-level session (mirror style)
 # ---------------------------
 class _Session:
-    def __init__(self, resource, *, check_errors=True, wait_opc=True, logger=None):
+    __slots__ = (
+        "resource", "check_errors", "wait_opc", "logger", "_dbg", "_last_cmd", "_hot",
+        "coalesce_ms", "_pending", "_pending_hot", "_timer", "_lock", "_flush_exc",
+    )
+
+    def __init__(self, resource, *, check_errors=True, wait_opc=True, logger=None,
+                 coalesce_ms: float = 0.0):
         self.resource = resource
         self.check_errors = check_errors
         self.wait_opc = wait_opc
         self.logger: Optional[logging.Logger] = logger
+        self._dbg = False
+        self.refresh_log_level()
         self._last_cmd: Optional[str] = None
+        self._hot = False
+        # Write coalescing: superseded setpoints within the window are dropped
+        self.coalesce_ms = float(coalesce_ms)
+        self._pending: Dict[str, str] = {}
+        # every pending setpoint was queued inside hot_path(): flush it unchecked
+        self._pending_hot = True
+        self._timer: Optional[threading.Timer] = None
+        # held around every resource access: the flush timer thread does I/O too
+        self._lock = threading.RLock()
+        self._flush_exc: Optional[Exception] = None
 
     @staticmethod
     def _parse_bool(s: str) -> bool:
-        return s.strip().upper() in {"1", "ON", "TRUE"}
+        return s.strip().upper() in _TRUE_TOKENS
+
+    def refresh_log_level(self) -> None:
+        """Re-sample the logger's DEBUG state (call after changing log levels)."""
+        self._dbg = self.logger is not None and self.logger.isEnabledFor(logging.DEBUG)
 
     def write(self, cmd: str) -> None:
-        self._last_cmd = cmd
-        if self.logger: self.logger.debug("→ %s", cmd)
-        self.resource.write(cmd)
-        if self.check_errors:
-            self._drain_error_queue()
-        if self.wait_opc:
+        if self.coalesce_ms > 0:
+            head = cmd.strip().lstrip(":").split(" ", 1)[0].upper()
+            if head in _COALESCE_HEADS and ";" not in cmd:
+                with self._lock:
+                    self._pending[head] = cmd
+                    self._pending_hot = self._pending_hot and self._hot
+                    if self._timer is None:
+                        self._timer = threading.Timer(self.coalesce_ms / 1000.0, self._flush_later)
+                        self._timer.daemon = True
+                        self._timer.start()
+                return
+            with self._lock:
+                self.flush()
+                self._write(cmd)
+            return
+        self._write(cmd)
+
+    def flush(self) -> None:
+        """Send coalesced setpoints now (no-op when nothing is pending)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            cmds = list(self._pending.values())
+            self._pending.clear()
+            # hot_path() state of the callers that queued them, not of this thread
+            hot, self._pending_hot = self._pending_hot, True
+            exc, self._flush_exc = self._flush_exc, None
+            try:
+                if cmds:
+                    self._write(";:".join(c.strip().lstrip(":") for c in cmds), hot)
+            except Exception:
+                if exc is None:
+                    raise
+                raise exc  # the earlier timer failure first; this one is its __context__
+        if exc is not None:
+            raise exc
+
+    def _flush_later(self) -> None:
+        # Timer thread: keep the first error for the next caller instead of losing it
+        try:
+            self.flush()
+        except Exception as e:
+            with self._lock:
+                if self._flush_exc is None:
+                    self._flush_exc = e
+
+    def _write(self, cmd: str, hot: Optional[bool] = None) -> None:
+        with self._lock:
+            self._last_cmd = cmd
+            if self._dbg: self.logger.debug("→ %s", cmd)
+            self.resource.write(cmd)
+            if self.wait_opc:
+                # straight to the resource: query() would drain the error queue again
+                self.resource.query("*OPC?")
+            if self.check_errors and not (self._hot if hot is None else hot):
+                self._drain_error_queue()
+
+    def write_many(self, cmds: Iterable[str]) -> None:
+        """Send several commands as one ';:'-joined message (one *OPC? at the end)."""
+        parts = [c.strip().lstrip(":") for c in cmds]
+        if parts:
+            self.write(";:".join(parts))
+
+    @contextmanager
+    def hot_path(self) -> Iterator[None]:
+        """Skip SYST:ERR? polling inside the block (see check_errors_now())."""
+        prev = self._hot
+        self._hot = True
+        try:
+            yield
+        finally:
+            self._hot = prev
+
+    @contextmanager
+    def wait_opc_scope(self) -> Iterator[None]:
+        """Skip *OPC? for each write inside the block; sync once on exit."""
+        prev = self.wait_opc
+        self.wait_opc = False
+        try:
+            yield
+        finally:
+            self.wait_opc = prev
+        if prev:
             self.query("*OPC?")
 
     def query(self, cmd: str) -> str:
-        if self.logger: self.logger.debug("? %s", cmd)
-        resp = self.resource.query(cmd)
-        if self.logger: self.logger.debug("← %s", resp.strip())
-        if self.check_errors and not cmd.strip().upper().startswith("SYST:ERR?"):
-            self._drain_error_queue()
-        return resp
+        with self._lock:
+            if self._pending or self._flush_exc is not None:
+                self.flush()
+            if self._dbg: self.logger.debug("? %s", cmd)
+            resp = self.resource.query(cmd)
+            if self._dbg: self.logger.debug("← %s", resp.strip())
+            if (self.check_errors and not self._hot
+                    and not cmd.strip().lstrip(":").upper().startswith(_QUIET_QUERIES)):
+                self._drain_error_queue()
+            return resp
+
+    def query_binary_values(self, cmd: str, **kw):
+        """resource.query_binary_values() after any pending setpoints, under the I/O lock."""
+        with self._lock:
+            if self._pending or self._flush_exc is not None:
+                self.flush()
+            return self.resource.query_binary_values(cmd, **kw)
+
+    def query_many(self, cmds: Iterable[str]) -> list[str]:
+        """Run several queries as one ';:'-joined message; one reply field per query."""
+        cmds = [c.strip().lstrip(":").rstrip("?") + "?" for c in cmds]
+        parts = self.query(";:".join(cmds)).strip().split(";")
+        if len(parts) != len(cmds):
+            raise SCPIError(f"Expected {len(cmds)} replies to compound query, got {len(parts)}")
+        return parts
 
     def _drain_error_queue(self) -> None:
         try:
             for _ in range(16):
                 s = self.resource.query("SYST:ERR?").strip()
-                if self.logger: self.logger.debug("ERR? %s", s)
+                if self._dbg: self.logger.debug("ERR? %s", s)
                 if not s: break
                 code_str = s.split(",")[0].strip()
                 try: code = int(code_str)
@@ -93,10 +254,15 @@ class _Session:
 # Adapter base and brand/model selectors
 # ---------------------------
 class BaseAdapter:
+    __slots__ = ("s", "idn", "_cur_ch", "_output_cmd", "_output_query")
     brand: str = "Generic"
     def __init__(self, session: _Session, idn: str):
         self.s = session
         self.idn = idn
+        self._cur_ch: Optional[int] = None  # last channel selected via _sel()
+        # input on/off command family, resolved once in startup()
+        self._output_cmd = "INP"
+        self._output_query = "INP?"
 
     @staticmethod
     def matches(idn: str) -> bool: return True  # fallback
@@ -104,10 +270,11 @@ class BaseAdapter:
     # Lifecycle hooks (present in psu_scpi adapters)
     def startup(self) -> None:
         """Optional startup per model (panel lock, clear, mode reset)."""
-        pass
+        self._cur_ch = None
+        self._probe_output_cmd()
     def shutdown(self) -> None:
         """Optional shutdown per model (unlock panel, local control)."""
-        pass
+        self._cur_ch = None
     def configure(self, **kwargs) -> None:
         """Optional per-model configuration before first use."""
         pass
@@ -117,62 +284,165 @@ class BaseAdapter:
     @staticmethod
     def _bstr(on: bool) -> str: return "ON" if on else "OFF"
     @staticmethod
-    def _parse_bool(s: str) -> bool: return s.strip().upper() in {"1","ON","TRUE"}
+    def _parse_bool(s: str) -> bool: return s.strip().upper() in _TRUE_TOKENS
+
+    def _probe_output_cmd(self) -> None:
+        # Many loads use INP; some use LOAD:STAT. Probe the query once.
+        try:
+            self.s.query("INP?")
+            self._output_cmd, self._output_query = "INP", "INP?"
+        except Exception:
+            self._output_cmd, self._output_query = "LOAD:STAT", "LOAD:STAT?"
 
     # channel select: many e-loads are single-channel; default INST:NSEL
     def _sel(self, ch: int) -> None:
+        if ch == self._cur_ch: return
         if ch < 1: raise ChannelError("Channels are 1-based and must be >= 1")
         try:
             self.s.write(f"INST:NSEL {ch}")
         except Exception:
             self.s.write(f"INST:SEL CH{ch}")
+        self._cur_ch = ch
 
     # ---- Core API expected by facade ----
     # Modes are implied by the setter you use (CC/CV/CP).
     def set_current(self, ch: int, amps: float) -> None:
-        self._sel(ch); self.s.write(f"SOUR:CURR {amps}")
+        self._sel(ch); self.s.write(_CMD_CURR % amps)
+
+    def set_current_raw(self, ch: int, value: str) -> None:
+        """Send a preformatted current value (e.g. "0.125") as-is."""
+        self._sel(ch); self.s.write("SOUR:CURR " + value)
 
     def set_voltage(self, ch: int, volts: float) -> None:
-        self._sel(ch); self.s.write(f"SOUR:VOLT {volts}")
+        self._sel(ch); self.s.write(_CMD_VOLT % volts)
 
     def set_power(self, ch: int, watts: float) -> None:
-        self._sel(ch); self.s.write(f"SOUR:POW {watts}")
+        self._sel(ch); self.s.write(_CMD_POW % watts)
 
     def set_output(self, ch: int, on: bool) -> None:
         self._sel(ch)
-        # Many loads use INP; some use LOAD:STAT
-        try:
-            self.s.write(f"INP {self._bstr(on)}")
-        except Exception:
-            self.s.write(f"LOAD:STAT {self._bstr(on)}")
+        self.s.write(f"{self._output_cmd} {self._bstr(on)}")
         # optional verify
         try:
-            st = self.s.query("INP?"); ok = self._parse_bool(st)
+            st = self.s.query(self._output_query); ok = self._parse_bool(st)
             if ok != on: raise SCPIError("Input state mismatch")
         except Exception:
             pass
 
     def get_current(self, ch: int) -> float:
-        self._sel(ch); return _parse_number(self.s.query("MEAS:CURR?"))
+        self._sel(ch)
+        with self.s.hot_path(): return _parse_number(self.s.query("MEAS:CURR?"))
 
     def get_voltage(self, ch: int) -> float:
-        self._sel(ch); return _parse_number(self.s.query("MEAS:VOLT?"))
+        self._sel(ch)
+        with self.s.hot_path(): return _parse_number(self.s.query("MEAS:VOLT?"))
 
     def get_power(self, ch: int) -> float:
-        self._sel(ch); return _parse_number(self.s.query("MEAS:POW?"))
+        self._sel(ch)
+        with self.s.hot_path(): return _parse_number(self.s.query("MEAS:POW?"))
+
+    def set_cv_cc_cp(self, ch: int, volts: Optional[float] = None,
+                     amps: Optional[float] = None, watts: Optional[float] = None) -> None:
+        """Program any of the V/I/P setpoints in a single message."""
+        cmds = []
+        if volts is not None: cmds.append(_CMD_VOLT % volts)
+        if amps is not None: cmds.append(_CMD_CURR % amps)
+        if watts is not None: cmds.append(_CMD_POW % watts)
+        self._sel(ch); self.s.write_many(cmds)
+
+    def measure_vip(self, ch: int) -> Tuple[float, float, float]:
+        """Voltage, current and power in one compound query when supported."""
+        self._sel(ch)
+        try:
+            with self.s.hot_path():
+                parts = self.s.query_many(("MEAS:VOLT?", "MEAS:CURR?", "MEAS:POW?"))
+            v, i, p = (_parse_number(x) for x in parts)
+            return v, i, p
+        except Exception:
+            # Compound form rejected: drop its error, then one query per quantity
+            try:
+                self.s._drain_error_queue()
+            except SCPIError:
+                pass
+            return self.get_voltage(ch), self.get_current(ch), self.get_power(ch)
+
+    def stream_vip(self, ch: int, n: int, rate_hz: float):
+        """
+        n samples of (V, I, P) at rate_hz. Uses the load's array acquisition
+        with binary transfer when available, else a paced measure_vip() loop.
+        Returns an (n, 3) numpy array if numpy is installed, else a list of tuples.
+        """
+        n = int(n)
+        if n < 1: raise ValueError("n must be >= 1")
+        if rate_hz <= 0: raise ValueError("rate_hz must be > 0")
+        self._sel(ch)
+        try:
+            return self._stream_vip_array(n, float(rate_hz))
+        except Exception:
+            try:
+                self.s._drain_error_queue()
+            except SCPIError:
+                pass
+        period = 1.0 / rate_hz
+        rows = []
+        t_next = time.perf_counter()
+        for k in range(n):
+            rows.append(self.measure_vip(ch))
+            if k + 1 < n:
+                t_next += period
+                dt = t_next - time.perf_counter()
+                if dt > 0: time.sleep(dt)
+        return np.asarray(rows, dtype=float) if np is not None else rows
+
+    def _stream_vip_array(self, n: int, rate_hz: float):
+        # One acquisition (MEAS:ARR), then V/I/P fetched as REAL,32 blocks
+        s = self.s
+        s.write_many(("FORM:DATA REAL,32", "FORM:BORD SWAP",
+                      f"SENS:SWE:POIN {n}", f"SENS:SWE:TINT {1.0 / rate_hz:.6g}"))
+        container = np.ndarray if np is not None else list
+        try:
+            cols = [
+                s.query_binary_values(q, datatype="f", is_big_endian=False,
+                                      container=container)
+                for q in ("MEAS:ARR:VOLT?", "FETC:ARR:CURR?", "FETC:ARR:POW?")
+            ]
+        finally:
+            s.write("FORM:DATA ASCII")
+        if any(len(c) != n for c in cols):
+            raise SCPIError(f"Array fetch returned {[len(c) for c in cols]} points, expected {n}")
+        if np is not None:
+            return np.column_stack(cols).astype(float)
+        return list(zip(*cols))
 
 class BrandAdapter(BaseAdapter):
+    __slots__ = ()
     _models: list[type["BrandAdapter"]] = []
+    # every subclass, kept sorted most-specific first (deepest MRO, then name)
+    _registry: list[type["BrandAdapter"]] = []
     brand: str | None = None
     vendor_aliases: tuple[str, ...] = ()
+    _aliases_upper: tuple[str, ...] = ()
+    _model_patterns: tuple[re.Pattern, ...] = ()
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._aliases_upper = tuple(a.upper() for a in (cls.brand, *cls.vendor_aliases) if a)
+        cls._model_patterns = tuple(getattr(cls, "MODEL_PATTERNS", None) or ())
+        reg = BrandAdapter._registry
+        reg.append(cls)
+        reg.sort(key=lambda c: (-len(c.__mro__), c.__name__))
+        pick_adapter.cache_clear()
+        global _ALIAS_AUTOMATON
+        _ALIAS_AUTOMATON = None
     @classmethod
-    def register_model(cls, model_cls): cls._models.append(model_cls); return model_cls
+    def register_model(cls, model_cls):
+        cls._models.append(model_cls)
+        pick_adapter.cache_clear()  # a new model can change the answer for a cached IDN
+        return model_cls
     @classmethod
     def select(cls, idn: str) -> type["BrandAdapter"]:
         u = idn.upper()
         for m in cls._models:
-            pats = getattr(m, "MODEL_PATTERNS", ())
-            if pats and any(rx.search(u) for rx in pats): return m
+            if any(rx.search(u) for rx in m._model_patterns): return m
         for m in cls._models:
             if getattr(m, "matches", lambda _idn: False)(idn): return m
         return cls
@@ -180,24 +450,50 @@ class BrandAdapter(BaseAdapter):
     def matches(cls, idn: str) -> bool:
         if cls is BrandAdapter: return False
         u = idn.upper()
-        aliases = [cls.brand or ""] + list(cls.vendor_aliases)
-        return any(a.upper() in u for a in aliases if a)
-
+        return any(a in u for a in cls._aliases_upper)
+
+# Aho-Corasick automaton over the aliases of every adapter that uses the
+# default alias-based BrandAdapter.matches(); rebuilt after new registrations.
+_ALIAS_AUTOMATON: Any = None
+
+def _uses_alias_matches(cls: type) -> bool:
+    return getattr(cls.matches, "__func__", None) is BrandAdapter.matches.__func__
+
+def _alias_hits(u: str) -> Optional[set]:
+    """Adapters whose aliases occur in the upper-cased IDN (one pass), or None."""
+    global _ALIAS_AUTOMATON
+    if ahocorasick is None:
+        return None
+    if _ALIAS_AUTOMATON is None:
+        owners: Dict[str, list] = {}
+        for c in BrandAdapter._registry:
+            if _uses_alias_matches(c):
+                for a in c._aliases_upper:
+                    owners.setdefault(a, []).append(c)
+        A = ahocorasick.Automaton()
+        for a, cs in owners.items():
+            A.add_word(a, tuple(cs))
+        if owners:
+            A.make_automaton()
+        _ALIAS_AUTOMATON = A
+    if len(_ALIAS_AUTOMATON) == 0:
+        return set()
+    hits: set = set()
+    for _end, cs in _ALIAS_AUTOMATON.iter(u):
+        hits.update(cs)
+    return hits
+
+@functools.lru_cache(maxsize=8)
 def pick_adapter(idn: str) -> type[BaseAdapter]:
-    candidates: list[type[BrandAdapter]] = []
-    for obj in globals().values():
-        if isinstance(obj, type):
-            try:
-                if issubclass(obj, BrandAdapter) and obj is not BrandAdapter:
-                    candidates.append(obj)  # type: ignore
-            except Exception:
-                pass
-    candidates.sort(key=lambda c: (-len(c.mro()), c.__name__))
-    for Cls in candidates:
+    hits = _alias_hits(idn.upper())
+    for Cls in BrandAdapter._registry:
         try:
-            if hasattr(Cls, "matches") and Cls.matches(idn):
-                chosen = getattr(Cls, "select", lambda _idn: Cls)(idn)
-                return chosen  # type: ignore
+            if hits is not None and _uses_alias_matches(Cls):
+                ok = Cls in hits  # decided by the automaton
+            else:
+                ok = Cls.matches(idn)  # custom matches(): ask it directly
+            if ok:
+                return Cls.select(idn)
         except Exception:
             continue
     return BaseAdapter
@@ -206,6 +502,7 @@ def pick_adapter(idn: str) -> type[BaseAdapter]:
 # Example brand: EA Elektro-Automatik EL series
 # ---------------------------
 class EAAdapter(BrandAdapter):
+    __slots__ = ()
     brand = "EA Elektro-Automatik"
     vendor_aliases = ("ELEKTRO-AUTOMATIK", "EA-EL", "EA ")
     @staticmethod
@@ -217,6 +514,7 @@ class EAAdapter(BrandAdapter):
 
     def startup(self) -> None:
             """Run after adapter is selected and before first use."""
+            super().startup()
 
             try:
                 # Some PSUs echo setpoint via SOUR:VOLT?; if not, fall back to MEAS
@@ -230,6 +528,7 @@ class EAAdapter(BrandAdapter):
 
     def shutdown(self) -> None:
         """Run before IO is torn down."""
+        super().shutdown()
 
         try:
             # Some PSUs echo setpoint via SOUR:VOLT?; if not, fall back to MEAS
@@ -245,15 +544,21 @@ class EAAdapter(BrandAdapter):
 
 @EAAdapter.register_model
 class EA_EL9000Adapter(EAAdapter):
+    __slots__ = ()
     MODEL_PATTERNS = (re.compile(r"EL9\d\d\d", re.I),)
     def _sel(self, ch: int) -> None:
+        if ch == self._cur_ch: return
         if ch != 1: raise ChannelError("Single-channel electronic load")
+        self._cur_ch = ch
 
     def startup(self) -> None:
         self.s.wait_opc = False
         super().startup()
         
 
+def _not_initialized(*_a, **_k):
+    raise NotConnectedError("Not initialized; call initialize() first.")
+
 # ---------------------------
 # Public façade (mirrors psu_scpi.PowerSupply)
 # ---------------------------
@@ -272,10 +577,23 @@ class ElectronicLoad:
     wait_opc : bool
         After each write, block on *OPC? to ensure completion.
     logger : Optional[logging.Logger]
-        If provided, SCPI trace is emitted at DEBUG level.
+        If provided, SCPI trace is emitted at DEBUG level. The level is
+        sampled at connect()/initialize(); see refresh_logging().
     rm : Optional[pyvisa.ResourceManager]
         Pass an existing ResourceManager if desired.
+    coalesce_ms : float
+        If > 0, V/I/P/input setpoints are held for this long and only the
+        last value per command is sent. Any query or close() flushes first.
     """
+    __slots__ = (
+        "address", "timeout_ms", "check_errors", "wait_opc", "logger", "rm",
+        "_defer_init_io", "coalesce_ms", "_resource", "_session", "_adapter",
+        "_connected", "identity",
+        # adapter methods bound by initialize() (see _bind_adapter)
+        "_set_current", "_set_voltage", "_set_power", "_set_output",
+        "_get_voltage", "_get_current", "_get_power", "_measure_vip",
+    )
+
     def __init__(
         self,
         visa_address: str,
@@ -286,6 +604,7 @@ class ElectronicLoad:
         logger: Optional[logging.Logger] = None,
         rm: Optional["pyvisa.ResourceManager"] = None,
         defer_init_io: bool = True,
+        coalesce_ms: float = 0.0,
     ) -> None:
         self.address = visa_address
         self.timeout_ms = int(timeout_ms)
@@ -294,12 +613,14 @@ class ElectronicLoad:
         self.logger = logger or logging.getLogger(__name__ + ".eload")
         self.rm = rm
         self._defer_init_io = defer_init_io
+        self.coalesce_ms = float(coalesce_ms)
 
         self._resource = None
         self._session: Optional[_Session] = None
         self._adapter: Optional[BaseAdapter] = None
         self._connected = False
         self.identity: Optional[str] = None
+        self._bind_adapter(None)
 
     # ----- lifecycle -----
     def connect(self) -> None:
@@ -315,12 +636,18 @@ class ElectronicLoad:
             self._resource.read_termination = "\n"
         except Exception:
             pass
+        try:
+            # default 4 KiB splits bulk reads into many low-level calls
+            self._resource.chunk_size = 1024 * 1024
+        except Exception:
+            pass
         self._resource.timeout = self.timeout_ms
         self._session = _Session(
             resource=self._resource,
             check_errors=self.check_errors,
             wait_opc=self.wait_opc,
             logger=self.logger,
+            coalesce_ms=self.coalesce_ms,
         )
         self._connected = True
         if self._defer_init_io:
@@ -330,6 +657,7 @@ class ElectronicLoad:
     def initialize(self) -> None:
         if not self._connected:
             raise NotConnectedError("Not connected; call connect() first.")
+        self._session.refresh_log_level()
         if self._adapter is not None and self.identity is not None:
             return
         self.identity = self._session.query("*IDN?").strip()
@@ -337,11 +665,23 @@ class ElectronicLoad:
         self._adapter = Adapter(self._session, self.identity or "")
         # pass runtime options if you want toggles like autolock
         self._adapter.startup()
+        self._bind_adapter(self._adapter)
+
+    def _bind_adapter(self, a: Optional[BaseAdapter]) -> None:
+        # Hot-path methods call these directly instead of self._adapter.<name>
+        for name in ("set_current", "set_voltage", "set_power", "set_output",
+                     "get_voltage", "get_current", "get_power", "measure_vip"):
+            setattr(self, "_" + name, _not_initialized if a is None else getattr(a, name))
 
     def close(self) -> None:
         if not self._connected:
             return
         try:
+            if self._session is not None:
+                try:
+                    self._session.flush()
+                except Exception:
+                    pass
             if self._adapter is not None:
                 try:
                     self._adapter.shutdown()
@@ -353,6 +693,7 @@ class ElectronicLoad:
             self._resource = None
             self._session = None
             self._adapter = None
+            self._bind_adapter(None)
             self._connected = False
 
     @property
@@ -362,49 +703,103 @@ class ElectronicLoad:
     @require_connected
     def set_timeout(self, timeout_ms: int) -> None:
         self.timeout_ms = int(timeout_ms)
-        assert self._resource is not None
-        self._resource.timeout = self.timeout_ms
+        assert self._resource is not None and self._session is not None
+        with self._session._lock:  # not in the middle of a timer flush
+            self._resource.timeout = self.timeout_ms
 
-    # ----- core API (mirrors user request) -----
     @require_connected
+    def set_chunk_size(self, n: int) -> None:
+        assert self._resource is not None and self._session is not None
+        with self._session._lock:
+            self._resource.chunk_size = int(n)
+
+    # ----- core API (mirrors user request) -----
+    # Hot setters/getters check the connection inline instead of via the decorator.
     def set_current(self, channel: int, amps: float) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._set_current(channel, float(amps))
+
+    @require_connected
+    def set_current_raw(self, channel: int, value: str) -> None:
         assert self._adapter is not None
-        self._adapter.set_current(channel, float(amps))
+        self._adapter.set_current_raw(channel, str(value))
 
     @require_connected
     def set_voltage(self, channel: int, volts: float) -> None:
-        assert self._adapter is not None
-        self._adapter.set_voltage(channel, float(volts))
+        self._set_voltage(channel, float(volts))
 
     @require_connected
     def set_power(self, channel: int, watts: float) -> None:
-        assert self._adapter is not None
-        self._adapter.set_power(channel, float(watts))
+        self._set_power(channel, float(watts))
 
     @require_connected
     def set_output(self, channel: int, on: bool) -> None:
-        assert self._adapter is not None
-        self._adapter.set_output(channel, bool(on))
+        self._set_output(channel, bool(on))
 
-    @require_connected
     def get_voltage(self, channel: int) -> float:
-        assert self._adapter is not None
-        return self._adapter.get_voltage(channel)
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        return self._get_voltage(channel)
 
-    @require_connected
     def get_current(self, channel: int) -> float:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        return self._get_current(channel)
+
+    def get_power(self, channel: int) -> float:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        return self._get_power(channel)
+
+    @require_connected
+    def measure_vip(self, channel: int) -> Tuple[float, float, float]:
+        return self._measure_vip(channel)
+
+    @require_connected
+    def stream_vip(self, channel: int, n: int, rate_hz: float):
+        """n x (V, I, P) samples at rate_hz (numpy (n, 3) array when numpy is installed)."""
         assert self._adapter is not None
-        return self._adapter.get_current(channel)
+        return self._adapter.stream_vip(channel, n, rate_hz)
 
     @require_connected
-    def get_power(self, channel: int) -> float:
+    def set_cv_cc_cp(self, channel: int, volts: Optional[float] = None,
+                     amps: Optional[float] = None, watts: Optional[float] = None) -> None:
         assert self._adapter is not None
-        return self._adapter.get_power(channel)
+        self._adapter.set_cv_cc_cp(
+            channel,
+            None if volts is None else float(volts),
+            None if amps is None else float(amps),
+            None if watts is None else float(watts),
+        )
+
+    @require_connected
+    def wait_opc_scope(self):
+        """Context manager: batch writes without per-write *OPC?, sync once on exit."""
+        assert self._session is not None
+        return self._session.wait_opc_scope()
+
+    @require_connected
+    def refresh_logging(self) -> None:
+        """Pick up logger level changes made after connect() (SCPI trace on/off)."""
+        assert self._session is not None
+        self._session.refresh_log_level()
+
+    @require_connected
+    def check_errors_now(self) -> None:
+        """Poll SYST:ERR? now; raises SCPIError if the instrument reports one."""
+        assert self._session is not None
+        self._session.flush()
+        self._session._drain_error_queue()
+
+    @require_connected
+    def flush(self) -> None:
+        """Send any coalesced setpoints immediately."""
+        assert self._session is not None
+        self._session.flush()
 
     # ----- raw passthrough (optional) -----
     @require_connected
     def write_raw(self, cmd: str) -> None:
         assert self._session is not None
+        if self._adapter is not None:
+            self._adapter._cur_ch = None  # raw command may change the selection
         self._session.write(cmd)
 
     @require_connected
@@ -412,6 +807,14 @@ class ElectronicLoad:
         assert self._session is not None
         return self._session.query(cmd)
 
+    @require_connected
+    def query_binary_raw(self, cmd: str, dtype: str = "f"):
+        """IEEE 488.2 binary block query (numpy array if installed, else list)."""
+        assert self._session is not None
+        return self._session.query_binary_values(
+            cmd, datatype=dtype, container=np.ndarray if np is not None else list
+        )
+
 
     @require_connected
     def selftest_interface(self, channels: tuple[int, ...] = (1,)) -> dict:
@@ -446,9 +849,15 @@ class ElectronicLoad:
         _call("set_voltage", self.set_voltage, ch, 2.0)
         _call("set_power", self.set_power, ch, 3.0)
         _call("set_output_on", self.set_output, ch, True)
-        _call("get_voltage", self.get_voltage, ch)
-        _call("get_current", self.get_current, ch)
-        _call("get_power", self.get_power, ch)
+        # V/I/P readback in one compound query; per-call detail only on failure
+        try:
+            self.measure_vip(ch)
+            for name in ("get_voltage", "get_current", "get_power"):
+                out["calls"][name] = {"ok": True}
+        except Exception:
+            _call("get_voltage", self.get_voltage, ch)
+            _call("get_current", self.get_current, ch)
+            _call("get_power", self.get_power, ch)
         _call("set_output_off", self.set_output, ch, False)
 
         return out
@@ -470,36 +879,55 @@ class MockLoadResource:
             "meas": {"V": 0.0, "I": 0.0, "P": 0.0},
             "inp": False,
         }
+        # header -> handler(arg); header is the text before the first space
+        self._writers = {
+            "INST:NSEL": self._w_nsel,
+            "INST:SEL": self._w_sel,
+            "SOUR:CURR": self._w_curr,
+            "SOUR:VOLT": self._w_volt,
+            "SOUR:POW": self._w_pow,
+            "INP": self._w_inp,
+            "LOAD:STAT": self._w_inp,
+        }
+        # exact query -> handler()
+        self._queries = {
+            "*IDN?": lambda: self.idn,
+            "*OPC?": lambda: "1",
+            "SYST:ERR?": lambda: '0,"No error"',
+            "MEAS:VOLT?": lambda: f"{self.state['meas']['V']}",
+            "MEAS:CURR?": lambda: f"{self.state['meas']['I']}",
+            "MEAS:POW?": lambda: f"{self.state['meas']['P']}",
+            "INP?": self._q_inp,
+            "LOAD:STAT?": self._q_inp,
+        }
+    def close(self):
+        pass
     def write(self, cmd: str):
-        u = cmd.strip().upper()
-        if u.startswith("INST:NSEL"):
-            self.state["ch"] = int(cmd.split()[-1])
-        elif u.startswith("INST:SEL"):
-            self.state["ch"] = int(cmd.split("CH")[-1])
-        elif u.startswith("SOUR:CURR "):
-            self.state["set"]["I"] = float(cmd.split()[-1]); self.state["mode"] = "CC"
-        elif u.startswith("SOUR:VOLT "):
-            self.state["set"]["V"] = float(cmd.split()[-1]); self.state["mode"] = "CV"
-        elif u.startswith("SOUR:POW "):
-            self.state["set"]["P"] = float(cmd.split()[-1]); self.state["mode"] = "CP"
-        elif u.startswith("INP "):
-            self.state["inp"] = u.endswith("ON")
-        elif u.startswith("LOAD:STAT "):
-            self.state["inp"] = u.endswith("ON")
+        # compound messages from write_many(): "SOUR:VOLT 1;:SOUR:CURR 2"
+        for part in cmd.split(";"):
+            self._write_one(part.strip().lstrip(":"))
+    def _write_one(self, cmd: str):
+        head, _, arg = cmd.partition(" ")
+        fn = self._writers.get(head.upper())
+        if fn is not None:
+            fn(arg.strip())
         # naive meas echo
         self.state["meas"]["V"] = self.state["set"]["V"]
         self.state["meas"]["I"] = self.state["set"]["I"]
         self.state["meas"]["P"] = self.state["set"]["P"]
+    def _w_nsel(self, arg: str): self.state["ch"] = int(arg)
+    def _w_sel(self, arg: str): self.state["ch"] = int(arg.upper().split("CH")[-1])
+    def _w_curr(self, arg: str): self.state["set"]["I"] = float(arg); self.state["mode"] = "CC"
+    def _w_volt(self, arg: str): self.state["set"]["V"] = float(arg); self.state["mode"] = "CV"
+    def _w_pow(self, arg: str): self.state["set"]["P"] = float(arg); self.state["mode"] = "CP"
+    def _w_inp(self, arg: str): self.state["inp"] = arg.upper().endswith("ON")
+    def _q_inp(self) -> str: return "ON" if self.state["inp"] else "OFF"
     def query(self, cmd: str) -> str:
-        u = cmd.strip().upper()
-        if u == "*IDN?": return self.idn + "\n"
-        if u == "*OPC?": return "1\n"
-        if u == "SYST:ERR?": return "0,\"No error\"\n"
-        if u == "MEAS:VOLT?": return f"{self.state['meas']['V']}\n"
-        if u == "MEAS:CURR?": return f"{self.state['meas']['I']}\n"
-        if u == "MEAS:POW?":  return f"{self.state['meas']['P']}\n"
-        if u in {"INP?", "LOAD:STAT?"}: return ("ON\n" if self.state["inp"] else "OFF\n")
-        return "\n"
+        replies = []
+        for part in cmd.split(";"):
+            fn = self._queries.get(part.strip().lstrip(":").upper())
+            replies.append(fn() if fn is not None else "")
+        return ";".join(replies) + "\n"
 
 class MockResourceManager:
     def __init__(self, resource: Optional[MockLoadResource] = None):
@@ -26,13 +26,17 @@ API sketch:
     TBD: the measurement that needs two token are ok, channels enum, math correct implementation.
 """
 from __future__ import annotations
-import dataclasses, logging, re
+import asyncio, dataclasses, functools, logging, random, re, socket, struct, threading, time, zlib
 from typing import Optional, Tuple, Dict, Type, Any, Iterable
 from enum import Enum
-from pyvisa.constants import BufferOperation
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from pyvisa.constants import BufferOperation, EventMechanism, EventType
 from math import isfinite, isclose
 from math import isfinite, log10, floor
 from decimal import Decimal
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
 
 try:
     import pyvisa  # type: ignore
@@ -110,9 +114,55 @@ class RangeError(ScopeError): ...
 # ---------------------------
 # Utilities
 # ---------------------------
+# clean error-queue reply: "0,..." / "+0,..." (checked before any split/int)
+_no_err = re.compile(r'\s*\+?0\s*,').match
+# setters that need no *OPC? barrier (no acquisition/state settling)
+_LIGHT_CMDS = ("DISP", "MEAS:ITEM ", "TRIG:EDGE:SOUR", "TRIG:EDGE:SLOP")
+
+def _is_light(cmd: str) -> bool:
+    return cmd.lstrip(":").upper().startswith(_LIGHT_CMDS)
+
+# error texts meaning "this command form is not understood"
+_unsupported_search = re.compile(
+    r"-113|-102|-420|UNDEFINED HEADER|HEADER NOT RECOGNIZED|SYNTAX ERROR|COMMAND ERROR|QUERY UNTERMINATED",
+    re.IGNORECASE).search
+
+# *ESR? QYE|DDE|EXE|CME: set whenever an error entered the queue
+_ESR_ERROR_BITS = 0x3C
+
+# 1-2-5 sequence for the autoscale V/div steps
+_STEPS_125 = (1.0, 2.0, 5.0, 10.0)
+
+# read size used by clear_io() when draining stale device output
+_DRAIN_CHUNK = 65536
+
+_FLOAT_RE = re.compile(r'[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?')
+
+_NAN = float("nan")
+
+def _fast_float(s: str) -> float:
+    """
+    Measurement reply -> float. A bare number takes the float() path, anything
+    else (headers, units) goes through _FLOAT_RE. 9.9E37, the SCPI "no value"
+    marker, becomes NaN.
+    """
+    try:
+        v = float(s)
+    except ValueError:
+        m = _FLOAT_RE.search(s)
+        if not m: raise SCPIError(f"no numeric value in {s!r}")
+        v = float(m.group(0))
+    return _NAN if abs(v) > 9.9e36 else v
+
+def _backoff(attempt: int, base: float, cap: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0.0, min(cap, base * (1 << min(attempt, 30))))
+
 def with_retries(max_retries: int = 1, delay: float = 0.0):
-    import time
+    if max_retries <= 0:
+        return lambda fn: fn  # no retries: no wrapper frame
     def deco(fn):
+        @functools.wraps(fn)
         def wrapper(self, *a, **k):
             last = None
             for attempt in range(max_retries + 1):
@@ -132,13 +182,25 @@ def with_retries(max_retries: int = 1, delay: float = 0.0):
         return wrapper
     return deco
 
+_NOT_CONNECTED = "Instrument not connected. Call connect() first."
+
+def _noop(*a, **k) -> None:
+    pass
+
+def _serialized(fn):
+    """Run a _Session method under the session's I/O lock (PyVISA sessions are not thread-safe)."""
+    @functools.wraps(fn)
+    def wrapper(self, *a, **k):
+        with self._io_lock:
+            return fn(self, *a, **k)
+    return wrapper
+
 def require_connected(fn):
+    @functools.wraps(fn)
     def wrapper(self, *a, **k):
         if not self._connected:
-            raise NotConnectedError("Instrument not connected. Call connect() first.")
+            raise NotConnectedError(_NOT_CONNECTED)
         return fn(self, *a, **k)
-    wrapper.__name__ = fn.__name__
-    wrapper.__doc__ = fn.__doc__
     return wrapper
 
 # ---------------------------
@@ -151,38 +213,158 @@ class _Session:
     wait_opc: bool = True
     logger: Optional[logging.Logger] = None
     _last_cmd: Optional[str] = None
-
-    def __init__(self, resource, check_errors=True, wait_opc=True, logger=None):
+    _defer_buf: Optional[list] = None
+    strict_errors: bool = True
+    err_check_every: int = 32
+    _err_clean: bool = True
+    _unchecked: int = 0
+    _io_lock: Any = None
+    _alock: Any = None
+    _has_read_termination: bool = False
+    _has_timeout: bool = False
+    _has_chunk_size: bool = False
+    _executor: Any = None
+    _rx_buf: Optional[bytearray] = None
+    batch_max_len: int = 1024
+    _has_read_into: bool = False
+    esr_gate: bool = True
+    _log: Any = _noop
+
+    def __init__(self, resource, check_errors=True, wait_opc=True, logger=None,
+                 strict_errors=True, err_check_every=32, esr_gate=True):
         self.resource = resource
         self.check_errors = check_errors
         self.wait_opc = wait_opc
-        self.logger = logger
+        self.set_logger(logger)
         self._last_cmd = None
+        self._defer_buf = None  # list while inside defer()
+        # strict_errors=False: poll SYST:ERR? only once the queue is suspected
+        # dirty (a failed I/O call) or every err_check_every calls
+        self.strict_errors = strict_errors
+        self.err_check_every = int(err_check_every)
+        self._err_clean = True
+        self._unchecked = 0
+        self._io_lock = threading.RLock()  # serializes threads sharing this session
+        self._alock = None                 # asyncio.Lock, created on first a*() call
+        # transport capabilities, probed once instead of per block read
+        self._has_read_termination = hasattr(resource, "read_termination")
+        self._has_timeout = hasattr(resource, "timeout")
+        self._has_chunk_size = hasattr(resource, "chunk_size")
+        self._has_read_into = hasattr(resource, "read_into")
+        self._rx_buf = None                # query_ieee_block_into() buffer, lazy
+        self.batch_max_len = 1024          # split write_batch() messages beyond this (0: never)
+        self._executor = None              # single I/O worker, created by submit()
+        self.esr_gate = esr_gate           # check *ESR? before reading SYST:ERR?
+
+    def set_logger(self, logger: Optional[logging.Logger]) -> None:
+        """Bind the SCPI trace logger; DEBUG state is sampled here (see refresh_log_level)."""
+        self.logger = logger
+        self.refresh_log_level()
 
-    def write(self, cmd: str) -> None:
+    def refresh_log_level(self) -> None:
+        """Re-sample the logger's DEBUG state (call after changing log levels)."""
+        lg = self.logger
+        self._log = lg.debug if lg is not None and lg.isEnabledFor(logging.DEBUG) else _noop
+
+    def _send(self, cmd: str) -> None:
         self._last_cmd = cmd
-        if self.logger: self.logger.debug("→ %s", cmd)
+        self._log("→ %s", cmd)
         try:
             self.resource.write(cmd)
         except Exception as e:
+            self._err_clean = False
             msg = self._quick_scpi_recover()
             if msg and self._is_unsupported_msg(msg):
                 raise NotSupportedError(f"Unsupported command after '{cmd}': {msg}") from e
             if msg:
                 raise SCPIError(f"Instrument error after '{cmd}': {msg}") from e
             raise
-        
-        if self.check_errors: self._drain_error_queue()
-        if self.wait_opc:
+
+    @_serialized
+    def write(self, cmd: str, needs_opc: bool | None = None) -> None:
+        """
+        Send one command. needs_opc=None classifies it: "light" display,
+        measurement-slot and trigger-routing setters (_LIGHT_CMDS) skip the
+        *OPC? barrier, since the next query synchronizes anyway.
+        """
+        if self._defer_buf is not None:
+            self._defer_buf.append(cmd)
+            return
+        self._send(cmd)
+        self._maybe_drain()
+        if self.wait_opc and (needs_opc if needs_opc is not None else not _is_light(cmd)):
             self.query("*OPC?")
-            if self.check_errors: self._drain_error_queue()
 
+    @_serialized
+    def write_batch(self, cmds: Iterable[str]) -> None:
+        """
+        Send commands as ';'-joined messages of at most batch_max_len
+        characters each: a single *OPC? and error drain for all of them.
+        """
+        cmds = [c for c in cmds if c]
+        if not cmds:
+            return
+        if self._defer_buf is not None:
+            self._defer_buf.extend(cmds)
+            return
+        if len(cmds) == 1:
+            self.write(cmds[0])
+            return
+        # root every header so ';' does not resolve it relative to the previous one
+        rooted = [c if c.startswith((":", "*")) else ":" + c for c in cmds]
+        limit = self.batch_max_len
+        msg: list[str] = []
+        size = 0
+        for c in rooted:
+            if msg and limit and size + 1 + len(c) > limit:
+                self._send(";".join(msg))
+                msg, size = [], 0
+            size += len(c) + (1 if msg else 0)
+            msg.append(c)
+        self._send(";".join(msg))
+        # one barrier at the end covers every message
+        if self.wait_opc and not all(map(_is_light, cmds)):
+            self.query("*OPC?")
+        else:
+            self._maybe_drain()
+
+    @_serialized
+    def query_batch(self, queries: Iterable[str], per_msg: int = 8) -> list[str]:
+        """
+        Send queries as ';'-joined messages of at most per_msg queries each
+        and return the replies in order: one round-trip per message.
+        Raises SCPIError if a message does not yield one reply per query.
+        """
+        qs = [q if q.startswith((":", "*")) else ":" + q for q in queries if q]
+        out: list[str] = []
+        for i in range(0, len(qs), max(1, per_msg)):
+            part = qs[i:i + per_msg]
+            msg = ";".join(part)
+            resp = self.query(msg)
+            vals = resp.strip().split(";")
+            if len(vals) != len(part):
+                raise SCPIError(f"expected {len(part)} replies to {msg!r}, got {resp.strip()!r}")
+            out.extend(v.strip() for v in vals)
+        return out
 
+    def _flush_deferred(self) -> None:
+        buf = self._defer_buf
+        if buf:
+            self._defer_buf = None
+            try:
+                self.write_batch(buf)
+            finally:
+                self._defer_buf = []
+
+    @_serialized
     def query(self, cmd: str) -> str:
-        if self.logger: self.logger.debug("? %s", cmd)
+        if self._defer_buf:
+            self._flush_deferred()
+        self._log("? %s", cmd)
         try:
             resp = self.resource.query(cmd)
         except Exception as e:
+            self._err_clean = False
             msg = self._quick_scpi_recover()
             if msg and self._is_unsupported_msg(msg):
                 raise NotSupportedError(f"Unsupported query after '{cmd}': {msg}") from e
@@ -190,17 +372,47 @@ class _Session:
                 raise SCPIError(f"Instrument error after '{cmd}': {msg}") from e
             raise
         
-        if self.logger: self.logger.debug("← %s", resp.strip())
-        if self.check_errors and not cmd.strip().upper().startswith("SYST:ERR?"):
-            self._drain_error_queue()
+        self._log("← %s", resp.strip())
+        if cmd.strip()[:9].upper() != "SYST:ERR?":
+            self._maybe_drain()
         return resp
 
+    def _maybe_drain(self) -> None:
+        if not self.check_errors:
+            return
+        if self.strict_errors or not self._err_clean:
+            self._drain_error_queue()
+            return
+        self._unchecked += 1
+        if self.err_check_every and self._unchecked >= self.err_check_every:
+            self._drain_error_queue()
+
+    @_serialized
+    def verify(self) -> None:
+        """Drain the error queue now, regardless of strict_errors; raises SCPIError on error."""
+        self._drain_error_queue()
+
     def _drain_error_queue(self) -> None:
+        self._unchecked = 0
         try:
+            if self.esr_gate:
+                # One *ESR? tells whether anything was queued since the last
+                # check. (Not *STB? bit 2: some vendors use it for MSG.)
+                try:
+                    esr = int(self.resource.query("*ESR?").strip())
+                except Exception:
+                    self.esr_gate = False  # no usable *ESR?; poll SYST:ERR? directly
+                else:
+                    if not esr & _ESR_ERROR_BITS:
+                        self._err_clean = True
+                        return
+            first, n = None, 0
             for _ in range(16):
-                s = self.resource.query("SYST:ERR?").strip()
-                if self.logger:
-                    self.logger.debug("ERR? %s", s)
+                s = self.resource.query("SYST:ERR?")
+                self._log("ERR? %s", s.strip())
+                if _no_err(s):
+                    break
+                s = s.strip()
                 if not s:
                     break
                 code_str = s.split(",")[0].strip()
@@ -211,15 +423,17 @@ class _Session:
                     code = 1
                 if code == 0:
                     break
-
-                raise SCPIError(f"Instrument error after '{self._last_cmd}': {s}")
+                if first is None:
+                    first = s
+                n += 1
+            self._err_clean = True  # queue read out
+            if first is not None:
+                more = f" (+{n - 1} more)" if n > 1 else ""
+                raise SCPIError(f"Instrument error after '{self._last_cmd}': {first}{more}")
         except SCPIError:
             raise
         except Exception as e:
-            if self.logger:
-                self.logger.debug("Error queue check skipped: %s", e)
-
-    from contextlib import contextmanager
+            self._log("Error queue check skipped: %s", e)
 
     @contextmanager
     def suspend_checks(self):
@@ -230,6 +444,38 @@ class _Session:
         finally:
             self.check_errors, self.wait_opc = old_err, old_opc
 
+    @contextmanager
+    def defer(self):
+        """
+        Buffer write() calls and send them via write_batch() on exit.
+        A query inside the block flushes the buffer first; if the block
+        raises, unsent commands are dropped. Nested defer() joins the outer one.
+        """
+        if self._defer_buf is not None:
+            yield
+            return
+        self._defer_buf = []
+        try:
+            yield
+        except BaseException:
+            self._defer_buf = None
+            raise
+        buf, self._defer_buf = self._defer_buf, None
+        self.write_batch(buf)
+
+    @contextmanager
+    def undeferred(self):
+        """Inside defer(): flush, then send writes immediately until exit (for probing)."""
+        if self._defer_buf is None:
+            yield
+            return
+        self._flush_deferred()
+        self._defer_buf = None
+        try:
+            yield
+        finally:
+            self._defer_buf = []
+
     @contextmanager
     def suspend_opc(self):
         """Temporarily disable *OPC? waiting but keep error checks."""
@@ -241,74 +487,118 @@ class _Session:
             self.wait_opc = old_opc
 
 
-    def query_ieee_block(self, cmd: str, timeout_ms: int = 10000) -> bytes:
+    @_serialized
+    def query_ieee_block(self, cmd: str, timeout_ms: int = 10000,
+                         chunk_size: int = 1_048_576) -> bytes:
+        return self._query_block(cmd, timeout_ms, None, False, chunk_size)
+
+    @_serialized
+    def query_ieee_block_into(self, cmd: str, out: bytearray | None = None,
+                              timeout_ms: int = 10000,
+                              chunk_size: int = 1_048_576) -> memoryview:
+        """
+        Like query_ieee_block() but reads the payload into a reused buffer
+        and returns a memoryview of it. Without `out` the session's own
+        buffer is used (allocated on first use, replaced only when a larger
+        block arrives), so the view is valid until the next call. A given
+        `out` is grown in place if too small.
+        """
+        return self._query_block(cmd, timeout_ms, out, True, chunk_size)
+
+    def _query_block(self, cmd: str, timeout_ms: int, out: bytearray | None, into: bool,
+                     chunk_size: int) -> Any:
+        if self._defer_buf:
+            self._flush_deferred()
         r = self.resource
         with self.suspend_checks():
             # save + disable read termination
-            old_rt = getattr(r, "read_termination", None)
+            has_rt = self._has_read_termination
+            old_rt = r.read_termination if has_rt else None
             old_to = r.timeout
+            old_cs = r.chunk_size if self._has_chunk_size else None
+            bump_cs = old_cs is not None and old_cs < chunk_size
             try:
-                if hasattr(r, "read_termination"):
+                if has_rt:
                     r.read_termination = None
                 r.timeout = timeout_ms
+                # let the backend pull big payloads in few transfers
+                if bump_cs:
+                    r.chunk_size = chunk_size
 
                 r.write(cmd)
 
                 # read header: '#' + <ndigits> + <len>
+                # (not speculatively longer: short blocks would stall until timeout)
                 h = r.read_bytes(2)  # b"#" + digit
                 if not h.startswith(b"#"):
                     raise SCPIError(f"bad block header start: {h!r}")
                 nd = int(h[1:2])               # number of digits
                 ln = int(r.read_bytes(nd).decode("ascii"))  # payload length
 
-                # read payload of exact length
-                data = r.read_bytes(ln)
+                # payload of exact length
+                if not into:
+                    data = r.read_bytes(ln)
+                else:
+                    if out is None:
+                        buf = self._rx_buf
+                        if buf is None or len(buf) < ln:
+                            buf = self._rx_buf = bytearray(ln)
+                    else:
+                        buf = out
+                        if len(buf) < ln:
+                            buf.extend(bytes(ln - len(buf)))
+                    data = memoryview(buf)[:ln]
+                    if self._has_read_into:
+                        r.read_into(data)
+                    else:
+                        data[:] = r.read_bytes(ln)  # one copy into the reused buffer
 
                 # optional terminator consume
                 try:
                     r.read_bytes(1)
                 except Exception:
                     pass
-
                 return data
             finally:
                 r.timeout = old_to
-                try:
-                    if hasattr(r, "read_termination"):
-                        r.read_termination = old_rt
-                except Exception:
-                    pass
+                if bump_cs:
+                    r.chunk_size = old_cs
+                if has_rt:
+                    r.read_termination = old_rt
 
     # --- Minimal SCPI recovery (no I/O flushing, no retries) ---
     def _quick_scpi_recover(self) -> str | None:
-        """Try one ERR? then *CLS with short timeout. Never raises."""
+        """Read one SYST:ERR? and *CLS in a single compound query, short timeout. Never raises."""
+        old = None
         try:
-            old = getattr(self.resource, "timeout", None)
-            if old is not None:
+            if self._has_timeout:
+                old = self.resource.timeout
                 try: self.resource.timeout = 100
                 except Exception: old = None
+            # one round-trip: the reply carries the error, *CLS runs after it
             try:
-                msg = self.resource.query("SYST:ERR?").strip()
+                return self.resource.query("SYST:ERR?;*CLS").split(";", 1)[0].strip()
             except Exception:
-                msg = None
+                pass
             try:
                 self.resource.write("*CLS")
             except Exception:
                 pass
-            return msg
+            return None
         except Exception:
             return None
         finally:
-            if 'old' in locals() and old is not None:
+            if old is not None:
                 try: self.resource.timeout = old
                 except Exception: pass
 
 
+    @_serialized
     def wait_opc_once(self, timeout_ms: int = 10000) -> bool:
         """Block on *OPC? with a temporary timeout. Returns True if OPC=1."""
         r = self.resource
         with self.suspend_checks():
-            old = getattr(r, "timeout", None)
+            old = r.timeout if self._has_timeout else None
             try:
                 if old is not None:
                     r.timeout = timeout_ms
@@ -321,12 +611,181 @@ class _Session:
                     except Exception: pass
 
 
+    def submit(self, fn, *a, **k) -> Future:
+        """
+        Run fn(*a, **k) on this session's single background I/O thread while
+        holding the I/O lock; returns a Future. Lets the caller do other work
+        (e.g. on another instrument) during a long transfer.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scope-io")
+
+        def _run():
+            with self._io_lock:
+                return fn(*a, **k)
+        return self._executor.submit(_run)
+
+    def shutdown(self) -> None:
+        """Wait for submitted work and stop the background I/O thread."""
+        ex, self._executor = self._executor, None
+        if ex is not None:
+            ex.shutdown(wait=True)
+
+    # --- asyncio shims: blocking I/O runs in a worker thread ---
+    # Calls on one session are serialized (ordering via an asyncio.Lock,
+    # exclusion against plain threads via _io_lock); separate sessions
+    # run concurrently.
+    def _async_lock(self) -> asyncio.Lock:
+        if self._alock is None:
+            self._alock = asyncio.Lock()
+        return self._alock
+
+    async def awrite(self, cmd: str) -> None:
+        async with self._async_lock():
+            await asyncio.to_thread(self.write, cmd)
+
+    async def aquery(self, cmd: str) -> str:
+        async with self._async_lock():
+            return await asyncio.to_thread(self.query, cmd)
+
+    async def aquery_ieee_block(self, cmd: str, timeout_ms: int = 10000,
+                                chunk_size: int = 1_048_576) -> bytes:
+        async with self._async_lock():
+            return await asyncio.to_thread(self.query_ieee_block, cmd, timeout_ms, chunk_size)
+
     @staticmethod
     def _is_unsupported_msg(msg: str) -> bool:
-        u = msg.upper()
-        return any(tok in u for tok in ("-113", "UNDEFINED HEADER", "HEADER NOT RECOGNIZED",
-                                        "-102", "SYNTAX ERROR", "COMMAND ERROR", "-420","Query UNTERMINATED"))
+        return _unsupported_search(msg) is not None
+
 
+# ---------------------------
+# Raw socket transport (TCPIP::host::port::SOCKET without VISA)
+# ---------------------------
+class _RawSocketResource:
+    """
+    The subset of a pyvisa MessageBasedResource that _Session and the
+    adapters use, over a plain TCP socket with TCP_NODELAY. Socket errors are
+    raised as VisaIOError. There are no VISA events on a raw socket, so
+    enable_event() is left out and SRQ waits fall back to polling.
+    """
+
+    def __init__(self, host: str, port: int, timeout_ms: int = 5000):
+        try:
+            self._sock = socket.create_connection((host, port), timeout=timeout_ms / 1000.0)
+        except OSError as e:
+            raise self._visa_error(e) from e
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._timeout = timeout_ms
+        self.write_termination = "\n"
+        self.read_termination = "\n"
+        self.chunk_size = 1 << 20
+        self._buf = bytearray(65536)   # persistent receive buffer
+        self._rx = bytearray()         # bytes received but not yet consumed
+
+    @staticmethod
+    def _visa_error(e: OSError) -> Exception:
+        """The VisaIOError a VISA socket resource raises for this socket error."""
+        sc = pyvisa.constants.StatusCode
+        code = sc.error_timeout if isinstance(e, socket.timeout) else sc.error_connection_lost
+        return pyvisa.errors.VisaIOError(code)
+
+    @classmethod
+    def from_address(cls, address: str, timeout_ms: int = 5000) -> "_RawSocketResource":
+        parts = address.split("::")
+        if len(parts) < 4:
+            raise ValueError(f"not a TCPIP socket address: {address!r}")
+        return cls(parts[1], int(parts[2]), timeout_ms)
+
+    @property
+    def timeout(self) -> int:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, ms) -> None:
+        self._timeout = ms
+        self._sock.settimeout(None if ms is None else ms / 1000.0)
+
+    def _recv(self) -> None:
+        try:
+            n = self._sock.recv_into(self._buf)
+        except OSError as e:
+            raise self._visa_error(e) from e
+        if not n:
+            raise self._visa_error(ConnectionError("socket closed by instrument"))
+        self._rx += memoryview(self._buf)[:n]
+
+    def write(self, cmd: str) -> None:
+        self.write_raw((cmd + (self.write_termination or "")).encode("ascii"))
+
+    def write_raw(self, data: bytes) -> None:
+        try:
+            self._sock.sendall(data)
+        except OSError as e:
+            raise self._visa_error(e) from e
+
+    def read_raw(self) -> bytes:
+        term = (self.read_termination or "\n").encode("ascii")
+        while True:
+            i = self._rx.find(term)
+            if i >= 0:
+                i += len(term)
+                out = bytes(self._rx[:i])
+                del self._rx[:i]
+                return out
+            self._recv()
+
+    def read(self) -> str:
+        term = self.read_termination or ""
+        s = self.read_raw().decode("ascii", errors="replace")
+        return s[:-len(term)] if term and s.endswith(term) else s
+
+    def query(self, cmd: str) -> str:
+        self.write(cmd)
+        return self.read()
+
+    def read_bytes(self, count: int) -> bytes:
+        out = bytearray(count)
+        self.read_into(memoryview(out))
+        return bytes(out)
+
+    def read_into(self, mv: memoryview) -> None:
+        """Fill mv completely, straight from the socket where possible."""
+        count = len(mv)
+        k = min(count, len(self._rx))
+        mv[:k] = self._rx[:k]
+        del self._rx[:k]
+        try:
+            while k < count:
+                n = self._sock.recv_into(mv[k:])
+                if not n:
+                    raise ConnectionError("socket closed by instrument")
+                k += n
+        except OSError as e:
+            # keep what did arrive: the next read (or a drain) starts from it
+            self._rx[:0] = mv[:k]
+            raise self._visa_error(e) from e
+
+    def read_stb(self) -> int:
+        # no serial poll on a socket; VISA sends *STB? for SOCKET resources too
+        return int(self.query("*STB?"))
+
+    def flush(self, mask=None) -> None:
+        # only a receive buffer exists on this side; writes go out immediately
+        self._rx.clear()
+
+    def clear(self) -> None:
+        self._rx.clear()
+
+    def close(self) -> None:
+        try:
+            self._sock.close()
+        finally:
+            self._rx.clear()
+
+
+def _is_socket_address(address: str) -> bool:
+    u = address.upper()
+    return u.startswith("TCPIP") and u.endswith("::SOCKET")
 
 # ---------------------------
 # Base + Brand adapter pattern
@@ -355,12 +814,69 @@ class BaseAdapter:
         # "slope": {"POS":"POS","NEG":"NEG"},
     }
 
+    REV_TOKEN_MAP: MappingProxyType = MappingProxyType({})
+    _ENUM_TOK: dict = {}
+    # "MAKER,MODEL" -> {(method, ...): index of the command form that worked}
+    _FORM_CACHE: dict = {}
+    _PRECOMPUTED_CHANNELS = 8
+
     def __init__(self, s: _Session, idn: str):
         self.s = s
         self.idn = idn
-        self.REV_TOKEN_MAP = {fam:{v:k for k,v in m.items()} for fam,m in self.TOKEN_MAP.items()}
-        for fam,m in self.TOKEN_MAP.items():
-            if len(set(m.values())) != len(m): raise ValueError(f"{fam} tokens must be unique")
+        model = ",".join(p.strip() for p in idn.upper().split(",")[:2])
+        self._forms = self._FORM_CACHE.setdefault(model, {})
+        # per-channel command templates for the hot channel setters/getters;
+        # index 0 unused, channels beyond the table are formatted on demand
+        chans = [self._chan(i) for i in range(1, self._PRECOMPUTED_CHANNELS + 1)]
+        self._ch_cmd = {suffix: (None,) + tuple(f":{c}{suffix}" for c in chans)
+                        for suffix in (":SCAL %s", ":SCAL?", ":OFFS %s", ":OFFS?", ":PROBe %s", ":PROBe?")}
+        self._math_cmd: dict[tuple, str] = {}  # (suffix, math) -> template, see _mcmd()
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        cls._build_token_tables()
+        cls._FORM_CACHE = {}
+
+    def _try_forms(self, key: tuple, forms: tuple, fn):
+        """
+        Return fn(form) for the first form that does not raise. The winning
+        index is remembered per adapter class and model, so later calls go
+        straight to it (and re-probe only if it stops working).
+        Raises the last error if no form works.
+        """
+        i = self._forms.get(key)
+        if i is not None:
+            try:
+                return fn(forms[i])
+            except Exception:
+                del self._forms[key]
+        err: Exception | None = None
+        with self.s.undeferred():  # a buffered write cannot tell us whether it worked
+            for i, f in enumerate(forms):
+                try:
+                    r = fn(f)
+                except Exception as e:
+                    err = e
+                    continue
+                self._forms[key] = i
+                return r
+        raise err if err is not None else NotSupportedError("no command form")
+
+    @classmethod
+    def _build_token_tables(cls) -> None:
+        """Freeze TOKEN_MAP, derive REV_TOKEN_MAP and check uniqueness once per class."""
+        own = cls.__dict__.get("TOKEN_MAP")
+        if own is not None:
+            merged = dict(super(cls, cls).TOKEN_MAP) if cls is not BaseAdapter else {}
+            merged.update(own)
+            for fam, m in merged.items():
+                if len(set(m.values())) != len(m): raise ValueError(f"{fam} tokens must be unique")
+            cls.TOKEN_MAP = MappingProxyType({fam: MappingProxyType(dict(m)) for fam, m in merged.items()})
+            cls.REV_TOKEN_MAP = MappingProxyType(
+                {fam: MappingProxyType({v: k for k, v in m.items()}) for fam, m in merged.items()})
+        cls._ENUM_TOK = {}  # (family, Enum member) -> vendor token, filled by _tok()
+        meas = cls.TOKEN_MAP.get("measure", {})
+        cls._TWO_SOURCE_TOKENS = frozenset(meas.get(k, k) for k in cls.TWO_SOURCE_MEASURES)
 
 
     @staticmethod
@@ -373,14 +889,21 @@ class BaseAdapter:
 
     
     def _tok(self, family: str, v, *, strict: bool = True) -> str:
-        k = v.value if hasattr(v, "value") else str(v).upper()
-        fam = self.TOKEN_MAP.get(family, {})
-        if not strict:
-            return fam.get(k, k)  # passthrough if unmapped
-        try:
-            return fam[k]
-        except KeyError:
+        if isinstance(v, Enum):
+            t = self._ENUM_TOK.get((family, v))
+            if t is not None:
+                return t
+            k = v._value_
+        else:
+            k = str(v).upper()
+        t = self.TOKEN_MAP.get(family, {}).get(k)
+        if t is None:
+            if not strict:
+                return k  # passthrough if unmapped
             raise NotSupportedError(f"unknown {family} token: {k}")
+        if isinstance(v, Enum):
+            self._ENUM_TOK[(family, v)] = t
+        return t
 
     
     def _untok(self, family: str, vendor_token: str, *, passthrough=True):
@@ -392,24 +915,22 @@ class BaseAdapter:
     def set_channel_enabled(self, ch: int, on: bool) -> None:
         """Show/hide an analog channel on screen."""
         chan = self._chan(ch)
-        for cmd in (f":{chan}:DISP {self._bstr(on)}",    # Keysight/Rigol
-                    f":{chan}:STAT {self._bstr(on)}"):   # Rohde & Schwarz
-            try:
-                self.s.write(cmd)
-                return
-            except Exception:
-                continue
-        raise NotSupportedError("Channel display enable not supported by this model")
+        try:
+            self._try_forms(("chan_enable",),
+                            (f":{chan}:DISP {self._bstr(on)}",    # Keysight/Rigol
+                             f":{chan}:STAT {self._bstr(on)}"),   # Rohde & Schwarz
+                            self.s.write)
+        except Exception:
+            raise NotSupportedError("Channel display enable not supported by this model")
 
     def is_channel_enabled(self, ch: int) -> bool | None:
         """Return True/False if query supported, else None."""
         chan = self._chan(ch)
-        for q in (f":{chan}:DISP?", f":{chan}:STAT?"):
-            try:
-                return self._parse_bool(self.s.query(q))
-            except Exception:
-                continue
-        return None
+        try:
+            return self._try_forms(("chan_enabled?",), (f":{chan}:DISP?", f":{chan}:STAT?"),
+                                   lambda q: self._parse_bool(self.s.query(q)))
+        except Exception:
+            return None
 
 
     # Timebase
@@ -427,18 +948,24 @@ class BaseAdapter:
         if ch < 1: raise RangeError("channels are 1-based")
         return f"CHAN{ch}"
 
+    def _ch(self, suffix: str, ch: int) -> str:
+        t = self._ch_cmd[suffix]
+        if 0 < ch < len(t):
+            return t[ch]
+        return f":{self._chan(ch)}{suffix}"
+
     def get_channel_scale(self, ch: int) -> float: 
-        return float(self.s.query(f":{self._chan(ch)}:SCAL?"))
+        return float(self.s.query(self._ch(":SCAL?", ch)))
 
     def get_channel_offset(self, ch: int) -> float:
-        return float(self.s.query(f":{self._chan(ch)}:OFFS?"))
+        return float(self.s.query(self._ch(":OFFS?", ch)))
 
 
     def set_channel_scale(self, ch: int, v_per_div: float) -> None:
-        self.s.write(f":{self._chan(ch)}:SCAL {v_per_div}")
+        self.s.write(self._ch(":SCAL %s", ch) % (v_per_div,))
 
     def set_channel_offset(self, ch: int, volts: float) -> None:
-        self.s.write(f":{self._chan(ch)}:OFFS {volts}")
+        self.s.write(self._ch(":OFFS %s", ch) % (volts,))
 
     def set_channel_coupling(self, ch: int, mode: str) -> None:
         token = self._tok('coupling', mode, strict=False)
@@ -456,10 +983,10 @@ class BaseAdapter:
 
     #Probe
     def set_probe_attenuation(self, ch: int, factor: float) -> None: 
-        self.s.write(f":{self._chan(ch)}:PROBe {factor}")
+        self.s.write(self._ch(":PROBe %s", ch) % (factor,))
 
     def get_probe_attenuation(self, ch: int) -> float: 
-        return float(self.s.query(f":{self._chan(ch)}:PROBe?"))
+        return float(self.s.query(self._ch(":PROBe?", ch)))
 
     def set_probe_sensitivity(self, ch: int, v_per_a: float) -> None: 
         self.set_probe_attenuation(ch, 1/v_per_a)
@@ -469,10 +996,12 @@ class BaseAdapter:
 
     # Trigger
     def set_trigger(self, *, edge_src: str = "CHAN1", level: float = 0.0, slope: str = "POS") -> None:
-        self.s.write(":TRIG:MODE EDGE")
-        self.s.write(f":TRIG:EDGE:SOUR {edge_src}")
-        self.s.write(f":TRIG:LEV {level}")
-        self.s.write(f":TRIG:EDGE:SLOP {slope.upper()}")  # POS|NEG
+        self.s.write_batch((
+            ":TRIG:MODE EDGE",
+            f":TRIG:EDGE:SOUR {edge_src}",
+            f":TRIG:LEV {level}",
+            f":TRIG:EDGE:SLOP {slope.upper()}",  # POS|NEG
+        ))
 
     def set_trigger_sweep(self, mode: TriggerSweepMode | str) -> None:
         token = self._tok('trig_sweep', mode)
@@ -511,32 +1040,36 @@ class BaseAdapter:
         if m < 1: raise ValueError("math must be >= 1")
         return f":MATH"
 
+    def _mcmd(self, suffix: str, math: int) -> str:
+        """'<math namespace><suffix>' template, built once per (suffix, math)."""
+        t = self._math_cmd.get((suffix, math))
+        if t is None:
+            t = self._math_cmd[suffix, math] = self._math_ns(math) + suffix
+        return t
+
     def set_math_source(self, math: int, slot: int, src: str) -> None:
         if slot not in (1, 2): raise ValueError("slot must be 1 or 2")
-        ns = self._math_ns(math)
-        self.s.write(f"{ns}:SOUR{slot} {src}")
+        self.s.write(self._mcmd(":SOUR1 %s" if slot == 1 else ":SOUR2 %s", math) % (src,))
 
     def set_math_operator(self, math: int, op: MathOperator | str = MathOperator.ADD) -> None:
         ns = self._math_ns(math)
         self.s.write(f"{ns}:OPER {self._tok('math', op)}")
 
     def set_math_enabled(self, math: int, on: bool) -> None:
-        ns = self._math_ns(math)
-        self.s.write(f"{ns}:DISP {'ON' if on else 'OFF'}")
+        self.s.write(self._mcmd(":DISP ON" if on else ":DISP OFF", math))
 
     def enable_math(self, math: int, on: bool, op: MathOperator | str = MathOperator.ADD) -> None:
         # sets operator and display only
-        self.set_math_operator(math, op)
-        self.set_math_enabled(math, on)
+        with self.s.defer():
+            self.set_math_operator(math, op)
+            self.set_math_enabled(math, on)
 
 
     def set_math_scale(self, math: int, v_per_div: float) -> None:
-        ns = self._math_ns(math)  # reuses your helper
-        self.s.write(f"{ns}:SCAL {v_per_div}")
+        self.s.write(self._mcmd(":SCAL %s", math) % (v_per_div,))
 
     def set_math_offset(self, math: int, volts: float) -> None:
-        ns = self._math_ns(math)
-        self.s.write(f"{ns}:OFFS {volts}")
+        self.s.write(self._mcmd(":OFFS %s", math) % (volts,))
 
 
 
@@ -547,17 +1080,17 @@ class BaseAdapter:
             raise NotSupportedError(f"unknown measure kind: {kind}")
 
     def _parse_float(self, s: str) -> float:
-        import re
-        m = re.search(r'[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?', s)
+        m = _FLOAT_RE.search(s)
         if not m: raise SCPIError(f"no numeric value in {s!r}")
         return float(m.group(0))
 
-# tokens that require two sources
-    MEAS_SIGNATURES: dict[str, int] = {"PHASE": 2, "DELAY": 2}
+    # measures that require two sources (canonical names; vendor tokens derived per class)
+    TWO_SOURCE_MEASURES: frozenset[str] = frozenset({"PHASE", "DELAY"})
+    _TWO_SOURCE_TOKENS: frozenset[str] = frozenset()
 
     def enable_measure(self, kind: Measure | str, src: str = "CHAN1", src2: str | None = None):
         t = self._meas_token(kind)
-        need_two = self.MEAS_SIGNATURES.get(t, 1) == 2 or src2 is not None
+        need_two = t in self._TWO_SOURCE_TOKENS or src2 is not None
         if need_two and not src2:
             src2 = "CHAN2"
         forms_1 = (
@@ -570,42 +1103,75 @@ class BaseAdapter:
             f":MEAS:{t} {src},{src2}",
             f":MEAS:{t} {src},{src2},DEF,DEF",
         )
-        for q in (forms_2 if need_two else forms_1):
-            try:
-                self.s.write(q); return
-            except Exception as e:
-                continue
-        raise NotSupportedError(f"measurement {kind} not supported: {e}")
+        try:
+            self._try_forms(("enable_measure", t, need_two),
+                            forms_2 if need_two else forms_1, self.s.write)
+        except Exception as e:
+            raise NotSupportedError(f"measurement {kind} not supported: {e}") from e
 
-    def get_measure(self, kind: Measure | str, src: str = "CHAN1", src2: str | None = None) -> float:
+    def _measure_query_forms(self, kind: Measure | str, src: str, src2: str | None) -> tuple:
+        """(form-cache key, candidate query forms) for get_measure()."""
         t = self._meas_token(kind)
-        need = self.MEAS_SIGNATURES.get(t, 1)
-        two = (need == 2) or (src2 is not None)
+        two = t in self._TWO_SOURCE_TOKENS or src2 is not None
         if two and not src2:
             src2 = "CHAN2"
-        forms_1 = (
-            f":MEAS:ITEM? {t},{src}",
-            f":MEAS:{t}? {src}",
-            f":MEAS:{t}? {src},DEF,DEF",
-        )
-        forms_2 = (
-            f":MEAS:ITEM? {t},{src},{src2}",
-            f":MEAS:{t}? {src},{src2}",
-            f":MEAS:{t}? {src},{src2},DEF,DEF",
-        )
-        for q in (forms_2 if two else forms_1):
+        if two:
+            forms = (
+                f":MEAS:ITEM? {t},{src},{src2}",
+                f":MEAS:{t}? {src},{src2}",
+                f":MEAS:{t}? {src},{src2},DEF,DEF",
+            )
+        else:
+            forms = (
+                f":MEAS:ITEM? {t},{src}",
+                f":MEAS:{t}? {src}",
+                f":MEAS:{t}? {src},DEF,DEF",
+            )
+        return ("get_measure", t, two), forms
+
+    def get_measure(self, kind: Measure | str, src: str = "CHAN1", src2: str | None = None) -> float:
+        key, forms = self._measure_query_forms(kind, src, src2)
+        try:
+            return self._try_forms(key, forms, lambda q: _fast_float(self.s.query(q)))
+        except Exception:
+            raise NotSupportedError(f"measurement {kind} not supported")
+
+    def get_measures(self, reqs: Iterable[tuple], per_msg: int = 8, *,
+                     partial: bool = False) -> list[float | None]:
+        """
+        get_measure() for several (kind, src, src2) tuples using compound
+        queries (see _Session.query_batch). Each kind uses the form
+        get_measure() settled on, else the one the previous batch used.
+        Raises if a message goes unanswered or, unless partial=True, if any
+        reply is not numeric; with partial=True such replies come back as
+        None so the caller can retry just those with get_measure().
+        """
+        picked = []
+        for kind, src, src2 in reqs:
+            key, forms = self._measure_query_forms(kind, src, src2)
+            i = self._forms.get(key)
+            if i is None:
+                i = self._forms.get(("get_measure",), 0)
+            picked.append((key, i, forms[i]))
+        vals: list[float | None] = []
+        for (key, i, _), reply in zip(picked, self.s.query_batch([q for _, _, q in picked], per_msg)):
             try:
-                return self._parse_float(self.s.query(q))
-            except Exception:
+                vals.append(_fast_float(reply))
+            except SCPIError:
+                if not partial:
+                    raise
+                vals.append(None)
                 continue
-        raise NotSupportedError(f"measurement {kind} not supported")
+            self._forms[key] = i
+            self._forms[("get_measure",)] = i
+        return vals
 
     def enable_measure_stats(self, on: bool = True) -> None:
-        for cmd in (":MEAS:STAT ON", ":MEAS:STAT:STATE ON"):
-            try:
-                self.s.write(cmd if on else cmd.replace("ON","OFF")); return
-            except Exception: continue
-        raise NotSupportedError("measure stats toggle not supported")
+        b = self._bstr(on)
+        try:
+            self._try_forms(("meas_stat",), (f":MEAS:STAT {b}", f":MEAS:STAT:STATE {b}"), self.s.write)
+        except Exception:
+            raise NotSupportedError("measure stats toggle not supported")
     
     def clear_measures(self) -> None:
         
@@ -614,38 +1180,61 @@ class BaseAdapter:
             raise NotSupportedError("measures clear not supported")
 
     def clear_measure_stats(self) -> None:
-        for cmd in (":MEAS:STAT:CLEAR", ":MEAS:STAT:RES"):
-            try: self.s.write(cmd); return
-            except Exception: continue
-        raise NotSupportedError("measure stats clear not supported")
+        try:
+            self._try_forms(("meas_stat_clear",), (":MEAS:STAT:CLEAR", ":MEAS:STAT:RES"), self.s.write)
+        except Exception:
+            raise NotSupportedError("measure stats clear not supported")
 
     def measure_stats(self, kind: Measure | str, src: str = "CHAN1") -> dict:
         t = self._meas_token(kind)
-        for q in (f":MEAS:STAT:ITEM? {t},{src}",
-                  f":MEAS:STAT:ITEM? {t},{src},ALL"):
-            try:
-                resp = self.s.query(q).strip()
-                vals = [self._parse_float(x) for x in resp.replace(";",",").split(",")]
-                if len(vals) >= 4:
-                    return {"MEAN":vals[0], "MIN":vals[1], "MAX":vals[2], "STD":vals[3]}
-            except Exception:
-                continue
-        raise NotSupportedError("measure stats not supported")
+
+        def _read(q: str) -> dict:
+            resp = self.s.query(q).strip()
+            vals = [float(x) for x in _FLOAT_RE.findall(resp)]
+            if len(vals) < 4:
+                raise SCPIError(f"short stats reply: {resp!r}")
+            return {"MEAN":vals[0], "MIN":vals[1], "MAX":vals[2], "STD":vals[3]}
+
+        try:
+            return self._try_forms(("measure_stats", t),
+                                   (f":MEAS:STAT:ITEM? {t},{src}",
+                                    f":MEAS:STAT:ITEM? {t},{src},ALL"), _read)
+        except Exception:
+            raise NotSupportedError("measure stats not supported")
 
 
     # Screenshot → PNG bytes
+    _SCREENSHOT_FORMS = (":DISPlay:DATA? PNG,SCReen,ON",
+                         ":DISP:DATA? PNG,SCREEN,ON",
+                         ":DISP:DATA? PNG",
+                         None)  # None: hardcopy fallback
+    # transfer size for screenshots: multi-MB PNGs in a few USBTMC/socket reads
+    _SCREENSHOT_CHUNK = 2 << 20
+
     def screenshot_png(self) -> bytes:
-        for cmd in (":DISPlay:DATA? PNG,SCReen,ON",
-                    ":DISP:DATA? PNG,SCREEN,ON",
-                    ":DISP:DATA? PNG"):
-            try:
-                return self.s.query_ieee_block(cmd, timeout_ms=10000)
-            except Exception:
-                continue
-        # Hardcopy fallback
+        return self._try_forms(("screenshot",), self._SCREENSHOT_FORMS, self._screenshot_form)
+
+    def screenshot_png_into(self, out: bytearray | None = None) -> memoryview:
+        """
+        screenshot_png() into a reused buffer (see _Session.query_ieee_block_into).
+        Adapters that override screenshot_png() get a view of its bytes instead.
+        """
+        if type(self).screenshot_png is not BaseAdapter.screenshot_png:
+            return memoryview(self.screenshot_png())
+        return self._try_forms(("screenshot",), self._SCREENSHOT_FORMS,
+                               lambda cmd: memoryview(self._screenshot_form(None)) if cmd is None
+                               else self.s.query_ieee_block_into(cmd, out, timeout_ms=10000,
+                                                                 chunk_size=self._SCREENSHOT_CHUNK))
+
+    def screenshot_png_async(self) -> Future:
+        """Start screenshot_png() on the session's I/O thread; returns Future[bytes]."""
+        return self.s.submit(self.screenshot_png)
+
+    def _screenshot_form(self, cmd: str | None) -> bytes:
+        if cmd is not None:
+            return self.s.query_ieee_block(cmd, timeout_ms=10000, chunk_size=self._SCREENSHOT_CHUNK)
         with self.s.suspend_checks():
-            self.s.resource.write(":HCOPy:DEVice:LANGuage PNG")
-            self.s.resource.write(":HCOPy:IMMediate")
+            self.s.resource.write(":HCOPy:DEVice:LANGuage PNG;:HCOPy:IMMediate")
             return self.resource_read_raw()
 
     def menu_off(self) -> None:
@@ -660,7 +1249,15 @@ class BaseAdapter:
         # Use underlying VISA object directly to read binary block
         r = self.s.resource
         if hasattr(r, "read_raw"):
-            return r.read_raw()
+            old_cs = getattr(r, "chunk_size", None)
+            bump = old_cs is not None and old_cs < self._SCREENSHOT_CHUNK
+            try:
+                if bump:
+                    r.chunk_size = self._SCREENSHOT_CHUNK
+                return r.read_raw()
+            finally:
+                if bump:
+                    r.chunk_size = old_cs
         # Fallback via query of arbitrary-length binary not supported → fail
         raise NotSupportedError("read_raw not available on this VISA resource")
 
@@ -698,24 +1295,68 @@ class BaseAdapter:
             pass
 
 
+BaseAdapter._build_token_tables()
+
+
 class BrandAdapter(BaseAdapter):
     _models: list[type["BrandAdapter"]] = []
     brand: str | None = None
     vendor_aliases: tuple[str, ...] = ()
 
+    # all registered MODEL_PATTERNS as one case-insensitive alternation, a pre-filter
+    # for select(); None = rebuild on next select(), False = patterns not combinable
+    _MODEL_RX: re.Pattern | bool | None = None
+
+    # every BrandAdapter subclass, in definition order; pick_adapter() candidates
+    _registry: list[type["BrandAdapter"]] = []
+    # _registry, most specific first; None = re-sort on next pick
+    _sorted_registry: tuple[type["BrandAdapter"], ...] | None = None
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        BrandAdapter._registry.append(cls)
+        BrandAdapter._sorted_registry = None
+        try:
+            pick_adapter.cache_clear()
+        except NameError:
+            pass  # module still loading; cache not built yet
+
     @classmethod
     def register_model(cls, model_cls):
         cls._models.append(model_cls)
+        BrandAdapter._MODEL_RX = None
+        try:
+            pick_adapter.cache_clear()
+        except NameError:
+            pass
         return model_cls
 
+    @classmethod
+    def _model_rx(cls) -> re.Pattern | bool:
+        rx = BrandAdapter._MODEL_RX
+        if rx is None:
+            pats = [p for m in cls._models for p in getattr(m, "MODEL_PATTERNS", ())]
+            rx = False
+            # groups would be renumbered (backreferences) and other flags lost
+            if pats and all(not p.groups and not p.flags & ~(re.I | re.U) for p in pats):
+                try:
+                    rx = re.compile("|".join("(?:%s)" % p.pattern for p in pats), re.I)
+                except re.error:
+                    pass
+            BrandAdapter._MODEL_RX = rx
+        return rx
+
     @classmethod
     def select(cls, idn: str) -> type["BrandAdapter"]:
         u = idn.upper()
-        # prefer MODEL_PATTERNS if provided
-        for m in cls._models:
-            pats = getattr(m, "MODEL_PATTERNS", ())
-            if pats and any(rx.search(u) for rx in pats):
-                return m
+        # prefer MODEL_PATTERNS if provided; first registered match wins.
+        # One scan of the union rules out IDNs no model pattern can match.
+        rx = cls._model_rx()
+        if rx is False or rx.search(u) is not None:
+            for m in cls._models:
+                pats = getattr(m, "MODEL_PATTERNS", ())
+                if pats and any(p.search(u) for p in pats):
+                    return m
         for m in cls._models:
             try:
                 if hasattr(m, "matches") and m.matches(idn):
@@ -776,10 +1417,12 @@ class RigolScope(BrandAdapter):
 
     # Trigger
     def set_trigger(self, *, edge_src: str = "CHAN1", level: float = 0.0, slope: str = "POS") -> None:
-        self.s.write(":TRIG:MODE EDGE")
-        self.s.write(f":TRIG:EDGE:SOUR {edge_src}")
-        self.s.write(f":TRIG:EDGE:LEVel {level}")
-        self.s.write(f":TRIG:EDGE:SLOP {slope.upper()}")  # POS|NEG
+        self.s.write_batch((
+            ":TRIG:MODE EDGE",
+            f":TRIG:EDGE:SOUR {edge_src}",
+            f":TRIG:EDGE:LEVel {level}",
+            f":TRIG:EDGE:SLOP {slope.upper()}",  # POS|NEG
+        ))
 
     # Math
     def _math_ns(self, math: int | str) -> str:
@@ -795,11 +1438,10 @@ class RigolScope(BrandAdapter):
 
 
     def enable_measure_stats(self, on: bool = True) -> None:
-        for cmd in (":MEASure:STATistic:DISPlay ON"):
-            try:
-                self.s.write(cmd if on else cmd.replace("ON","OFF")); return
-            except Exception: continue
-        raise NotSupportedError("measure stats toggle not supported")
+        try:
+            self.s.write(f":MEASure:STATistic:DISPlay {self._bstr(on)}")
+        except Exception:
+            raise NotSupportedError("measure stats toggle not supported")
 
     def menu_off(self) -> None:
         try:
@@ -814,26 +1456,24 @@ class RigolScope(BrandAdapter):
 
     
 
-    def set_probe_attenuation(self, ch: int, factor: float, *, snap: bool = False) -> None:
-        d = Decimal(str(factor)).normalize()
+    # Allowed probe attenuation factors, with their SCPI spelling
+    _FACTOR_STRS: dict[Decimal, str] = {Decimal(s): s for s in
+        ("0.01","0.02","0.05","0.1","0.2","0.5","1","2","5","10","20","50","100","200","500","1000")}
+    _ALLOWED_FACTORS = tuple(_FACTOR_STRS)
 
-        # Allowed probe attenuation factors
-        _ALLOWED_FACTORS = tuple(Decimal(s) for s in
-            ("0.01","0.02","0.05","0.1","0.2","0.5","1","2","5","10","20","50","100","200","500","1000"))
-
-        def _fmt_num(x: Decimal) -> str:
-            s = format(x.normalize(), "f")
-            return s.rstrip("0").rstrip(".") if "." in s else s
+    def set_probe_attenuation(self, ch: int, factor: float, *, snap: bool = False) -> None:
+        d = Decimal(str(factor))
 
         if snap:
             # snap to the nearest allowed value
-            d = min(_ALLOWED_FACTORS, key=lambda a: abs(a - d))
+            d = min(self._ALLOWED_FACTORS, key=lambda a: abs(a - d))
 
-        if d not in _ALLOWED_FACTORS:
-            allowed = ", ".join(_fmt_num(a) for a in _ALLOWED_FACTORS)
+        tok = self._FACTOR_STRS.get(d)  # Decimal equality: 10 == 10.0 == 1E+1
+        if tok is None:
+            allowed = ", ".join(self._FACTOR_STRS.values())
             raise ValueError(f"factor must be one of {{{allowed}}}")
 
-        self.s.write(f":{self._chan(ch)}:PROBe {_fmt_num(d)}")
+        self.s.write(self._ch(":PROBe %s", ch) % (tok,))
 
         
 
@@ -843,8 +1483,7 @@ class RohdeSchwarzScope(BrandAdapter):
     vendor_aliases = ("R&S", "R\u0026S", "ROHDE")
 
     def screenshot_png(self) -> bytes:
-        self.s.write(":HCOP:DEV:LANG PNG")
-        self.s.write(":HCOP:IMM")
+        self.s.write_batch((":HCOP:DEV:LANG PNG", ":HCOP:IMM"))
         return self.resource_read_raw()
 
 
@@ -864,83 +1503,106 @@ class KeysightScope(BrandAdapter):
     def screenshot_png(self) -> bytes:
 
         try:
-            return self.s.query_ieee_block(":DISP:DATA? PNG", timeout_ms=10000)
+            return self.s.query_ieee_block(":DISP:DATA? PNG", timeout_ms=10000,
+                                           chunk_size=self._SCREENSHOT_CHUNK)
         except Exception:
             raise
 
+    @classmethod
+    def _build_token_tables(cls) -> None:
+        super()._build_token_tables()
+        # measure kind -> (write 1-src, write 2-src, query 1-src, query 2-src, needs two),
+        # keyed by canonical name and by Measure member
+        cls._MEAS_T = {}
+        for k, t in cls.TOKEN_MAP["measure"].items():
+            e = (f":MEASure:{t} %s", f":MEASure:{t} %s,%s",
+                 f":MEASure:{t}? %s", f":MEASure:{t}? %s,%s", t in cls._TWO_SOURCE_TOKENS)
+            cls._MEAS_T[k] = e
+            if k in Measure.__members__:
+                cls._MEAS_T[Measure[k]] = e
+
+    def _meas_templates(self, kind: Measure | str) -> tuple:
+        e = self._MEAS_T.get(kind)
+        if e is None:
+            e = self._MEAS_T.get(str(kind).upper())
+            if e is None:
+                raise NotSupportedError(f"unknown measure kind: {kind}")
+        return e
+
     def enable_measure(
             self, kind: Measure | str, src: str = "CHAN1", src2: str | None = None
         ):
-            t = self._meas_token(kind)
-            need_two = self.MEAS_SIGNATURES.get(t, 1) == 2 or src2 is not None
-            if need_two and not src2:
-                src2 = "CHAN2"
-
-            q = (
-                f":MEASure:{t} {src},{src2}"
-                if need_two
-                else f":MEASure:{t} {src}"
-            )
-            
+            e = self._meas_templates(kind)
+            if e[4] or src2 is not None:
+                q = e[1] % (src, src2 or "CHAN2")
+            else:
+                q = e[0] % src
             try:
                 self.s.write(q)
             except Exception:
                 raise NotSupportedError(f"measurement {kind} not supported")
-        
+
+    def _measure_query_forms(self, kind: Measure | str, src: str, src2: str | None) -> tuple:
+        e = self._meas_templates(kind)
+        two = e[4] or src2 is not None
+        return ("get_measure", e[2], two), ((e[3] % (src, src2 or "CHAN2")) if two else (e[2] % src),)
 
     def get_measure(
             self, kind: Measure | str, src: str = "CHAN1", src2: str | None = None
         ) -> float:
-            t = self._meas_token(kind)
-            need_two = self.MEAS_SIGNATURES.get(t, 1) == 2 or src2 is not None
-            if need_two and not src2:
-                src2 = "CHAN2"
-
-            q = (
-                f":MEASure:{t}? {src},{src2}"
-                if need_two
-                else f":MEASure:{t}? {src}"
-            )
-            
+            e = self._meas_templates(kind)
+            if e[4] or src2 is not None:
+                q = e[3] % (src, src2 or "CHAN2")
+            else:
+                q = e[2] % src
             try:
-                return self._parse_float(self.s.query(q))
+                return _fast_float(self.s.query(q))
             except Exception:
                 raise NotSupportedError(f"measurement {kind} not supported")
 
 
+    def _get_vmax_vmin(self, ch: int) -> Tuple[float, float]:
+        """VMAX and VMIN of a channel in one compound query."""
+        c = f"CHAN{int(ch)}"
+        q = f"{self._MEAS_T['VMAX'][2] % c};{self._MEAS_T['VMIN'][2] % c}"
+        try:
+            vmax, vmin = self.s.query(q).split(";")
+            return _fast_float(vmax), _fast_float(vmin)
+        except Exception:
+            raise NotSupportedError("measurement VMAX/VMIN not supported")
+
     def get_trigger_status(self) -> bool:
         return self.s.query(":TER?").strip().endswith("1")
 
     # Math
-    def _math_ns(self, math: int | str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _math_ns(math: int | str) -> str:
         m = int(math)
         if m < 1: raise ValueError("math must be >= 1")
         return f":FUNCtion{m}"
 
     def set_math_source(self, math: int, slot: int, src: str) -> None:
         if slot not in (1, 2): raise ValueError("slot must be 1 or 2")
-        ns = self._math_ns(math)
-        self.s.write(f"{ns}:SOUR{slot} {src}")
+        self.s.write(self._mcmd(":SOUR1 %s" if slot == 1 else ":SOUR2 %s", math) % (src,))
 
     def set_math_operator(self, math: int, op: MathOperator | str = MathOperator.ADD) -> None:
         ns = self._math_ns(math)
         self.s.write(f"{ns}:OPERation {self._tok('math', op)}")
 
     def set_math_enabled(self, math: int, on: bool) -> None:
-        ns = self._math_ns(math)
-        self.s.write(f"{ns}:DISPlay {'ON' if on else 'OFF'}")
+        self.s.write(self._mcmd(":DISPlay ON" if on else ":DISPlay OFF", math))
 
     def enable_math(self, math: int, on: bool, op: MathOperator | str = MathOperator.ADD) -> None:
-        self.set_math_operator(math, op)
-        self.set_math_enabled(math, on)
+        ns = self._math_ns(math)
+        self.s.write_batch((f"{ns}:OPERation {self._tok('math', op)}",
+                            f"{ns}:DISPlay {self._bstr(on)}"))
 
     def set_math_scale(self, math: int, v_per_div: float) -> None:
-        ns = self._math_ns(math)
-        self.s.write(f"{ns}:SCALe {v_per_div}")
+        self.s.write(self._mcmd(":SCALe %s", math) % (v_per_div,))
 
     def set_math_offset(self, math: int, volts: float) -> None:
-        ns = self._math_ns(math)
-        self.s.write(f"{ns}:OFFSet {volts}")
+        self.s.write(self._mcmd(":OFFSet %s", math) % (volts,))
 
 
 # Example model specialization via regex
@@ -951,17 +1613,16 @@ class RigolMSO2k4k(RigolScope):
 # ---------------------------
 # Adapter selection
 # ---------------------------
+def _all_brand_adapters() -> tuple[type[BrandAdapter], ...]:
+    r = BrandAdapter._sorted_registry
+    if r is None:  # first pick, or a subclass registered since
+        r = BrandAdapter._sorted_registry = tuple(
+            sorted(BrandAdapter._registry, key=lambda c: (-len(c.__mro__), c.__name__)))
+    return r
+
+@functools.lru_cache(maxsize=128)
 def pick_adapter(idn: str) -> type[BaseAdapter]:
-    candidates: list[type[BrandAdapter]] = []
-    for obj in globals().values():
-        if isinstance(obj, type):
-            try:
-                if issubclass(obj, BrandAdapter) and obj is not BrandAdapter:
-                    candidates.append(obj)  # type: ignore
-            except Exception:
-                pass
-    candidates.sort(key=lambda c: (-len(c.mro()), c.__name__))
-    for Cls in candidates:
+    for Cls in _all_brand_adapters():
         try:
             if hasattr(Cls, "matches") and Cls.matches(idn):  # type: ignore
                 return getattr(Cls, "select", lambda _idn: Cls)(idn)  # type: ignore
@@ -969,6 +1630,47 @@ def pick_adapter(idn: str) -> type[BaseAdapter]:
             continue
     return BaseAdapter
 
+# ---------------------------
+# Shared default ResourceManager
+# ---------------------------
+# Opening an RM can take seconds (NI-VISA), so scopes built without rm=
+# share one; it is closed when its last user closes.
+_SHARED_RM = None                  # current default RM, or None
+_RM_USERS: dict[int, list] = {}    # id(rm) -> [rm, users]
+_RM_LOCK = threading.Lock()
+
+def _acquire_default_rm():
+    global _SHARED_RM
+    with _RM_LOCK:
+        if _SHARED_RM is None:
+            _SHARED_RM = pyvisa.ResourceManager()
+            _RM_USERS[id(_SHARED_RM)] = [_SHARED_RM, 0]
+        _RM_USERS[id(_SHARED_RM)][1] += 1
+        return _SHARED_RM
+
+def _release_default_rm(rm, *, stale: bool = False) -> None:
+    """
+    Drop one user of a shared RM; the last one closes it. stale=True also
+    retires it as the default, so the next connect() opens a fresh RM.
+    """
+    global _SHARED_RM
+    with _RM_LOCK:
+        ent = _RM_USERS.get(id(rm))
+        if ent is None or ent[0] is not rm:
+            return
+        if stale and _SHARED_RM is rm:
+            _SHARED_RM = None
+        ent[1] -= 1
+        if ent[1] > 0:
+            return
+        del _RM_USERS[id(rm)]
+        if _SHARED_RM is rm:
+            _SHARED_RM = None
+    try:
+        rm.close()
+    except Exception:
+        pass
+
 # ---------------------------
 # Public façade
 # ---------------------------
@@ -984,23 +1686,35 @@ class Oscilloscope:
         rm: Optional["pyvisa.ResourceManager"] = None,
         retries: int = 10,
         retry_delay: float = 0.1,
+        retry_cap: float = 2.0,
         defer_init_io: bool = True,
+        strict_errors: bool = True,
+        raw_socket: bool = False,
+        identity: Optional[str] = None,
     ):
         self.address = visa_address
         self.timeout_ms = int(timeout_ms)
         self.check_errors = check_errors
+        self.strict_errors = strict_errors
         self.wait_opc = wait_opc
         self.logger = logger or logging.getLogger(__name__ + ".scope")
         self.rm = rm
+        self._shared_rm = False  # self.rm is the shared default (see _acquire_default_rm)
         self._defer_init_io = defer_init_io
         self._resource = None
         self._session: Optional[_Session] = None
         self._adapter: Optional[BaseAdapter] = None
         self._connected = False
-        self.identity: Optional[str] = None
+        self.identity: Optional[str] = identity
+        # *IDN? string supplied by the caller (e.g. from an earlier scan): no query in initialize()
+        self._known_identity = identity
         # optional global retry tuning for session
         self._retries = retries
-        self._retry_delay = retry_delay
+        self._retry_delay = retry_delay  # backoff base
+        self._retry_cap = retry_cap
+        # opt-in: TCPIP::host::port::SOCKET without an explicit rm talks to the
+        # socket directly instead of through VISA
+        self._raw_socket = raw_socket
 
     def connect(self) -> None:
         """Connect to self.address using VISA only. On VI_ERROR_RSRC_NFOUND,
@@ -1010,7 +1724,6 @@ class Oscilloscope:
         if self._connected:
             return
 
-        import time
         from typing import Optional
 
         VI_ERR_NOT_FOUND = getattr(getattr(pyvisa, "constants", object),
@@ -1020,10 +1733,14 @@ class Oscilloscope:
 
         for attempt in range(self._retries + 1):
             try:
-                if self.rm is None:
-                    self.rm = pyvisa.ResourceManager()
+                if self._raw_socket and self.rm is None and _is_socket_address(self.address):
+                    self._resource = _RawSocketResource.from_address(self.address, self.timeout_ms)
+                else:
+                    if self.rm is None:
+                        self.rm = _acquire_default_rm()
+                        self._shared_rm = True
 
-                self._resource = self.rm.open_resource(self.address)
+                    self._resource = self.rm.open_resource(self.address)
 
                 # Configure terminations early
                 try:
@@ -1034,7 +1751,8 @@ class Oscilloscope:
                 self._resource.timeout = self.timeout_ms
 
                 # Bind session
-                self._session = _Session(self._resource, self.check_errors, self.wait_opc, self.logger)
+                self._session = _Session(self._resource, self.check_errors, self.wait_opc, self.logger,
+                                         strict_errors=self.strict_errors)
                 self._connected = True
                 if not self._defer_init_io:
                     self.initialize()
@@ -1056,17 +1774,22 @@ class Oscilloscope:
                     except Exception:
                         pass
                     try:
-                        if self.rm is not None:
+                        if self._shared_rm:
+                            _release_default_rm(self.rm, stale=True)
+                        elif self.rm is not None:
                             try: self.rm.close()
                             except Exception: pass
                     finally:
                         self.rm = None  # force fresh RM next loop
+                        self._shared_rm = False
 
                 if attempt < self._retries:
-                    time.sleep(self._retry_delay)
+                    # jittered so several scopes do not rebuild their RMs in lockstep
+                    time.sleep(_backoff(attempt, self._retry_delay, self._retry_cap))
                     continue
                 break
 
+        self._drop_shared_rm()
         raise ScopeError(f"Failed to connect to {self.address} after {self._retries + 1} attempts") from last_err
 
     def initialize(self) -> None:
@@ -1074,9 +1797,37 @@ class Oscilloscope:
             raise NotConnectedError("Not connected; call connect() first.")
         if self._adapter is not None and self.identity is not None:
             return
-        self.identity = self._session.query("*IDN?").strip()
+        self.identity = self._known_identity or self._session.query("*IDN?").strip()
         Adapter = pick_adapter(self.identity or "")
         self._adapter = Adapter(self._session, self.identity or "")
+        self._bind_adapter()
+
+    # façade methods that only forward to the adapter with the same signature;
+    # while connected they are bound straight to the adapter on the instance
+    _PASSTHROUGH = (
+        "set_channel_enabled", "is_channel_enabled",
+        "set_time_scale", "get_time_scale", "set_time_position",
+        "get_channel_scale", "get_channel_offset", "set_channel_scale", "set_channel_offset",
+        "set_channel_coupling", "set_channel_units", "get_channel_units",
+        "set_probe_attenuation", "get_probe_attenuation", "set_probe_sensitivity", "get_probe_sensitivity",
+        "set_trigger", "get_trigger_sweep", "get_trigger_status", "run", "stop", "single", "force_trigger",
+        "set_math_source", "set_math_operator", "set_math_enabled", "enable_math",
+        "set_math_scale", "set_math_offset",
+        "get_measure", "get_measures", "enable_measure", "clear_measures",
+        "enable_measure_stats", "clear_measure_stats", "measure_stats",
+        "screenshot_png", "screenshot_png_into", "screenshot_png_async", "menu_off",
+    )
+
+    def _bind_adapter(self) -> None:
+        """Skip the façade frame for _PASSTHROUGH calls (not for names a subclass overrides)."""
+        cls = type(self)
+        for name in self._PASSTHROUGH:
+            if getattr(cls, name) is getattr(Oscilloscope, name):
+                setattr(self, name, getattr(self._adapter, name))
+
+    def _unbind_adapter(self) -> None:
+        for name in self._PASSTHROUGH:
+            self.__dict__.pop(name, None)  # back to the checking façade methods
 
     # ---- Thin façade → adapter ----
     @require_connected
@@ -1090,47 +1841,66 @@ class Oscilloscope:
         return self._adapter.is_channel_enabled(ch)
 
 
-    @require_connected
-    def set_time_scale(self, sec_per_div: float) -> None: self._adapter.set_time_scale(sec_per_div)  # type: ignore
-    @require_connected
-    def get_time_scale(self) -> float: return self._adapter.get_time_scale()  # type: ignore
-    @require_connected
-    def set_time_position(self, sec: float) -> None: self._adapter.set_time_position(sec)  # type: ignore
+    def set_time_scale(self, sec_per_div: float) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.set_time_scale(sec_per_div)  # type: ignore
 
+    def get_time_scale(self) -> float:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        return self._adapter.get_time_scale()  # type: ignore
 
-    @require_connected
-    def get_channel_scale(self, ch: int) -> float: return self._adapter.get_channel_scale(ch)  # type: ignore
-    @require_connected
-    def get_channel_offset(self, ch: int) -> float: return self._adapter.get_channel_offset(ch)  # type: ignore
+    def set_time_position(self, sec: float) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.set_time_position(sec)  # type: ignore
+
+
+    def get_channel_scale(self, ch: int) -> float:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        return self._adapter.get_channel_scale(ch)  # type: ignore
+
+    def get_channel_offset(self, ch: int) -> float:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        return self._adapter.get_channel_offset(ch)  # type: ignore
+
+    def set_channel_scale(self, ch: int, v_per_div: float) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.set_channel_scale(ch, v_per_div)  # type: ignore
+
+    def set_channel_offset(self, ch: int, volts: float) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.set_channel_offset(ch, volts)  # type: ignore
+
+    def set_channel_coupling(self, ch: int, mode: str) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.set_channel_coupling(ch, mode)  # type: ignore
 
-    @require_connected
-    def set_channel_scale(self, ch: int, v_per_div: float) -> None: self._adapter.set_channel_scale(ch, v_per_div)  # type: ignore
-    @require_connected
-    def set_channel_offset(self, ch: int, volts: float) -> None: self._adapter.set_channel_offset(ch, volts)  # type: ignore
-    @require_connected
-    def set_channel_coupling(self, ch: int, mode: str) -> None: self._adapter.set_channel_coupling(ch, mode)  # type: ignore
     @require_connected
     def set_channel_units(self, ch: int, unit: ChannelUnit | str) -> None: self._adapter.set_channel_units(ch, unit)
     @require_connected
     def get_channel_units(self, ch: int) -> ChannelUnit | str: return self._adapter.get_channel_units(ch)
 
-    @require_connected
-    def set_probe_attenuation(self, ch: int, factor: float) -> None: self._adapter.set_probe_attenuation(ch, factor)  # type: ignore
-    @require_connected
-    def get_probe_attenuation(self, ch: int) -> float: return self._adapter.get_probe_attenuation(ch)  # type: ignore
+    def set_probe_attenuation(self, ch: int, factor: float) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.set_probe_attenuation(ch, factor)  # type: ignore
+
+    def get_probe_attenuation(self, ch: int) -> float:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        return self._adapter.get_probe_attenuation(ch)  # type: ignore
+
     @require_connected
     def set_probe_sensitivity(self, ch: int, v_per_a: float) -> None: self._adapter.set_probe_sensitivity(ch, v_per_a)  # type: ignore
     @require_connected
     def get_probe_sensitivity(self, ch: int) -> float: return self._adapter.get_probe_sensitivity(ch)  # type: ignore
 
-    @require_connected
     def set_trigger(self, *, edge_src: str = "CHAN1", level: float = 0.0, slope: str = "POS") -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
         self._adapter.set_trigger(edge_src=edge_src, level=level, slope=slope)  # type: ignore
 
     @require_connected
-    def set_trigger_sweep(self, mode: TriggerSweepMode | str) -> None: 
+    def set_trigger_sweep(self, mode: TriggerSweepMode | str, *, verify: bool = False):
+        """Set the sweep mode; with verify=True read it back and return it."""
         self._adapter.set_trigger_sweep(mode)  # type: ignore
-        self._adapter.get_trigger_sweep()
+        return self._adapter.get_trigger_sweep() if verify else None
 
     @require_connected
     def get_trigger_sweep(self) -> TriggerSweepMode | str: return self._adapter.get_trigger_sweep()  # type: ignore
@@ -1138,14 +1908,21 @@ class Oscilloscope:
     @require_connected
     def get_trigger_status(self) -> bool: return self._adapter.get_trigger_status()  # type: ignore
 
-    @require_connected
-    def run(self) -> None: self._adapter.run()  # type: ignore
-    @require_connected
-    def stop(self) -> None: self._adapter.stop()  # type: ignore
-    @require_connected
-    def single(self) -> None: self._adapter.single()  # type: ignore
-    @require_connected
-    def force_trigger(self) -> None: self._adapter.force_trigger()  # type: ignore
+    def run(self) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.run()  # type: ignore
+
+    def stop(self) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.stop()  # type: ignore
+
+    def single(self) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.single()  # type: ignore
+
+    def force_trigger(self) -> None:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        self._adapter.force_trigger()  # type: ignore
 
     @require_connected
     def set_math_source(self, math: int, slot: int, src: str) -> None:
@@ -1172,10 +1949,17 @@ class Oscilloscope:
     def set_math_offset(self, math: int, volts: float) -> None:
         self._adapter.set_math_offset(math, volts)  # type: ignore
 
-    @require_connected
     def get_measure(self, kind: Measure | str, src: str = "CHAN1", src2: str | None = None) -> float:
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
         return self._adapter.get_measure(kind, src, src2)
     
+
+    @require_connected
+    def get_measures(self, reqs: Iterable[tuple], per_msg: int = 8, *,
+                     partial: bool = False) -> list[float | None]:
+        """Several (kind, src, src2) measurements, batched per_msg queries per round-trip."""
+        return self._adapter.get_measures(reqs, per_msg, partial=partial)
+
     @require_connected
     def enable_measure(self, kind: Measure | str, src: str = "CHAN1", src2: str | None = None):
         self._adapter.enable_measure(kind, src, src2)
@@ -1200,6 +1984,16 @@ class Oscilloscope:
     def screenshot_png(self) -> bytes:
         return self._adapter.screenshot_png()  # type: ignore
 
+    @require_connected
+    def screenshot_png_into(self, out: bytearray | None = None) -> memoryview:
+        """screenshot_png() without a fresh bytes object per call; see BaseAdapter.screenshot_png_into."""
+        return self._adapter.screenshot_png_into(out)  # type: ignore
+
+    @require_connected
+    def screenshot_png_async(self) -> Future:
+        """Like screenshot_png() but returns a Future[bytes] immediately."""
+        return self._adapter.screenshot_png_async()  # type: ignore
+
     @require_connected
     def menu_off(self) -> None:
         """Turn off on-screen menus to get a clean screenshot."""
@@ -1207,10 +2001,10 @@ class Oscilloscope:
 
 
     @require_connected
-    def write_raw(self, cmd: str) -> None:
-        """Send a SCPI command string as-is."""
+    def write_raw(self, cmd: str, needs_opc: bool | None = None) -> None:
+        """Send a SCPI command string as-is (needs_opc: see _Session.write)."""
         assert self._session is not None
-        self._session.write(cmd)
+        self._session.write(cmd, needs_opc)
 
     @require_connected
     def query_raw(self, cmd: str) -> str:
@@ -1218,10 +2012,44 @@ class Oscilloscope:
         assert self._session is not None
         return self._session.query(cmd)
 
+    async def awrite_raw(self, cmd: str) -> None:
+        """write_raw() without blocking the event loop."""
+        if not self._connected:
+            raise NotConnectedError(_NOT_CONNECTED)
+        await self._session.awrite(cmd)
+
+    async def aquery_raw(self, cmd: str) -> str:
+        """query_raw() without blocking the event loop."""
+        if not self._connected:
+            raise NotConnectedError(_NOT_CONNECTED)
+        return await self._session.aquery(cmd)
+
+    @require_connected
+    def refresh_logging(self) -> None:
+        """Pick up logger level changes made after connect() (SCPI trace on/off)."""
+        self._session.refresh_log_level()
+
+    @contextmanager
+    def coalesce_writes(self):
+        """
+        Collect setter writes made inside the block and send them as compound
+        messages on exit (see _Session.defer). Queries flush first.
+        """
+        if not self._connected: raise NotConnectedError(_NOT_CONNECTED)
+        with self._session.defer():
+            yield self
+
+    @require_connected
+    def check_errors_now(self) -> None:
+        """Drain SYST:ERR? immediately. Useful with strict_errors=False."""
+        self._session.verify()
+
     def close(self) -> None:
         if not self._connected:
             return
         try:
+            if self._session is not None:
+                self._session.shutdown()
             if self._resource is not None:
                 self._resource.close()
         finally:
@@ -1229,6 +2057,14 @@ class Oscilloscope:
             self._session = None
             self._adapter = None
             self._connected = False
+            self._unbind_adapter()
+            self._drop_shared_rm()
+
+    def _drop_shared_rm(self) -> None:
+        if self._shared_rm:
+            self._shared_rm = False
+            rm, self.rm = self.rm, None
+            _release_default_rm(rm)
 
 
     @require_connected
@@ -1247,15 +2083,20 @@ class Oscilloscope:
             # older backends may not support flush()
             pass
 
-        # 3) Non-blocking drain of residual device output.
+        # 3) Non-blocking drain of residual device output, in large chunks.
+        # read() stops at the termination char (byte-wise without one), so
+        # prefer read_bytes() with the backend chunk size raised to match.
+        old_cs = getattr(r, "chunk_size", None)
         try:
             old_to = r.timeout
             r.timeout = 50  # ms
+            if old_cs is not None and old_cs < _DRAIN_CHUNK:
+                r.chunk_size = _DRAIN_CHUNK
+            has_rb = hasattr(r, "read_bytes")
             while True:
                 try:
-                    # prefer byte-wise read if available
-                    if hasattr(r, "read_bytes"):
-                        r.read_bytes(1024)
+                    if has_rb:
+                        r.read_bytes(_DRAIN_CHUNK)
                     else:
                         r.read()
                 except Exception:
@@ -1265,6 +2106,11 @@ class Oscilloscope:
                 r.timeout = old_to
             except Exception:
                 pass
+            if old_cs is not None and old_cs < _DRAIN_CHUNK:
+                try:
+                    r.chunk_size = old_cs
+                except Exception:
+                    pass
 
         # 4) Clear SCPI status/errors if you also want a clean SCPI state.
         with self._session.suspend_checks():  # no auto-drain
@@ -1282,19 +2128,74 @@ class Oscilloscope:
 
 
     @require_connected
-    def wait_for_single_acq_complete(self, timeout_ms: int = 10000) -> bool:
-        import time
+    def wait_for_single_acq_complete(self, timeout_ms: int = 10000, *, srq: bool = False) -> bool:
+        """
+        Wait until the armed single acquisition has triggered.
+        srq=True arms *OPC with a service request and blocks in one
+        wait_on_event() instead of polling :TER?; only use it where :SING is
+        an overlapped command (OPC completes with the acquisition). Falls
+        back to polling when the backend has no event support.
+        """
+        if srq:
+            done = self._wait_srq(timeout_ms)
+            if done is not None:
+                return done
+
         deadline = time.monotonic() + timeout_ms / 1000.0
 
         # immediate check
         if self.get_trigger_status():
             return True
 
-        while time.monotonic() < deadline:
+        k = 0
+        while True:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                return False
+            # back off between :TER? round-trips; jitter keeps several scopes out of step
+            time.sleep(min(left, _backoff(k, 0.005, 0.2)))
+            k += 1
             if self.get_trigger_status():  # returns True when trigger occurred; also clears
                 return True
-            time.sleep(0.01)
-        return False
+
+    def _wait_srq(self, timeout_ms: int) -> bool | None:
+        """
+        *CLS;*ESE 1;*SRE 32;*OPC then wait for SRQ, holding the session I/O
+        lock throughout; *ESE/*SRE are restored afterwards. None if events
+        are unavailable.
+        """
+        r = self._resource
+        if not hasattr(r, "enable_event"):
+            return None
+        s = self._session
+        with s._io_lock:
+            try:
+                r.enable_event(EventType.service_request, EventMechanism.queue)
+            except Exception:
+                return None
+            ese, sre = 0, 0
+            try:
+                with s.suspend_checks():
+                    try:
+                        ese, sre = (int(float(v)) for v in s.query("*ESE?;*SRE?").strip().split(";"))
+                    except Exception:
+                        pass  # keep the power-on 0/0
+                    # *CLS first: a stale ESR OPC bit would raise SRQ at once
+                    s.write("*CLS;*ESE 1;*SRE 32;*OPC")  # OPC -> ESB -> SRQ
+                resp = r.wait_on_event(EventType.service_request, int(timeout_ms), capture_timeout=True)
+                return not resp.timed_out
+            finally:
+                try:
+                    r.disable_event(EventType.service_request, EventMechanism.queue)
+                    r.discard_events(EventType.service_request, EventMechanism.queue)
+                    r.read_stb()  # clears RQS
+                except Exception:
+                    pass
+                try:
+                    with s.suspend_checks():
+                        s.write(f"*ESE {ese};*SRE {sre}")
+                except Exception:
+                    pass
 
     @require_connected
     def reset(self, opc_timeout_ms: int = 8000) -> None:
@@ -1307,18 +2208,16 @@ class Oscilloscope:
     @staticmethod
     def _snap125_up(x: float) -> float:
         if x <= 0: return 0.0
-        e = floor(log10(x)); m = x / (10**e)
-        for b in (1.0, 2.0, 5.0, 10.0):
-            if m <= b + 1e-12: return b * (10**e)
-        return 10.0 * (10**e)
+        e = floor(log10(x)); p = 10**e
+        i = bisect_left(_STEPS_125, x / p - 1e-12)  # first step >= mantissa
+        return _STEPS_125[i if i < 4 else 3] * p
 
     @staticmethod
     def _snap125_down(x: float) -> float:
         if x <= 0: return 0.0
-        e = floor(log10(x)); m = x / (10**e)
-        for b in (10.0, 5.0, 2.0, 1.0):
-            if m >= b - 1e-12: return b * (10**e)
-        return 1.0 * (10**e)
+        e = floor(log10(x)); p = 10**e
+        i = bisect_right(_STEPS_125, x / p + 1e-12) - 1  # last step <= mantissa
+        return _STEPS_125[i if i > 0 else 0] * p
 
     @staticmethod
     def _round_sig2(x: float) -> float:
@@ -1331,6 +2230,9 @@ class Oscilloscope:
         return float(self.get_channel_scale(ch)), float(self.get_channel_offset(ch))
 
     def _get_vextrema(self, ch: int) -> Tuple[float, float]:
+        both = getattr(self._adapter, "_get_vmax_vmin", None)
+        if both is not None:
+            return both(ch)  # one round-trip
         vmax = float(self.get_measure(Measure.VMAX, src=f"CHAN{ch}"))
         vmin = float(self.get_measure(Measure.VMIN, src=f"CHAN{ch}"))
         return vmax, vmin
@@ -1346,15 +2248,19 @@ class Oscilloscope:
         try:
             self.set_channel_scale(ch, vdiv_target)
         except Exception:
-            pass  # scope might still change scale or clamp offset
-        return self._safe_get(ch)
+            pass  # scope might still change scale
+        # only the scale is read back; the offset is the last one read by
+        # autoscale_channel() (_try_set_offset keeps it current)
+        return float(self.get_channel_scale(ch)), self._as_offs
 
     def _try_set_offset(self, ch: int, volts: float) -> Tuple[bool, float]:
         try:
             self.set_channel_offset(ch, volts)
-            return True, float(self.get_channel_offset(ch))
+            ok = True
         except Exception:
-            return False, float(self.get_channel_offset(ch))  # readback anyway
+            ok = False
+        self._as_offs = float(self.get_channel_offset(ch))  # readback anyway
+        return ok, self._as_offs
 
     # ---------- fit check (80% window) ----------
     @staticmethod
@@ -1373,14 +2279,11 @@ class Oscilloscope:
             If either offset is refused or fit breaks, revert to last good and stop.
         Returns: (final_v_per_div, final_offset_volts)
         """
-        # Ensure channel visible
-        try:
-            if not self.is_channel_enabled(ch):
-                self.set_channel_enabled(ch, True)
-        except Exception:
-            self.set_channel_enabled(ch, True)
+        # Ensure channel visible (idempotent: no need to ask first)
+        self.set_channel_enabled(ch, True)
 
         vdiv, offs = self._safe_get(ch)
+        self._as_offs = offs
 
         # ---- Phase A: ensure visibility by zooming OUT, no offset changes ----
         for _ in range(max_iters):
@@ -1473,6 +2376,17 @@ class Oscilloscope:
                 out["calls"][name] = {"ok": False, "err": f"{type(e).__name__}: {e}"}
                 return None
 
+        def _call_batch(*items) -> None:
+            # plain setters, sent as one compound message; if the batch is
+            # rejected, replay one by one so each call gets its own verdict
+            try:
+                with self.coalesce_writes():
+                    for name, fn, *a in items:
+                        _call(name, fn, *a)
+            except Exception:
+                for name, fn, *a in items:
+                    _call(name, fn, *a)
+
         # Timebase
         _call("set_time_scale", self.set_time_scale, 1e-3)
         _call("get_time_scale", self.get_time_scale)
@@ -1484,10 +2398,10 @@ class Oscilloscope:
 
         _call("get_channel_scale", self.get_channel_scale, 1)
         _call("get_channel_offset", self.get_channel_offset, 1)
-        _call("set_channel_scale", self.set_channel_scale, 1, 1.0)
-        _call("set_channel_offset", self.set_channel_offset, 1, 0.0)
-        _call("set_channel_coupling", self.set_channel_coupling, 1, "DC")
-        _call("set_channel_units", self.set_channel_units, 1, ChannelUnit.VOLT)
+        _call_batch(("set_channel_scale", self.set_channel_scale, 1, 1.0),
+                    ("set_channel_offset", self.set_channel_offset, 1, 0.0),
+                    ("set_channel_coupling", self.set_channel_coupling, 1, "DC"),
+                    ("set_channel_units", self.set_channel_units, 1, ChannelUnit.VOLT))
         _call("get_channel_units", self.get_channel_units, 1)
 
         #Probe
@@ -1506,10 +2420,10 @@ class Oscilloscope:
 
         # Math: configure math channel 1
         math = 1
-        _call("set_math_source_m1_s1", self.set_math_source, math, 1, src)
-        _call("set_math_source_m1_s2", self.set_math_source, math, 2, "CHAN2")
-        _call("set_math_scale_m1", self.set_math_scale, math, 0.5)
-        _call("set_math_offset_m1", self.set_math_offset, math, 0.5)
+        _call_batch(("set_math_source_m1_s1", self.set_math_source, math, 1, src),
+                    ("set_math_source_m1_s2", self.set_math_source, math, 2, "CHAN2"),
+                    ("set_math_scale_m1", self.set_math_scale, math, 0.5),
+                    ("set_math_offset_m1", self.set_math_offset, math, 0.5))
 
         # --- Math operators: iterate ALL tokens with enable/disable ---
         out["math_ops"] = {}
@@ -1534,7 +2448,7 @@ class Oscilloscope:
         # Screenshot
         _call("menu_off", self.menu_off)
         img = _call("screenshot_png", self.screenshot_png)
-        if out["calls"]["screenshot_png"]["ok"] and not (isinstance(img, (bytes, bytearray)) and len(img) > 0):
+        if out["calls"]["screenshot_png"]["ok"] and not (isinstance(img, (bytes, bytearray, memoryview)) and len(img) > 0):
             out["calls"]["screenshot_png"] = {"ok": False, "err": "no image bytes"}
 
         # Raw I/O sanity
@@ -1547,15 +2461,23 @@ class Oscilloscope:
         })
 
 
-        for t in tokens:
-            needs_two = getattr(type(self._adapter), "MEAS_SIGNATURES", {}).get(t, 1) == 2
-            val = _call(
-                f"get_measure[{t}]",
-                self.get_measure,
-                t,
-                src,
-                ("CHAN2" if needs_two else None),
-            )
+        two_src = type(self._adapter).TWO_SOURCE_MEASURES
+        reqs = [(t, src, ("CHAN2" if t in two_src else None)) for t in tokens]
+        # 8 queries per round-trip; kinds without a numeric reply (or every
+        # kind of a chunk the instrument rejected) are retried one by one
+        for i in range(0, len(reqs), 8):
+            chunk = reqs[i:i + 8]
+            try:
+                vals = self.get_measures(chunk, partial=True)
+            except Exception:
+                vals = [None] * len(chunk)
+            for req, v in zip(chunk, vals):
+                name = f"get_measure[{req[0]}]"
+                if v is None:
+                    _call(name, self.get_measure, *req)
+                else:
+                    out["calls"][name] = {"ok": True}
+                out["measurements"][req[0]] = out["calls"][name]["ok"]
 
 
         return out
@@ -1565,54 +2487,160 @@ class Oscilloscope:
 # ---------------------------
 # Mock for tests
 # ---------------------------
+# Deliberately pure Python (no Cython/.pxd): the package is a setuptools
+# pure-Python wheel and the mock must import wherever the drivers do. The hot
+# path is kept cheap instead: bytes-keyed dispatch, slotted ScopeState.
+# fixed command keywords (literals, so interned): set/dict membership is one
+# hash probe that usually short-circuits on identity. Write headers are bytes:
+# the mock's write path works on the ASCII-encoded command.
+_MOCK_NOOP_WRITES = frozenset({b":RUN", b":STOP", b":SING", b":TFOR", b":HCOP:IMM"})
+_MOCK_STATEFUL_QUERIES = frozenset({"*IDN?", ":TIM:SCAL?"})
+_MOCK_FIXED_REPLIES = {"*OPC?": "1\n", "*ESR?": "0\n", "SYST:ERR?": "0,\"No error\"\n"}
+
+def _mock_png() -> bytes:
+    """A valid 1x1 grey PNG, built once for the mock's screenshot replies."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 0, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(b"\x00\x80"))
+            + chunk(b"IEND", b""))
+
+_MOCK_PNG = _mock_png()
+# the same image as a :DISP:DATA? reply: IEEE 488.2 definite-length block + terminator
+_MOCK_PNG_BLOCK = b"#%d%d" % (len(str(len(_MOCK_PNG))), len(_MOCK_PNG)) + _MOCK_PNG + b"\n"
+
+@functools.lru_cache(maxsize=64)
+def _mock_const_reply(cmd: str) -> str | None:
+    """MockScopeResource reply to a single query; None if it depends on mock state."""
+    u = cmd.strip().upper()
+    if u in _MOCK_STATEFUL_QUERIES: return None
+    return _MOCK_FIXED_REPLIES.get(u, "\n")
+
+@dataclasses.dataclass(slots=True)
+class ScopeState:
+    """MockScopeResource instrument state: flat fields, fixed-offset attribute access."""
+    tim_scal: float = 1e-3
+    tim_pos: float = 0.0
+    chan: Dict[int, Dict[str, Any]] = dataclasses.field(
+        default_factory=lambda: {1: {"scal": 1.0, "offs": 0.0, "coup": "DC"}})
+    trig_mode: str = "EDGE"
+    trig_src: str = "CHAN1"
+    trig_lev: float = 0.0
+    trig_slope: str = "POS"
+    err: list = dataclasses.field(default_factory=list)
+    bin: bytes = _MOCK_PNG  # hardcopy (read_raw) image
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The state in the older nested-dict layout ("tim:scal", "trig": {...}, ...)."""
+        return {
+            "tim:scal": self.tim_scal, "tim:pos": self.tim_pos, "chan": self.chan,
+            "trig": {"mode": self.trig_mode, "src": self.trig_src,
+                     "lev": self.trig_lev, "slope": self.trig_slope},
+            "err": self.err, "bin": self.bin,
+        }
+
 class MockScopeResource:
     def __init__(self, idn: str = "RIGOL TECHNOLOGIES,MSO2072A,DS2A000001,00.01"):
         self.idn = idn
         self.timeout = 5000
         self.write_termination = "\n"
         self.read_termination = "\n"
-        self.state: Dict[str, Any] = {
-            "tim:scal": 1e-3, "tim:pos": 0.0,
-            "chan": {1: {"scal": 1.0, "offs": 0.0, "coup": "DC"}},
-            "trig": {"mode": "EDGE", "src": "CHAN1", "lev": 0.0, "slope": "POS"},
-            "err": [],
-            "bin": b"\x89PNG\r\n\x1a\n...",  # fake PNG header
-        }
+        self.state = ScopeState()
+        self._out = memoryview(b"")  # pending binary reply for read_bytes()
 
     def write(self, cmd: str):
-        u = cmd.strip().upper()
-        if u.startswith(":TIM:SCAL "): self.state["tim:scal"] = float(cmd.split()[-1])
-        elif u.startswith(":TIM:POS "): self.state["tim:pos"] = float(cmd.split()[-1])
-        elif ":SCAL " in u and ":CHAN" in u:  # :CHANn:SCAL v
-            ch = int(u.split(":CHAN")[1].split(":")[0])
-            self.state["chan"].setdefault(ch, {"scal":1.0,"offs":0.0,"coup":"DC"})
-            self.state["chan"][ch]["scal"] = float(cmd.split()[-1])
-        elif ":OFFS " in u and ":CHAN" in u:
-            ch = int(u.split(":CHAN")[1].split(":")[0])
-            self.state["chan"].setdefault(ch, {"scal":1.0,"offs":0.0,"coup":"DC"})
-            self.state["chan"][ch]["offs"] = float(cmd.split()[-1])
-        elif ":COUP " in u and ":CHAN" in u:
-            ch = int(u.split(":CHAN")[1].split(":")[0])
-            self.state["chan"].setdefault(ch, {"scal":1.0,"offs":0.0,"coup":"DC"})
-            self.state["chan"][ch]["coup"] = cmd.split()[-1].upper()
-        elif u.startswith(":TRIG:MODE"): self.state["trig"]["mode"] = cmd.split()[-1].upper()
-        elif u.startswith(":TRIG:EDGE:SOUR"): self.state["trig"]["src"] = cmd.split()[-1].upper()
-        elif u.startswith(":TRIG:EDGE:SLOP"): self.state["trig"]["slope"] = cmd.split()[-1].upper()
-        elif u.startswith(":TRIG:LEV"): self.state["trig"]["lev"] = float(cmd.split()[-1])
-        elif u in {":RUN", ":STOP", ":SING", ":TFOR"}: pass
-        elif u.startswith(":DISP:DATA?"): pass
-        elif u == ":HCOP:IMM": pass
+        if ";" not in cmd:  # single command: no split list
+            return self._write_one(cmd)
+        one = self._write_one
+        for part in cmd.split(";"):
+            one(part)
+
+    def write_many(self, cmds: Iterable[str]):
+        """Several program messages in one call: one join, one split pass."""
+        self.write(";".join(cmds))
+
+    # write handlers, fn(self, arg, u_arg): last argument as sent / upper-cased, as bytes
+    # (numbers parse from arg, keywords come from u_arg: no second upper()).
+    # float() straight from bytes is already the fastest parse here: an
+    # int() fast path for "0"/"20" measured about twice as slow.
+    def _w_tim_scal(self, arg, u_arg): self.state.tim_scal = float(arg)
+    def _w_tim_pos(self, arg, u_arg): self.state.tim_pos = float(arg)
+    def _w_trig_mode(self, arg, u_arg): self.state.trig_mode = u_arg.decode()
+    def _w_trig_src(self, arg, u_arg): self.state.trig_src = u_arg.decode()
+    def _w_trig_slope(self, arg, u_arg): self.state.trig_slope = u_arg.decode()
+    def _w_trig_lev(self, arg, u_arg): self.state.trig_lev = float(arg)
+    def _w_disp_data(self, arg, u_arg): self._out = memoryview(_MOCK_PNG_BLOCK)  # no copy, no re-render
+
+    # exact header -> handler; anything unlisted (:RUN, :STOP, :HCOP:IMM, ...) is accepted and ignored.
+    # (An exec()-generated if/elif chain over the same headers measured slower than this one probe.)
+    _WRITE_DISPATCH = {
+        b":TIM:SCAL": _w_tim_scal, b":TIM:POS": _w_tim_pos,
+        b":TRIG:MODE": _w_trig_mode, b":TRIG:EDGE:SOUR": _w_trig_src,
+        b":TRIG:EDGE:SLOP": _w_trig_slope, b":TRIG:LEV": _w_trig_lev,
+        b":DISP:DATA?": _w_disp_data, b":DISPLAY:DATA?": _w_disp_data,
+    }
+    # headers that also match longer forms (":TRIG:EDGE:SOURce", ":TRIG:LEVel"),
+    # matched in one pass by a single anchored alternation (longest first)
+    _WRITE_PREFIXES = {b":TRIG:MODE": _w_trig_mode, b":TRIG:EDGE:SOUR": _w_trig_src,
+                       b":TRIG:EDGE:SLOP": _w_trig_slope, b":TRIG:LEV": _w_trig_lev}
+    _write_prefix = re.compile(b"|".join(
+        map(re.escape, sorted(_WRITE_PREFIXES, key=len, reverse=True)))).match
+    # :CHANn:<key> v -> state.chan[n][<field>], (field, numeric)
+    _CHAN_FIELDS = {b"SCAL": ("scal", True), b"OFFS": ("offs", True), b"COUP": ("coup", False)}
+
+    def _write_one(self, cmd: str):
+        # SCPI is ASCII: encode once, then bytes.upper() and bytes keys (no Unicode tables)
+        cmd = cmd.strip().encode("ascii", "ignore")
+        u = cmd.upper()
+        if u in _MOCK_NOOP_WRITES:
+            return
+        head, _, rest = u.partition(b" ")
+        arg = cmd.rpartition(b" ")[2]  # one slice, no token list
+        u_arg = rest.rpartition(b" ")[2] if rest else head
+        fn = self._WRITE_DISPATCH.get(head)
+        if fn is not None:
+            return fn(self, arg, u_arg)
+        if head[:5] == b":CHAN":  # slice compare: no method lookup/call
+            n, _, key = head[5:].partition(b":")
+            f = self._CHAN_FIELDS.get(key)
+            if f is not None and b" " in u:
+                ch = int(n)
+                chan = self.state.chan.get(ch)
+                if chan is None:
+                    chan = self.state.chan[ch] = {"scal": 1.0, "offs": 0.0, "coup": "DC"}
+                chan[f[0]] = float(arg) if f[1] else u_arg.decode()
+            return
+        m = self._write_prefix(head)
+        if m is not None:
+            return self._WRITE_PREFIXES[m.group()](self, arg, u_arg)
 
     def query(self, cmd: str) -> str:
+        if ";" in cmd:  # compound: answer the query parts, run the rest as writes
+            out = []
+            for part in cmd.split(";"):
+                if "?" in part:
+                    out.append(self.query(part).rstrip("\n"))
+                else:
+                    self._write_one(part)
+            return ";".join(out) + "\n"
+        r = _mock_const_reply(cmd)  # repeated fixed queries: one dict hit
+        if r is not None:
+            return r
         u = cmd.strip().upper()
         if u == "*IDN?": return self.idn + "\n"
-        if u == "*OPC?": return "1\n"
-        if u == "SYST:ERR?": return "0,\"No error\"\n"
-        if u == ":TIM:SCAL?": return f"{self.state['tim:scal']}\n"
-        return "\n"
+        return f"{self.state.tim_scal}\n"  # :TIM:SCAL?
 
     def read_raw(self) -> bytes:
-        return self.state["bin"]
+        # bytes like pyvisa's read_raw(): screenshot_png() hands it back as is
+        return bytes(self.state.bin)
+
+    def read_bytes(self, count: int) -> bytes:
+        if count > len(self._out):
+            self._out = memoryview(b"")
+            raise TimeoutError("mock: no binary reply pending")
+        data, self._out = self._out[:count], self._out[count:]
+        return bytes(data)
 
     def close(self): pass
 
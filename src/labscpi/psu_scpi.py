@@ -33,8 +33,15 @@ Adapters can override specifics as needed.
 from __future__ import annotations
 
 import dataclasses
+import functools
 import logging
-from typing import Optional, Tuple, Dict, Type, Any
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Tuple, Dict, Type, Any, Callable, Iterable, Sequence
 import re
 
 try:
@@ -42,6 +49,11 @@ try:
 except Exception as e:  # pragma: no cover - imported at runtime
     pyvisa = None  # Library consumer must install pyvisa
 
+try:
+    import ahocorasick  # type: ignore  # pyahocorasick, optional
+except Exception:
+    ahocorasick = None
+
 
 # ---------------------------
 # Exceptions
@@ -74,20 +86,20 @@ class NotSupportedError(PSUError):
 # Utilities / Decorators
 # ---------------------------
 
+_NOT_CONNECTED = "Instrument not connected. Call connect() first."
+
 def require_connected(fn):
-    def wrapper(self, *args, **kwargs):
+    @functools.wraps(fn)
+    def wrapper(self, *a, **k):
         if not self._connected:
-            raise NotConnectedError("Instrument not connected. Call connect() first.")
-        return fn(self, *args, **kwargs)
-
-    wrapper.__name__ = fn.__name__
-    wrapper.__doc__ = fn.__doc__
+            raise NotConnectedError(_NOT_CONNECTED)
+        return fn(self, *a, **k)
     return wrapper
 
 def with_retries(max_retries: int = 1, delay: float = 0.0):
     """Retry a SCPI command on SCPIError or I/O error."""
-    import time
     def deco(fn):
+        @functools.wraps(fn)
         def wrapper(self, *args, **kwargs):
             last_exc = None
             for attempt in range(max_retries + 1):
@@ -96,7 +108,7 @@ def with_retries(max_retries: int = 1, delay: float = 0.0):
                 except (SCPIError, OSError) as e:
                     last_exc = e
                     if attempt < max_retries:
-                        if self.logger:
+                        if self.logger is not None and self.logger.isEnabledFor(logging.DEBUG):
                             self.logger.debug(
                                 "%s failed (%s), retry %d/%d",
                                 fn.__name__, e, attempt + 1, max_retries
@@ -109,7 +121,8 @@ def with_retries(max_retries: int = 1, delay: float = 0.0):
         return wrapper
     return deco
 
-_NUM_RE = re.compile(r'[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?')
+# re.A: ASCII \d, no Unicode digit tables; trailing units ("4.994V") are simply not matched
+_NUM_RE = re.compile(r'[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?', re.A)
 
 def _parse_number(resp: str) -> float:
     m = _NUM_RE.search(resp)
@@ -117,6 +130,78 @@ def _parse_number(resp: str) -> float:
         raise ValueError(f"no numeric value in response: {resp!r}")
     return float(m.group(0))
 
+# Command templates, built once: %-formatting is cheaper than f-strings (as in eload_scpi);
+# %s keeps the value exactly as the f-strings sent it
+_CMD_VOLT = "SOUR:VOLT %s"
+_CMD_CURR = "SOUR:CURR %s"
+_CMD_OVP = "SOUR:VOLT:PROT %s"
+_CMD_OCP = "SOUR:CURR:PROT %s"
+# channel select strings for the usual channel counts
+_CMD_NSEL = {ch: f"INST:NSEL {ch}" for ch in range(1, 9)}
+
+# *ESR? QYE|DDE|EXE|CME: set whenever an error entered the queue
+_ESR_ERROR_BITS = 0x3C
+
+# first "<code>,<message>" entry of a SYST:ERR:ALL? reply ('-222,"Data out of range",-113,...')
+_ERR_ENTRY_RE = re.compile(r'\s*([-+]?\d+)\s*,\s*("(?:[^"]|"")*"|[^,]*)', re.A)
+
+def _err_code(s: str) -> int:
+    """Code of a SYST:ERR? reply ("0,\"No error\"", "-200,..."); unparsable counts as an error."""
+    try:
+        return int(s.split(",")[0].strip())   # handles "0", "+0", "-200", etc.
+    except ValueError:
+        return 1
+
+def _is_command_error(e: Exception) -> bool:
+    """True for an SCPIError carrying a command error (-100..-199: header/syntax not understood)."""
+    if not isinstance(e, SCPIError):
+        return False
+    return -199 <= _err_code(str(e).rpartition("': ")[2]) <= -100
+
+class _AsyncWriter:
+    """
+    One worker thread sending queued fire-and-forget writes in order (see
+    PowerSupply async_writes). After a failed write the rest of the queue is
+    dropped; flush() re-raises that error.
+    """
+    __slots__ = ("_send", "_q", "_exc", "_thread")
+
+    def __init__(self, send: Callable[[str], None]) -> None:
+        self._send = send
+        self._q: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._exc: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._run, name="psu-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        q = self._q
+        while True:
+            cmd = q.get()
+            try:
+                if cmd is None:
+                    return
+                if self._exc is None:
+                    self._send(cmd)
+            except Exception as e:
+                self._exc = e
+            finally:
+                q.task_done()
+
+    def put(self, cmd: str) -> None:
+        self._q.put(cmd)
+
+    def flush(self) -> None:
+        """Block until everything queued has been sent."""
+        self._q.join()
+        exc, self._exc = self._exc, None
+        if exc is not None:
+            raise exc
+
+    def close(self) -> None:
+        """Send what is still queued, then stop the thread (errors are dropped)."""
+        self._q.put(None)
+        self._thread.join()
+
 # ---------------------------
 # Low-level session wrapper
 # ---------------------------
@@ -126,74 +211,466 @@ class _Session:
     check_errors: bool = True
     wait_opc: bool = True
     logger: Optional[logging.Logger] = None
+    _dbg: bool = False
     _last_cmd: Optional[str] = None
+    _compound: bool = True
+    esr_gate: bool = True
+    err_all: bool = False
+    _write_raw: Any = None
+    _wterm: bytes = b""
+    _aw: Optional[_AsyncWriter] = None
+    batch_queries: bool = False
 
     def __init__(
-        self, resource, check_errors=True, wait_opc=True, logger=None):
+        self, resource, check_errors=True, wait_opc=True, logger=None, esr_gate=True):
         self.resource = resource
         self.check_errors = check_errors
         self.wait_opc = wait_opc
         self.logger = logger
+        self._dbg = False
+        self.refresh_log_level()
         self._last_cmd = None
+        # cmd;*OPC?;<status> in one transaction; cleared if the instrument can't chain
+        self._compound = True
+        self.esr_gate = esr_gate  # check *ESR? before reading SYST:ERR?
+        # whole queue in one SYST:ERR:ALL? reply; set by adapters that support it
+        self.err_all = False
+        self.refresh_termination()
+        # background sender for send_async(); any other I/O drains it first
+        self._aw = None
+        # fold *ESR? into queries (cmd;*ESR?); switched on by selftest_interface
+        self.batch_queries = False
+
+    def refresh_log_level(self) -> None:
+        """Re-sample the logger's DEBUG state (call after changing log levels)."""
+        self._dbg = self.logger is not None and self.logger.isEnabledFor(logging.DEBUG)
+
+    def refresh_termination(self) -> None:
+        """Re-sample the resource's write termination (call after changing it)."""
+        # plain writes go out as ASCII bytes via write_raw(), skipping PyVISA's
+        # per-call termination checks and encoding; resources without it use write()
+        self._write_raw = getattr(self.resource, "write_raw", None)
+        self._wterm = (getattr(self.resource, "write_termination", None) or "").encode("ascii")
+
+    def _send(self, cmd: str) -> None:
+        if self._write_raw is not None:
+            self._write_raw(cmd.encode("ascii") + self._wterm)
+        else:
+            self.resource.write(cmd)
+
+    def start_async(self) -> None:
+        if self._aw is None:
+            self._aw = _AsyncWriter(self._send)
+
+    def stop_async(self) -> None:
+        aw, self._aw = self._aw, None
+        if aw is not None:
+            aw.close()
+
+    def send_async(self, cmd: str) -> None:
+        """_send(cmd) on the background writer if started, else right away."""
+        if self._aw is not None:
+            if self._dbg: self.logger.debug("→ (queued) %s", cmd)
+            self._aw.put(cmd)
+        else:
+            self._send(cmd)
+
+    def flush(self) -> None:
+        """Wait for queued send_async() writes; re-raises a failed one."""
+        if self._aw is not None:
+            self._aw.flush()
+
+    @property
+    def _status_query(self) -> str:
+        # status part of compound messages: the one-byte *ESR?, or the error queue itself
+        return "*ESR?" if self.esr_gate else ":SYST:ERR?"
 
     def write(self, cmd: str) -> None:
+        if self._aw is not None:
+            self._aw.flush()
         self._last_cmd = cmd
-        if self.logger:
-            self.logger.debug("→ %s", cmd)
-        self.resource.write(cmd)
+        if self._dbg: self.logger.debug("→ %s", cmd)
+        if self.check_errors and self.wait_opc and self._compound and "?" not in cmd:
+            self._write_compound(cmd)
+            return
+        self._send(cmd)
         if self.check_errors:
             self._drain_error_queue()
         if self.wait_opc:
+            # *OPC? blocks in the instrument until the command is done: no polling.
+            # SRQ (*ESE/*SRE + wait_on_event) would only add round-trips for
+            # setpoint commands that finish in milliseconds; the scope uses it
+            # for long acquisitions.
             self.query("*OPC?")
             if self.check_errors:
                 self._drain_error_queue()
 
+    def _write_compound(self, cmd: str) -> None:
+        """
+        Send cmd, *OPC? and the status query (*ESR?, or SYST:ERR? without the
+        ESR gate) as a single query: one round-trip instead of write + OPC +
+        error polls.
+        """
+        try:
+            resp = self.resource.query(f"{cmd};*OPC?;{self._status_query}")
+        except Exception as e:
+            # The instrument may already have run cmd (*RST, *TRG, output
+            # toggles...): never resend it, report the failure instead.
+            if self._dbg: self.logger.debug("Compound write failed (%s)", e)
+            self._recover_compound()
+            raise
+        if self._dbg: self.logger.debug("← %s", resp.strip())
+        _opc, sep, status = resp.strip().partition(";")
+        if not sep:
+            # replies came back as separate messages: pick up the status reply, if any
+            self._compound = False
+            try:
+                status = self.resource.read().strip()
+            except Exception:
+                self._drain_error_queue()
+                return
+        self._check_status(status)
+
+    def _clear_input(self) -> None:
+        """Drop unread reply bytes after a failed transaction (device clear where supported)."""
+        clear = getattr(self.resource, "clear", None)
+        if clear is not None:
+            try:
+                clear()
+            except Exception:
+                pass
+
+    def _recover_compound(self) -> None:
+        """
+        After a compound message failed: clear stale input, then tell "chaining
+        unsupported" from a failure of the command itself with a side-effect-free
+        *OPC?;*OPC?. Only when that fails too are separate messages used from now on.
+        Errors queued by the failed message or the probe are read out unreported.
+        """
+        self._clear_input()
+        try:
+            ok = ";" in self.resource.query("*OPC?;*OPC?")
+        except Exception:
+            ok = False
+        self._clear_error_queue()
+        if not ok:
+            if self._dbg: self.logger.debug("Compound messages unsupported; using separate messages")
+            self._clear_input()
+            self._compound = False
+
+    def _check_status(self, field: str) -> None:
+        """Raise on the status field of a compound reply (*ESR? value or SYST:ERR? entry)."""
+        if self.esr_gate:
+            try:
+                esr = int(field)
+            except ValueError:
+                self.esr_gate = False  # no usable *ESR?; poll SYST:ERR? directly
+                self._read_error_queue()
+                return
+            if esr & _ESR_ERROR_BITS:
+                self._read_error_queue()
+            return
+        if _err_code(field) != 0:
+            self._clear_error_queue()
+            raise SCPIError(f"Instrument error after '{self._last_cmd}': {field}")
+
+    def write_many(self, cmds: Iterable[str]) -> None:
+        """
+        Send several commands as one ';:'-joined message (one *OPC?/SYST:ERR? at
+        the end), or one by one when the instrument can't chain.
+        """
+        parts = [c.strip().lstrip(":") for c in cmds]
+        if not self._compound:
+            for c in parts:
+                self.write(c)
+        elif parts:
+            self.write(";:".join(parts))
+
+    def write_query(self, write_cmd: str, query_cmd: str) -> str:
+        """
+        write_cmd then query_cmd as one transaction, with *OPC? and SYST:ERR?
+        folded in when enabled. Returns the reply to query_cmd only.
+        """
+        if self._aw is not None:
+            self._aw.flush()
+        self._last_cmd = write_cmd
+        if not self._compound:
+            self.write(write_cmd)
+            return self.query(query_cmd)
+        parts = [write_cmd]
+        if self.wait_opc:
+            parts.append("*OPC?")
+        parts.append(query_cmd)
+        if self.check_errors:
+            parts.append(self._status_query)
+        msg = ";".join(parts)
+        if self._dbg: self.logger.debug("→ %s", msg)
+        try:
+            resp = self.resource.query(msg)
+        except Exception as e:
+            # write_cmd may already have run: do not send it again
+            if self._dbg: self.logger.debug("Compound write/query failed (%s)", e)
+            self._recover_compound()
+            raise
+        if self._dbg: self.logger.debug("← %s", resp.strip())
+        n = len(parts) - 1
+        fields = resp.strip().split(";", n - 1)  # the error text may itself contain ';'
+        if len(fields) != n:
+            # e.g. query_cmd unsupported: no stale remainder for the next probe form
+            self._recover_compound()
+            status = fields[-1]
+            if self.check_errors and (not self.esr_gate or status.lstrip("+-").isdigit()):
+                self._check_status(status)  # status is always last: report the real error
+            raise SCPIError(f"Expected {n} replies to '{msg}', got {resp.strip()!r}")
+        if self.check_errors:
+            self._check_status(fields[-1])
+        return fields[1 if self.wait_opc else 0]
+
     def query(self, cmd: str) -> str:
-        if self.logger:
-            self.logger.debug("? %s", cmd)
+        if self._aw is not None:
+            self._aw.flush()
+        if self._dbg: self.logger.debug("? %s", cmd)
+        if (self.batch_queries and self.check_errors and self.esr_gate and self._compound
+                and "SYST:ERR" not in cmd.upper()):
+            return self._query_compound(cmd)
+        return self._query_separate(cmd)
+
+    def _query_separate(self, cmd: str) -> str:
         resp = self.resource.query(cmd)
-        if self.logger:
-            self.logger.debug("← %s", resp.strip())
+        if self._dbg: self.logger.debug("← %s", resp.strip())
         if self.check_errors and not cmd.strip().upper().startswith("SYST:ERR?"):
             self._drain_error_queue()
         return resp
 
+    @contextmanager
+    def batching_queries(self):
+        """Within the block, fold *ESR? into every query (see _query_compound)."""
+        prev, self.batch_queries = self.batch_queries, True
+        try:
+            yield
+        finally:
+            self.batch_queries = prev
+
+    def _query_compound(self, cmd: str) -> str:
+        """cmd;*ESR? as one query: the reply and the error check in one round-trip."""
+        try:
+            resp = self.resource.query(f"{cmd};*ESR?")
+        except Exception as e:
+            # clear what is left of the reply; batching stays on unless chaining itself fails
+            if self._dbg: self.logger.debug("Compound query failed (%s); asking separately", e)
+            self._recover_compound()
+            return self._query_separate(cmd)
+        if self._dbg: self.logger.debug("← %s", resp.strip())
+        # *ESR? is a plain integer, so the last ';' separates it from cmd's reply
+        body, sep, status = resp.strip().rpartition(";")
+        if not sep:
+            # Only the status came back (cmd gave no reply, e.g. an unknown
+            # header): report the error, never hand the *ESR? value back as cmd's answer
+            if status.lstrip("+-").isdigit():
+                self._check_status(status)
+            else:
+                self._recover_compound()
+            raise SCPIError(f"No reply to '{cmd}' (got {resp.strip()!r})")
+        self._check_status(status)
+        return body
+
     @staticmethod
     def _parse_bool(s: str) -> bool:
         u = s.strip().upper()
         return u in {"1", "ON", "TRUE"}
 
     def _drain_error_queue(self) -> None:
+        if self.esr_gate:
+            # One *ESR? tells whether anything was queued since the last check
+            try:
+                esr = int(self.resource.query("*ESR?").strip())
+            except Exception:
+                self.esr_gate = False  # no usable *ESR?; poll SYST:ERR? directly
+            else:
+                if not esr & _ESR_ERROR_BITS:
+                    return
+        self._read_error_queue()
+
+    def _read_error_queue(self) -> None:
+        if self.err_all:
+            self._read_error_queue_all()
+            return
         try:
             for _ in range(16):
                 s = self.resource.query("SYST:ERR?").strip()
-                if self.logger:
-                    self.logger.debug("ERR? %s", s)
+                if self._dbg: self.logger.debug("ERR? %s", s)
                 if not s:
                     break
-                code_str = s.split(",")[0].strip()
-                try:
-                    code = int(code_str)   # handles "0", "+0", "-200", etc.
-                except ValueError:
-                    # if parsing fails, assume nonzero
-                    code = 1
-                if code == 0:
+                if _err_code(s) == 0:
                     break
+                self._clear_error_queue()
                 raise SCPIError(f"Instrument error after '{self._last_cmd}': {s}")
         except SCPIError:
             raise
         except Exception as e:
-            if self.logger:
-                self.logger.debug("Error queue check skipped: %s", e)
+            if self._dbg: self.logger.debug("Error queue check skipped: %s", e)
+
+    def _read_error_queue_all(self) -> None:
+        """One SYST:ERR:ALL? empties the queue; raise on its first entry."""
+        try:
+            s = self.resource.query("SYST:ERR:ALL?").strip()
+        except Exception as e:
+            if self._dbg: self.logger.debug("SYST:ERR:ALL? failed, polling SYST:ERR?: %s", e)
+            self.err_all = False
+            self._read_error_queue()
+            return
+        if self._dbg: self.logger.debug("ERR:ALL? %s", s)
+        m = _ERR_ENTRY_RE.match(s)
+        if m is None:
+            self.err_all = False  # not understood after all; poll SYST:ERR? from now on
+            self._read_error_queue()
+            return
+        if int(m.group(1)) != 0:
+            raise SCPIError(f"Instrument error after '{self._last_cmd}': {m.group(0)}")
+
+    def _clear_error_queue(self) -> None:
+        """Read out any further queued errors without raising (after one was reported)."""
+        try:
+            for _ in range(16):
+                s = self.resource.query("SYST:ERR?").strip()
+                if self._dbg: self.logger.debug("ERR? %s", s)
+                if not s or _err_code(s) == 0:
+                    break
+        except Exception:
+            pass
+
+
+# ---------------------------
+# Raw socket transport (TCPIP::host::port::SOCKET without VISA)
+# ---------------------------
+class _RawSocketResource:
+    """
+    The subset of a pyvisa MessageBasedResource that _Session and the
+    adapters use, over a plain TCP socket with TCP_NODELAY. Socket errors are
+    raised as pyvisa's VisaIOError, like a VISA resource would.
+    """
+
+    def __init__(self, host: str, port: int, timeout_ms: int = 3000):
+        try:
+            self._sock = socket.create_connection((host, port), timeout=timeout_ms / 1000.0)
+        except OSError as e:
+            raise self._visa_error(e) from e
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._timeout = timeout_ms
+        self.write_termination = "\n"
+        self.read_termination = "\n"
+        self._buf = bytearray(4096)   # persistent receive buffer
+        self._rx = bytearray()        # bytes received but not yet consumed
+        # a read timed out: its reply may still arrive, drop it before the next write
+        self._stale = False
+
+    @staticmethod
+    def _visa_error(e: OSError) -> Exception:
+        """The VisaIOError a VISA socket resource raises for this socket error."""
+        sc = pyvisa.constants.StatusCode
+        code = sc.error_timeout if isinstance(e, socket.timeout) else sc.error_connection_lost
+        return pyvisa.errors.VisaIOError(code)
+
+    @classmethod
+    def from_address(cls, address: str, timeout_ms: int = 3000) -> "_RawSocketResource":
+        parts = address.split("::")
+        if len(parts) < 4:
+            raise ValueError(f"not a TCPIP socket address: {address!r}")
+        return cls(parts[1], int(parts[2]), timeout_ms)
+
+    @property
+    def timeout(self) -> int:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, ms) -> None:
+        self._timeout = ms
+        self._sock.settimeout(None if ms is None else ms / 1000.0)
+
+    def write(self, cmd: str) -> None:
+        self.write_raw((cmd + (self.write_termination or "")).encode("ascii"))
+
+    def write_raw(self, data: bytes) -> None:
+        if self._stale:
+            self.clear()
+        try:
+            self._sock.sendall(data)
+        except OSError as e:
+            raise self._visa_error(e) from e
+
+    def read_raw(self) -> bytes:
+        term = (self.read_termination or "\n").encode("ascii")
+        while True:
+            i = self._rx.find(term)
+            if i >= 0:
+                i += len(term)
+                out = bytes(self._rx[:i])
+                del self._rx[:i]
+                return out
+            try:
+                n = self._sock.recv_into(self._buf)
+            except OSError as e:
+                if isinstance(e, socket.timeout):
+                    self._stale = True
+                raise self._visa_error(e) from e
+            if not n:
+                raise self._visa_error(ConnectionError("socket closed by instrument"))
+            self._rx += memoryview(self._buf)[:n]
+
+    def read(self) -> str:
+        term = self.read_termination or ""
+        s = self.read_raw().decode("ascii", errors="replace")
+        return s[:-len(term)] if term and s.endswith(term) else s
+
+    def query(self, cmd: str) -> str:
+        self.write(cmd)
+        return self.read()
+
+    def clear(self) -> None:
+        # drop buffered bytes and whatever has already arrived on the socket
+        self._rx.clear()
+        self._stale = False
+        try:
+            self._sock.setblocking(False)
+            while self._sock.recv_into(self._buf):
+                pass
+        except OSError:
+            pass
+        finally:
+            self.timeout = self._timeout
+
+    def close(self) -> None:
+        try:
+            self._sock.close()
+        finally:
+            self._rx.clear()
+
+
+def _is_socket_address(address: str) -> bool:
+    u = address.upper()
+    return u.startswith("TCPIP") and u.endswith("::SOCKET")
 
 
 class BaseAdapter:
+    __slots__ = ("s", "idn", "_cur_ch", "_capab")
     brand: str = "Generic"
+    # _sel() is plain INST:NSEL, so _write_on() may fold it into the same message
+    _fuse_sel: bool = True
+    # measure_voltage_many() may try the "MEAS:VOLT? (@1,2,..)" channel-list form
+    _meas_chanlist: bool = True
+    # error queue can be read in one SYST:ERR:ALL? (see _Session.err_all)
+    _err_all: bool = False
+    # optional features (ovp, ocp, sense_remote, tracking) the model is known to
+    # lack; selftest_interface reports them as unsupported without sending anything
+    _unsupported: frozenset = frozenset()
 
 
     def __init__(self, session: _Session, idn: str):
         self.s = session
         self.idn = idn
+        self._cur_ch: Optional[int] = None  # last channel selected via _sel()
+        # command form that worked for each probed operation (see _probe_once)
+        self._capab: Dict[str, str] = {}
 
 
 
@@ -203,11 +680,12 @@ class BaseAdapter:
 
     def startup(self) -> None:
         """Run after adapter is selected and before first use."""
-        pass
+        self._cur_ch = None
+        self.s.err_all = self._err_all
 
     def shutdown(self) -> None:
         """Run before IO is torn down."""
-        pass
+        self._cur_ch = None
 
 
     # --- detection ---
@@ -226,82 +704,127 @@ class BaseAdapter:
         u = s.strip().upper()
         return u in {"1", "ON", "TRUE"}
 
-    def _get_master_out_state(self) -> Optional[bool]:
-        # Try common master-output queries
-        for q in ("OUTP:MAST?", "OUTP:GEN?", "OUTP:STAT?", "OUTP?"):
+    def _probe_once(self, key: str, candidates: Tuple[str, ...], run):
+        """
+        run(candidate) for each candidate form until one succeeds, and remember
+        the winner in _capab[key]: later calls send only that form (one
+        round-trip, no failed probes in the error queue). Only a command error
+        (form not understood) moves on to the next candidate; anything else is
+        raised as is. NotSupportedError when every form was rejected.
+        """
+        form = self._capab.get(key)
+        if form is not None:
+            return run(form)
+        last: Optional[Exception] = None
+        for form in candidates:
             try:
-                resp = self.s.query(q)
-                return self._parse_bool(resp)
-            except Exception:
+                r = run(form)
+            except Exception as e:
+                err = e
+                if not isinstance(e, SCPIError) and self.s.check_errors:
+                    # an unknown query often just times out; its error is queued
+                    try:
+                        self.s._drain_error_queue()
+                    except SCPIError as q:
+                        err = q
+                if not _is_command_error(err):
+                    raise err
+                last = err
                 continue
-        return None
+            self._capab[key] = form
+            return r
+        raise NotSupportedError(f"{key}: none of {candidates} accepted ({last})") from last
+
+    def _get_master_out_state(self) -> Optional[bool]:
+        # Try common master-output queries
+        try:
+            return self._probe_once("master_out_query", ("OUTP:MAST?", "OUTP:GEN?", "OUTP:STAT?", "OUTP?"),
+                                    lambda q: self._parse_bool(self.s.query(q)))
+        except Exception:
+            return None
 
     def _get_ch_out_state(self, ch: int) -> Optional[bool]:
+        # _capab["ch_out_query"] == "" records that neither state query works
+        if self._capab.get("ch_out_query") == "":
+            return None
         self._sel(ch)
-        for q in ("OUTP?", "OUTP:STAT?"):
-            try:
-                resp = self.s.query(q)
-                return self._parse_bool(resp)
-            except Exception:
-                continue
-        return None
+        try:
+            return self._probe_once("ch_out_query", ("OUTP?", "OUTP:STAT?"),
+                                    lambda q: self._parse_bool(self.s.query(q)))
+        except NotSupportedError:
+            self._capab["ch_out_query"] = ""
+            return None
+        except Exception:
+            return None  # transient: probe again next time
 
     # --- channel handling ---
     def _sel(self, ch: int) -> None:
+        if ch == self._cur_ch:
+            return
         if ch < 1:
             raise ChannelError("Channels are 1-based and must be >= 1")
         # Common selection pattern used by many vendors
         try:
-            self.s.write(f"INST:NSEL {ch}")
+            self.s.write(_CMD_NSEL.get(ch) or f"INST:NSEL {ch}")
         except Exception:
             # Fallback: some models use INST:SEL CHn
             self.s.write(f"INST:SEL CH{ch}")
+        self._cur_ch = ch
+
+    def _write_on(self, ch: int, cmds: Sequence[str]) -> None:
+        """Select ch and send cmds as one message (INST:NSEL folded in when allowed)."""
+        if not self._fuse_sel or ch == self._cur_ch:
+            self._sel(ch)
+            self.s.write_many(cmds)
+            return
+        if ch < 1:
+            raise ChannelError("Channels are 1-based and must be >= 1")
+        self._cur_ch = None  # unknown until the message went through
+        try:
+            self.s.write_many((_CMD_NSEL.get(ch) or f"INST:NSEL {ch}", *cmds))
+        except Exception:
+            # Classic path: _sel() with its INST:SEL CHn fallback, then the commands
+            self._sel(ch)
+            self.s.write_many(cmds)
+            return
+        self._cur_ch = ch
 
     # --- core operations ---
     def set_voltage(self, ch: int, volts: float) -> None:
         self._sel(ch)
-        self.s.write(f"SOUR:VOLT {volts}")
-        # Best-effort verification: read back setpoint or measurement if available
-        try:
-            # Some PSUs echo setpoint via SOUR:VOLT?; if not, fall back to MEAS
-            val = self.get_voltage_config(ch)
-            if abs(val - volts) > 0.01:
-                raise SCPIError(f"Voltage set verification failed (got {val}, want {volts})")
-        except Exception:
-            # Ignore if command unsupported; measurement may differ under load
-            raise
+        # Set and read back the setpoint in one transaction (the measurement may differ under load)
+        val = _parse_number(self.s.write_query(_CMD_VOLT % volts, ":SOUR:VOLT?"))
+        if abs(val - volts) > 0.01:
+            raise SCPIError(f"Voltage set verification failed (got {val}, want {volts})")
 
     def set_current(self, ch: int, amps: float) -> None:
         self._sel(ch)
-        self.s.write(f"SOUR:CURR {amps}")
-        try:
-            val = self.get_current_config(ch)
-            if abs(val - amps) > 0.01:
-                raise SCPIError(f"Current set verification failed (got {val}, want {amps})")
-        except Exception:
-            raise
+        val = _parse_number(self.s.write_query(_CMD_CURR % amps, ":SOUR:CURR?"))
+        if abs(val - amps) > 0.01:
+            raise SCPIError(f"Current set verification failed (got {val}, want {amps})")
 
     def set_max_current(self, ch: int) -> None:
         self._sel(ch)
         # Common command to set current limit to max rated current
-        for cmd in ("SOUR:CURR:LIM MAX", "SOUR:CURR MAX", "SOUR:CURR:MAX", "SOUR:CURR:LIMIT MAX"):
-            try:
-                self.s.write(cmd)
-                return
-            except Exception:
-                continue
-        raise NotSupportedError("Setting max current not supported on this model")
+        self._probe_once("set_imax_cmd",
+                         ("SOUR:CURR:LIM MAX", "SOUR:CURR MAX", "SOUR:CURR:MAX", "SOUR:CURR:LIMIT MAX"),
+                         self.s.write)
 
     def output(self, ch: int, on: bool) -> None:
-        # Per-channel output where possible; many units toggle selected channel
+        # Per-channel output where possible; many units toggle selected channel,
+        # some require channel-qualified output
         self._sel(ch)
-        try:
-            self.s.write(f"OUTP {self._bstr(on)}")
-        except Exception:
-            # Some require channel-qualified output
-            self.s.write(f"OUTP CH{ch},{self._bstr(on)}")
-        # Verify state when possible
-        st = self._get_ch_out_state(ch)
+        o = self._bstr(on)
+        q = self._capab.get("ch_out_query")
+        if q:
+            # State query known: switch and read back in one transaction
+            st = self._probe_once("output_cmd", ("OUTP {o}", "OUTP CH{ch},{o}"),
+                                  lambda t: self._parse_bool(self.s.write_query(t.format(ch=ch, o=o), q)))
+        else:
+            self._probe_once("output_cmd", ("OUTP {o}", "OUTP CH{ch},{o}"),
+                             lambda t: self.s.write(t.format(ch=ch, o=o)))
+            # Verify state when possible (probes the state query on first use)
+            st = self._get_ch_out_state(ch)
         if st is not None and st != on:
             raise SCPIError("Per-channel output state did not match requested value")
 
@@ -311,6 +834,27 @@ class BaseAdapter:
         v = self.s.query("MEAS:VOLT?")
         return _parse_number(v)
 
+    def measure_voltage_many(self, chs: Sequence[int]) -> Dict[int, float]:
+        """
+        Measure several channels, in one "MEAS:VOLT? (@1,2,..)" query when the
+        unit accepts channel lists; otherwise (or once rejected) one by one.
+        """
+        chs = list(chs)
+        if any(ch < 1 for ch in chs):
+            raise ChannelError("Channels are 1-based and must be >= 1")
+        # _capab["meas_chanlist"] == "" records a rejected channel-list form
+        if len(chs) > 1 and self._meas_chanlist and self._capab.get("meas_chanlist") != "":
+            try:
+                vals = _NUM_RE.findall(self.s.query(f"MEAS:VOLT? (@{','.join(map(str, chs))})"))
+                if len(vals) != len(chs):
+                    raise SCPIError(f"Channel-list reply has {len(vals)} values for {len(chs)} channels")
+            except Exception:
+                self._capab["meas_chanlist"] = ""
+            else:
+                self._capab["meas_chanlist"] = "MEAS:VOLT? (@...)"
+                return {ch: float(v) for ch, v in zip(chs, vals)}
+        return {ch: self.measure_voltage(ch) for ch in chs}
+
     def measure_current(self, ch: int) -> float:
         self._sel(ch)
         a = self.s.query("MEAS:CURR?")
@@ -330,14 +874,10 @@ class BaseAdapter:
 
     # --- optional features (best-effort) ---
     def set_ovp(self, ch: int, volts: float, on: bool = True) -> None:
-        self._sel(ch)
-        self.s.write(f"SOUR:VOLT:PROT {volts}")
-        self.s.write(f"SOUR:VOLT:PROT:STAT {self._bstr(on)}")
+        self._write_on(ch, (_CMD_OVP % volts, f"SOUR:VOLT:PROT:STAT {self._bstr(on)}"))
 
     def set_ocp(self, ch: int, amps: float, on: bool = True) -> None:
-        self._sel(ch)
-        self.s.write(f"SOUR:CURR:PROT {amps}")
-        self.s.write(f"SOUR:CURR:PROT:STAT {self._bstr(on)}")
+        self._write_on(ch, (_CMD_OCP % amps, f"SOUR:CURR:PROT:STAT {self._bstr(on)}"))
 
     def sense_remote(self, ch: int, on: bool) -> None:
         self._sel(ch)
@@ -345,81 +885,133 @@ class BaseAdapter:
 
     def tracking(self, mode: str) -> None:
         """Set tracking mode: 'INDEP', 'SERIES', or 'PARALLEL' if supported."""
+        self._cur_ch = None  # coupling channels may move the active selection
         self.s.write(f"OUTP:TRAC {mode}")
 
 
-    # --- optional features (best-effort) ---
-    def set_ovp(self, ch: int, volts: float, on: bool = True) -> None:
-        self._sel(ch)
-        self.s.write(f"SOUR:VOLT:PROT {volts}")
-        self.s.write(f"SOUR:VOLT:PROT:STAT {'ON' if on else 'OFF'}")
-
-    def set_ocp(self, ch: int, amps: float, on: bool = True) -> None:
-        self._sel(ch)
-        self.s.write(f"SOUR:CURR:PROT {amps}")
-        self.s.write(f"SOUR:CURR:PROT:STAT {'ON' if on else 'OFF'}")
-
-    def sense_remote(self, ch: int, on: bool) -> None:
-        self._sel(ch)
-        self.s.write(f"SENS:REM {'ON' if on else 'OFF'}")
-
-    def tracking(self, mode: str) -> None:
-        """Set tracking mode: 'INDEP', 'SERIES', or 'PARALLEL' if supported."""
-        self.s.write(f"OUTP:TRAC {mode}")
 
 
 
+@functools.lru_cache(maxsize=8)
+def _model_alt(models: tuple) -> Optional[re.Pattern]:
+    """
+    One case-insensitive alternation over every MODEL_PATTERNS regex of models.
+    Used as a one-scan pre-filter (a superset of the individual patterns);
+    None when there is nothing to union or the union does not compile.
+    """
+    pats = [rx.pattern for m in models for rx in getattr(m, "MODEL_PATTERNS", ())]
+    if not pats:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in pats), re.I)
+    except re.error:
+        return None
 
 
 class BrandAdapter(BaseAdapter):
 
     """Brand-level adapter with model registry and selection."""
+    __slots__ = ()
     _models: list[type["BrandAdapter"]] = []
+    # every subclass, kept sorted most-specific first (deepest MRO, then name)
+    _registry: list[type["BrandAdapter"]] = []
     brand: str | None = None
     vendor_aliases: tuple[str, ...] = ()   # <── new
-
+    _aliases_upper: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._aliases_upper = tuple(a.upper() for a in (cls.brand, *cls.vendor_aliases) if a)
+        reg = BrandAdapter._registry
+        reg.append(cls)
+        reg.sort(key=lambda c: (-len(c.__mro__), c.__name__))
+        pick_adapter.cache_clear()
+        global _ALIAS_AUTOMATON
+        _ALIAS_AUTOMATON = None
 
     @classmethod
-    def register_model(cls, model_cls): cls._models.append(model_cls); return model_cls
+    def register_model(cls, model_cls):
+        cls._models.append(model_cls)
+        # a new model can change the answer for an IDN seen before
+        BrandAdapter.select.cache_clear()
+        pick_adapter.cache_clear()
+        return model_cls
 
     @classmethod
+    @functools.lru_cache(maxsize=128)
     def select(cls, idn: str) -> type["BrandAdapter"]:
         u = idn.upper()
+        models = tuple(cls._models)  # cache key: a registration makes a new union
+        alt = _model_alt(models)
+        if alt is None or alt.search(u):  # no union hit: no model pattern can match
+            for m in models:
+                pats = getattr(m, "MODEL_PATTERNS", ())
+                if pats and any(rx.search(u) for rx in pats): return m
         for m in cls._models:
-            pats = getattr(m, "MODEL_PATTERNS", ())
-            if pats and any(rx.search(u) for rx in pats): return m
-        for m in cls._models:
-            if getattr(m, "matches", lambda _idn: False)(idn): return m
+            if _uses_alias_matches(m):
+                if _alias_match(m, u): return m
+            elif getattr(m, "matches", lambda _idn: False)(idn): return m
         return cls
 
     @classmethod
     def matches(cls, idn: str) -> bool:
         if cls is BrandAdapter: return False
-        u = idn.upper()
-        aliases = [cls.brand or ""] + list(cls.vendor_aliases)
-        return any(a.upper() in u for a in aliases if a)
+        return _alias_match(cls, idn.upper())
 
 
+# Aho-Corasick automaton over the aliases of every adapter that uses the
+# default alias-based BrandAdapter.matches(); rebuilt after new registrations.
+_ALIAS_AUTOMATON: Any = None
 
-def pick_adapter(idn: str) -> type[BaseAdapter]:
-    """Prefer model subclasses. Then fall back to brand.select(idn)."""
-    # Collect all concrete subclasses of BrandAdapter
-    candidates: list[type[BrandAdapter]] = []
-    for obj in globals().values():
-        if isinstance(obj, type):
-            try:
-                if issubclass(obj, BrandAdapter) and obj is not BrandAdapter:
-                    candidates.append(obj)  # type: ignore
-            except Exception:
-                pass
+def _uses_alias_matches(cls: type) -> bool:
+    return getattr(cls.matches, "__func__", None) is BrandAdapter.matches.__func__
 
-    # Sort: most specific first (deeper MRO), then by name for stability
-    candidates.sort(key=lambda c: (-len(c.mro()), c.__name__))
+def _alias_match(cls: type, u: str) -> bool:
+    """BrandAdapter.matches() on an IDN the caller already upper-cased."""
+    return any(a in u for a in cls._aliases_upper)
 
+def _alias_hits(u: str) -> Optional[set]:
+    """Adapters whose aliases occur in the upper-cased IDN (one pass), or None."""
+    global _ALIAS_AUTOMATON
+    if ahocorasick is None:
+        return None
+    if _ALIAS_AUTOMATON is None:
+        owners: Dict[str, list] = {}
+        for c in BrandAdapter._registry:
+            if _uses_alias_matches(c):
+                for a in c._aliases_upper:
+                    owners.setdefault(a, []).append(c)
+        A = ahocorasick.Automaton()
+        for a, cs in owners.items():
+            A.add_word(a, tuple(cs))
+        if owners:
+            A.make_automaton()
+        _ALIAS_AUTOMATON = A
+    if len(_ALIAS_AUTOMATON) == 0:
+        return set()
+    hits: set = set()
+    for _end, cs in _ALIAS_AUTOMATON.iter(u):
+        hits.update(cs)
+    return hits
+
+
+@functools.lru_cache(maxsize=128)
+def pick_adapter(idn: str) -> type[BaseAdapter]:
+    """Prefer model subclasses. Then fall back to brand.select(idn)."""
+    # BrandAdapter._registry: every subclass (wherever defined), most specific
+    # first (deeper MRO), then by name for stability; maintained at class creation.
+    u = idn.upper()  # once for every alias check below
+    hits = _alias_hits(u)
     # First try direct matches on the most specific classes (models first)
-    for Cls in candidates:
+    for Cls in BrandAdapter._registry:
         try:
-            if hasattr(Cls, "matches") and Cls.matches(idn):  # type: ignore
+            if not _uses_alias_matches(Cls):
+                ok = Cls.matches(idn)  # custom matches(): ask it directly
+            elif hits is not None:
+                ok = Cls in hits  # decided by the automaton
+            else:
+                ok = _alias_match(Cls, u)
+            if ok:
                 # If Cls is a model, this returns the model itself; if it's a brand, fallback to select()
                 chosen = getattr(Cls, "select", lambda _idn: Cls)(idn)  # type: ignore
                 return chosen  # type: ignore
@@ -432,46 +1024,49 @@ def pick_adapter(idn: str) -> type[BaseAdapter]:
 
 
 class RigolAdapter(BrandAdapter):
+    __slots__ = ()
     brand = "RIGOL"
     vendor_aliases = ("RIGOL TECHNOLOGIES",)
 
-    @staticmethod
-    def matches(idn: str) -> bool:
-        return "RIGOL" in idn.upper()
-
     def __init__(self, session: _Session, idn: str):
         super().__init__(session, idn)
 
     def _sel(self, ch: int) -> None:
+        if ch == self._cur_ch:
+            return
         if ch < 1:
             raise ChannelError("Channels are 1-based and must be >= 1")
         # Newer DP series support INST:NSEL; prefer it.
         try:
-            self.s.write(f"INST:NSEL {ch}")
+            self.s.write(_CMD_NSEL.get(ch) or f"INST:NSEL {ch}")
         except Exception:
             self.s.write(f"INST:SEL CH{ch}")
+        self._cur_ch = ch
 
     def output(self, ch: int, on: bool) -> None:
         # Rigol typically allows per-channel OUTP when a channel is selected
         try:
-            super().output(ch, on)
+            super().output(ch, on)  # switches and verifies
         except Exception:
             # Explicit form
             self.s.write(f"OUTP CH{ch},{self._bstr(on)}")
-        st = self._get_ch_out_state(ch)
-        if st is not None and st != on:
-            raise SCPIError("Rigol per-channel output verification failed")
+            st = self._get_ch_out_state(ch)
+            if st is not None and st != on:
+                raise SCPIError("Rigol per-channel output verification failed")
 
 
 
 class RohdeSchwarzAdapter(BrandAdapter):
+    __slots__ = ()
     brand = "Rohde&Schwarz"
     vendor_aliases = ("R&S","R\u0026S","ROHDE")
+    # only the NGx series answers SYST:ERR:ALL?; HMC/HMP need SYST:ERR?
+    _ERR_ALL_RX = re.compile(r",\s*NG[EMLPU]", re.I)
 
-    @staticmethod
-    def matches(idn: str) -> bool:
-        u = idn.upper()
-        return ("ROHDE" in u) or ("R&S" in u) or ("R\u0026S" in u)
+    def startup(self) -> None:
+        super().startup()
+        if self._ERR_ALL_RX.search(self.idn):
+            self.s.err_all = True
 
     def output(self, ch: int, on: bool) -> None:
         # R&S often requires selecting output channel, then OUTP:STAT
@@ -485,15 +1080,31 @@ class RohdeSchwarzAdapter(BrandAdapter):
 @BrandAdapter.register_model
 class TTICPX200DPAdapter(BrandAdapter):
     """TTI CPX200DP model-specific adapter using simplified command set."""
+    __slots__ = ()
     MODEL_PATTERNS = (re.compile(r"CPX200DP", re.I),)
     brand = "Aim-TTi"
     vendor_aliases = ("TTI", "Aim")
 
+    # Per-channel commands (channels 1-2), built once; _sel() validates ch first
+    _CMD_OP = {1: ("OP1 0", "OP1 1"), 2: ("OP2 0", "OP2 1")}
+    _CMD_V = {1: "V1 %.3f", 2: "V2 %.3f"}
+    _CMD_I = {1: "I1 %.3f", 2: "I2 %.3f"}
+    _Q_OP = {1: "OP1?", 2: "OP2?"}
+    _Q_V = {1: "V1?", 2: "V2?"}
+    _Q_I = {1: "I1?", 2: "I2?"}
+    _Q_VO = {1: "V1O?", 2: "V2O?"}
+    _Q_IO = {1: "I1O?", 2: "I2O?"}
+
     def startup(self) -> None:
         """Disable error checking - CPX200DP doesn't support SYST:ERR?"""
         self.s.check_errors = False
         super().startup()
 
+    _fuse_sel = False  # no selection command at all
+    _meas_chanlist = False  # V{ch}O? per channel, no MEAS:VOLT?
+    # the generic SOUR:*:PROT / SENS:REM / OUTP:TRAC forms are not in its command set
+    _unsupported = frozenset({"ovp", "ocp", "sense_remote", "tracking"})
+
     def _sel(self, ch: int) -> None:
         # CPX200DP is dual-output (channels 1-2 only)
         # Commands include channel number directly, no selection needed
@@ -503,7 +1114,7 @@ class TTICPX200DPAdapter(BrandAdapter):
     def output(self, ch: int, on: bool) -> None:
         # CPX200DP uses OP{ch} 1/0 syntax
         self._sel(ch)  # Validate channel only
-        self.s.write(f"OP{ch} {1 if on else 0}")
+        self.s.write(self._CMD_OP[ch][on])
         # Verify state
         st = self._get_ch_out_state(ch)
         if st is not None and st != on:
@@ -512,72 +1123,71 @@ class TTICPX200DPAdapter(BrandAdapter):
     def _get_ch_out_state(self, ch: int) -> Optional[bool]:
         # Query with OP{ch}? returns 1 or 0
         try:
-            resp = self.s.query(f"OP{ch}?")
+            resp = self.s.query(self._Q_OP[ch])
             return self._parse_bool(resp)
         except Exception:
             return None
 
+    @staticmethod
+    def _setpoint(resp: str) -> float:
+        # Response format: "V1 5.00" - parse after the "V1 " prefix (its digit is not the value)
+        return _parse_number(resp.strip().rpartition(" ")[2])
+
     def set_voltage(self, ch: int, volts: float) -> None:
-        # CPX200DP uses V{ch} {value} syntax
+        # CPX200DP uses V{ch} {value} syntax; V{ch}? in the same message reads it back
         self._sel(ch)  # Validate channel only
-        self.s.write(f"V{ch} {volts:.3f}")
+        val = self._setpoint(self.s.write_query(self._CMD_V[ch] % volts, self._Q_V[ch]))
+        if abs(val - volts) > 0.01:
+            raise SCPIError(f"Voltage set verification failed (got {val}, want {volts})")
 
     def set_current(self, ch: int, amps: float) -> None:
         # CPX200DP uses I{ch} {value} syntax
         self._sel(ch)  # Validate channel only
-        self.s.write(f"I{ch} {amps:.3f}")
+        val = self._setpoint(self.s.write_query(self._CMD_I[ch] % amps, self._Q_I[ch]))
+        if abs(val - amps) > 0.01:
+            raise SCPIError(f"Current set verification failed (got {val}, want {amps})")
 
     def get_voltage_config(self, ch: int) -> float:
         # Query V{ch}? returns "V{ch} {value}" format
         self._sel(ch)  # Validate channel only
-        resp = self.s.query(f"V{ch}?")
-        # Response format: "V1 5.00" - strip prefix and parse number
-        parts = resp.strip().split()
-        if len(parts) >= 2:
-            return _parse_number(parts[1])
-        return _parse_number(resp)
+        return self._setpoint(self.s.query(self._Q_V[ch]))
 
     def get_current_config(self, ch: int) -> float:
         # Query I{ch}? returns "I{ch} {value}" format
         self._sel(ch)  # Validate channel only
-        resp = self.s.query(f"I{ch}?")
-        # Response format: "I1 1.00" - strip prefix and parse number
-        parts = resp.strip().split()
-        if len(parts) >= 2:
-            return _parse_number(parts[1])
-        return _parse_number(resp)
+        return self._setpoint(self.s.query(self._Q_I[ch]))
 
     def measure_voltage(self, ch: int) -> float:
         # Query V{ch}O? returns value with unit suffix like "4.994V"
         self._sel(ch)  # Validate channel only
-        resp = self.s.query(f"V{ch}O?")
-        # Response format: "4.994V" - strip trailing 'V' and parse
-        return _parse_number(resp.rstrip('Vv'))
+        resp = self.s.query(self._Q_VO[ch])
+        # Response format: "4.994V" - the number regex stops at the unit
+        return _parse_number(resp)
 
     def measure_current(self, ch: int) -> float:
         # Query I{ch}O? returns value with unit suffix like "0.500A"
         self._sel(ch)  # Validate channel only
-        resp = self.s.query(f"I{ch}O?")
-        # Response format: "0.500A" - strip trailing 'A' and parse
-        return _parse_number(resp.rstrip('Aa'))
+        resp = self.s.query(self._Q_IO[ch])
+        # Response format: "0.500A" - the number regex stops at the unit
+        return _parse_number(resp)
 
 
 class AimTTiAdapter(BrandAdapter):
+    __slots__ = ()
     brand = "Aim-TTi"
-    vendor_aliases = ("TTI","Aim")
-
-    @staticmethod
-    def matches(idn: str) -> bool:
-        u = idn.upper()
-        return ("AIM-TTI" in u) or ("TTI" in u) or ("THURLBY" in u) or ("TTi" in idn)
+    vendor_aliases = ("TTI", "THURLBY")
+    _fuse_sel = False  # single-output units tolerate a failed INST:NSEL on ch 1
 
     def _sel(self, ch: int) -> None:
+        if ch == self._cur_ch:
+            return
         # Many Aim-TTi supplies are single-output; multi-output models may use INST:NSEL
         try:
-            self.s.write(f"INST:NSEL {ch}")
+            self.s.write(_CMD_NSEL.get(ch) or f"INST:NSEL {ch}")
         except Exception:
             if ch != 1:
                 raise NotSupportedError("This Aim-TTi model may not support multi-channel selection")
+        self._cur_ch = ch
 
     def output(self, ch: int, on: bool) -> None:
         # Some models use OUTP n,ON
@@ -588,13 +1198,9 @@ class AimTTiAdapter(BrandAdapter):
 
 
 class EAAdapter(BrandAdapter):
+    __slots__ = ()
     brand = "EA Elektro-Automatik"
-    vendor_aliases = ("ELEKTRO-AUTOMATIK", "EA-PS", "EA ")
-
-    @staticmethod
-    def matches(idn: str) -> bool:
-        u = idn.upper()
-        return ("ELEKTRO-AUTOMATIK" in u) or ("EA-" in u) or ("EA ") in u
+    vendor_aliases = ("ELEKTRO-AUTOMATIK", "EA-", "EA ")
 
     def output(self, ch: int, on: bool) -> None:
         # EA often uses OUTP:STAT ON
@@ -610,7 +1216,11 @@ class EAAdapter(BrandAdapter):
 @EAAdapter.register_model
 class EA9080Adapter(EAAdapter):
     """Elektro-Automatik PSU model 9080 specifics."""
+    __slots__ = ()
     MODEL_PATTERNS = (re.compile(r",9080", re.I),)
+    _fuse_sel = False  # single channel: _sel() only validates
+    _meas_chanlist = False
+    _unsupported = frozenset({"tracking"})  # nothing to couple
     
 
     def startup(self) -> None:
@@ -647,26 +1257,16 @@ class EA9080Adapter(EAAdapter):
             raise ChannelError("Only one channel available")
         return
 
-    def _get_ch_out_state(self, ch: int) -> Optional[bool]:
-        self._sel(ch)
-        for q in ("OUTP?", "OUTP:STAT?"):
-            try:
-                resp = self.s.query(q)
-                return self._parse_bool(resp)
-            except Exception:
-                continue
-        return None
-
     def output(self, ch: int, on: bool) -> None:
         # Rigol typically allows per-channel OUTP when a channel is selected
         try:
-            super().output(ch, on)
+            super().output(ch, on)  # switches and verifies
         except Exception:
             # Explicit form
             self.s.write(f"OUTP {self._bstr(on)}")
-        st = self._get_ch_out_state(ch)
-        if st is not None and st != on:
-            raise SCPIError("Rigol per-channel output verification failed")
+            st = self._get_ch_out_state(ch)
+            if st is not None and st != on:
+                raise SCPIError("Rigol per-channel output verification failed")
 
 
 
@@ -684,14 +1284,16 @@ ADAPTERS: Tuple[Type[BaseAdapter], ...] = (
 # ---------------------------
 # Public façade
 # ---------------------------
+# "vendor, model, serial, firmware" in one pass; missing fields match empty,
+# anything after a fifth comma is ignored
+_IDN_RE = re.compile(
+    r"\s*(?P<vendor>[^,]*?)\s*(?:,\s*(?P<model>[^,]*?)\s*(?:,\s*(?P<serial>[^,]*?)\s*"
+    r"(?:,\s*(?P<firmware>[^,]*?)\s*(?:,.*)?)?)?)?$",
+    re.S,
+)
+
 def _parse_idn(idn: str) -> Dict[str, str]:
-    parts = [p.strip() for p in (idn or "").split(',')]
-    return {
-        'vendor': parts[0] if len(parts) > 0 else '',
-        'model': parts[1] if len(parts) > 1 else '',
-        'serial': parts[2] if len(parts) > 2 else '',
-        'firmware': parts[3] if len(parts) > 3 else '',
-    }
+    return _IDN_RE.match(idn or "").groupdict("")
 
 class PowerSupply:
     """Brand-agnostic SCPI PSU controller using PyVISA.
@@ -710,7 +1312,19 @@ class PowerSupply:
         If provided, verbose SCPI trace is emitted at DEBUG level.
     rm : Optional[pyvisa.ResourceManager]
         Optionally pass an existing ResourceManager (advanced use/tests).
+    raw_socket : bool
+        For "TCPIP::host::port::SOCKET" addresses without an explicit rm, talk
+        to the socket directly instead of going through VISA (off by default).
+    async_writes : bool
+        Send write_direct() commands from a background thread so the caller
+        can go on preparing the next one. Any other command (and flush()) waits
+        for the queue first, so instrument order is unchanged.
     """
+    __slots__ = (
+        "address", "timeout_ms", "check_errors", "wait_opc", "logger", "rm",
+        "_defer_init_io", "_raw_socket", "_async_writes", "_resource", "_session", "_adapter",
+        "_connected", "identity",
+    )
 
     def __init__(
         self,
@@ -722,6 +1336,8 @@ class PowerSupply:
         logger: Optional[logging.Logger] = None,
         rm: Optional["pyvisa.ResourceManager"] = None,
         defer_init_io: bool = True,
+        raw_socket: bool = False,
+        async_writes: bool = False,
     ) -> None:
         self.address = visa_address
         self.timeout_ms = int(timeout_ms)
@@ -730,6 +1346,9 @@ class PowerSupply:
         self.logger = logger or logging.getLogger(__name__ + ".psu")
         self.rm = rm
         self._defer_init_io = defer_init_io
+        # TCPIP::host::port::SOCKET without an explicit rm: talk to the socket directly
+        self._raw_socket = raw_socket
+        self._async_writes = async_writes
 
         self._resource = None
         self._session: Optional[_Session] = None
@@ -743,15 +1362,23 @@ class PowerSupply:
             raise ImportError("pyvisa is not installed. Please 'pip install pyvisa'.")
         if self._connected:
             return
-        if self.rm is None:
-            self.rm = pyvisa.ResourceManager()  # auto-detect backend
-        self._resource = self.rm.open_resource(self.address)
+        if self._raw_socket and self.rm is None and _is_socket_address(self.address):
+            self._resource = _RawSocketResource.from_address(self.address, self.timeout_ms)
+        else:
+            if self.rm is None:
+                self.rm = pyvisa.ResourceManager()  # auto-detect backend
+            self._resource = self.rm.open_resource(self.address)
         # Termination defaults that work well for USB/TCPIP
         try:
             self._resource.write_termination = "\n"
             self._resource.read_termination = "\n"
         except Exception:
             pass
+        try:
+            # the whole reply (IDN, compound status replies) in one low-level read
+            self._resource.chunk_size = max(self._resource.chunk_size, 4096)
+        except Exception:
+            pass
         self._resource.timeout = self.timeout_ms
 
         self._session = _Session(
@@ -760,6 +1387,8 @@ class PowerSupply:
             wait_opc=self.wait_opc,
             logger=self.logger,
         )
+        if self._async_writes:
+            self._session.start_async()
         self._connected = True
         if self._defer_init_io:
             return
@@ -767,12 +1396,19 @@ class PowerSupply:
     def initialize(self) -> None:
         if not self._connected:
             raise NotConnectedError("Not connected; call connect() first.")
+        self._session.refresh_log_level()
         if self._adapter is not None and self.identity is not None:
             return
-        self.identity = self._session.query("*IDN?").strip()
-        info = _parse_idn(self.identity)
-        if self.logger:
-            self.logger.debug("IDN parsed: %s", info)
+        try:
+            # clear stale status/errors from an earlier session in the same round-trip
+            self.identity = self._session.query("*CLS;*IDN?").strip()
+        except Exception:
+            # the rejected compound is queued as an error: clear it unchecked
+            res = self._session.resource
+            res.write("*CLS")
+            self.identity = res.query("*IDN?").strip()
+        if self._session._dbg:
+            self.logger.debug("IDN parsed: %s", _parse_idn(self.identity))
         Adapter = pick_adapter(self.identity or "")
         self._adapter = Adapter(self._session, self.identity or "")
         # pass runtime options if you want toggles like autolock
@@ -785,6 +1421,8 @@ class PowerSupply:
         if not self._connected:
             return
         try:
+            if self._session is not None:
+                self._session.stop_async()
             if self._adapter is not None:
                 try:
                     self._adapter.shutdown()
@@ -804,10 +1442,23 @@ class PowerSupply:
         return self._connected
 
     # ----- config/runtime -----
+    @require_connected
+    def refresh_logging(self) -> None:
+        """Pick up logger level changes made after connect() (SCPI trace on/off)."""
+        assert self._session is not None
+        self._session.refresh_log_level()
+
+    @require_connected
+    def flush(self) -> None:
+        """Wait until queued write_direct() commands are sent (async_writes); re-raises a failed one."""
+        assert self._session is not None
+        self._session.flush()
+
     @require_connected
     def set_timeout(self, timeout_ms: int) -> None:
         self.timeout_ms = int(timeout_ms)
-        assert self._resource is not None
+        assert self._resource is not None and self._session is not None
+        self._session.flush()  # the async writer must not be mid-write
         self._resource.timeout = self.timeout_ms
 
     # ----- core API -----
@@ -852,7 +1503,8 @@ class PowerSupply:
     @require_connected
     def set_timeout(self, timeout_ms: int) -> None:
         self.timeout_ms = int(timeout_ms)
-        assert self._resource is not None
+        assert self._resource is not None and self._session is not None
+        self._session.flush()  # the async writer must not be mid-write
         self._resource.timeout = self.timeout_ms
 
     # ----- core API -----
@@ -889,16 +1541,31 @@ class PowerSupply:
         assert self._adapter is not None
         return self._adapter.measure_voltage(channel)
 
+    @require_connected
+    def measure_voltage_many(self, channels: Sequence[int]) -> Dict[int, float]:
+        assert self._adapter is not None
+        return self._adapter.measure_voltage_many(channels)
+
     @require_connected
     def measure_current(self, channel: int) -> float:
         assert self._adapter is not None
         return self._adapter.measure_current(channel)
 
+    @require_connected
+    @contextmanager
+    def selected(self, channel: int):
+        """Select channel once for a block of calls on it (later _sel() calls are skipped)."""
+        assert self._adapter is not None
+        self._adapter._sel(channel)
+        yield self
+
     # ----- raw passthrough -----
     @require_connected
     def write_raw(self, cmd: str) -> None:
         """Send a raw SCPI command."""
         assert self._session is not None
+        if self._adapter is not None:
+            self._adapter._cur_ch = None  # raw command may change the selection
         self._session.write(cmd)
 
     @require_connected
@@ -913,24 +1580,32 @@ class PowerSupply:
         """Configure serial parameters on an ASRL resource before calling initialize()."""
         if self._resource is None:
             raise NotConnectedError("Not connected.")
+        if self._session is not None:
+            self._session.flush()  # queued writes go out with the old settings
         if baud is not None: self._resource.baud_rate = baud
         if data_bits is not None: self._resource.data_bits = data_bits
         if stop_bits is not None: self._resource.stop_bits = stop_bits
         if parity is not None: self._resource.parity = parity
         if write_termination is not None: self._resource.write_termination = write_termination
         if read_termination is not None: self._resource.read_termination = read_termination
+        if self._session is not None:
+            self._session.refresh_termination()
 
     # ----- raw passthrough (no error/OPC check) -----
     @require_connected
     def write_direct(self, cmd: str) -> None:
         """Send a raw SCPI command directly to the instrument (no error/OPC checks)."""
         assert self._resource is not None
-        self._resource.write(cmd)
+        if self._adapter is not None:
+            self._adapter._cur_ch = None
+        assert self._session is not None
+        self._session.send_async(cmd)
 
     @require_connected
     def query_direct(self, cmd: str) -> str:
         """Send a raw SCPI query directly and return the response (no error/OPC checks)."""
         assert self._resource is not None
+        self._session.flush()
         return self._resource.query(cmd)
 
     # ----- optional features -----
@@ -960,7 +1635,13 @@ class PowerSupply:
         """
         Exercise the public PSU interface using the active adapter.
         Returns a dict: identity, adapter, calls[], features[].
+        Queries are batched with their error check (cmd;*ESR?) for the run.
         """
+        assert self._session is not None
+        with self._session.batching_queries():
+            return self._selftest_interface(channels)
+
+    def _selftest_interface(self, channels: tuple[int, ...]) -> dict:
         from typing import Any, Dict
         assert self._adapter is not None
 
@@ -970,16 +1651,18 @@ class PowerSupply:
             "calls": {},
             "features": {},
         }
+        calls = out["calls"]
+        features = out["features"]
 
         def _call(name: str, fn, *a, **k):
             try:
                 r = fn(*a, **k)
-                out["calls"][name] = {"ok": True}
+                calls[name] = {"ok": True}
                 return r
             except NotSupportedError as e:
-                out["calls"][name] = {"ok": False, "error": "NotSupported", "msg": str(e)}
+                calls[name] = {"ok": False, "error": "NotSupported", "msg": str(e)}
             except Exception as e:
-                out["calls"][name] = {"ok": False, "error": type(e).__name__, "msg": str(e)}
+                calls[name] = {"ok": False, "error": type(e).__name__, "msg": str(e)}
 
         # pick a channel to exercise
         ch = channels[0] if channels else 1
@@ -994,21 +1677,26 @@ class PowerSupply:
         _call("output_off", self.output, ch, False)
 
         # Optional capabilities: mark feature support
-        def _feature(name: str, fn, *a, **k):
+        unsupported = self._adapter._unsupported
+
+        def _feature(name: str, cap: str, fn, *a, **k):
+            if cap in unsupported:
+                features[name] = False
+                return
             try:
                 fn(*a, **k)
-                out["features"][name] = True
+                features[name] = True
             except NotSupportedError:
-                out["features"][name] = False
+                features[name] = False
             except Exception as e:
-                out["features"][name] = f"error:{type(e).__name__}"
+                features[name] = f"error:{type(e).__name__}"
 
-        _feature("ovp", self.set_ovp, ch, 5.0, True)
-        _feature("ocp", self.set_ocp, ch, 0.2, True)
-        _feature("sense_remote", self.sense_remote, ch, False)
-        _feature("tracking_series", self.tracking, "SERIES")
-        _feature("tracking_parallel", self.tracking, "PARALLEL")
-        _feature("tracking_indep", self.tracking, "INDEP")
+        _feature("ovp", "ovp", self.set_ovp, ch, 5.0, True)
+        _feature("ocp", "ocp", self.set_ocp, ch, 0.2, True)
+        _feature("sense_remote", "sense_remote", self.sense_remote, ch, False)
+        _feature("tracking_series", "tracking", self.tracking, "SERIES")
+        _feature("tracking_parallel", "tracking", self.tracking, "PARALLEL")
+        _feature("tracking_indep", "tracking", self.tracking, "INDEP")
 
         # Raw/direct passthrough sanity (non-fatal)
         _call("write_raw_noop", self.write_raw, "*OPC?")
@@ -1016,9 +1704,109 @@ class PowerSupply:
 
         return out
 
+class PowerSupplyGroup:
+    """Several distinct PowerSupply instances driven side by side.
+
+    Each call runs on one worker thread per supply, so blocking VISA I/O on
+    one instrument overlaps with the others. Every supply still sees its own
+    calls one at a time: a per-supply lock serializes them, also across
+    concurrent map() calls and when a supply is listed twice. Pass
+    sequential=True for setups that cannot take simultaneous traffic (e.g.
+    several instruments sharing one GPIB bus).
+    """
+
+    def __init__(self, psus: Iterable[PowerSupply], *, sequential: bool = False) -> None:
+        self.psus = list(psus)
+        self.sequential = sequential
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # one lock per distinct supply (duplicates share it)
+        self._locks: Dict[int, threading.Lock] = {id(p): threading.Lock() for p in self.psus}
+
+    def _call(self, fn: Callable[[PowerSupply], Any], p: PowerSupply) -> Any:
+        lock = self._locks.get(id(p)) or self._locks.setdefault(id(p), threading.Lock())
+        with lock:  # setdefault: a supply appended to .psus later
+            return fn(p)
+
+    def map(self, fn: Callable[[PowerSupply], Any]) -> list:
+        """fn(psu) for every supply; results in group order, first error re-raised."""
+        if self.sequential or len(self.psus) < 2:
+            return [self._call(fn, p) for p in self.psus]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(self.psus), thread_name_prefix="psu-group")
+        return list(self._executor.map(functools.partial(self._call, fn), self.psus))
+
+    def measure_voltage_all(self, channel: int = 1) -> list[float]:
+        return self.map(lambda p: p.measure_voltage(channel))
+
+    def measure_current_all(self, channel: int = 1) -> list[float]:
+        return self.map(lambda p: p.measure_current(channel))
+
+    def close(self) -> None:
+        """Stop the worker threads (the supplies themselves stay connected)."""
+        ex, self._executor = self._executor, None
+        if ex is not None:
+            ex.shutdown(wait=True)
+
+    def __enter__(self) -> "PowerSupplyGroup":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 # ---------------------------
 # Mock instrument for tests/CI (no hardware required)
 # ---------------------------
+_MOCK_TTI_SET = re.compile(r"([VI])([1-3]) (\S+)$", re.I)
+_MOCK_TTI_QUERY = re.compile(r"([VI])([1-3])\?$")
+
+def _mock_nsel(st: Dict[str, Any], cmd: str, u: str) -> None:
+    st["ch"] = int(cmd.split()[-1])
+
+def _mock_sel(st: Dict[str, Any], cmd: str, u: str) -> None:
+    st["ch"] = int(cmd.split("CH")[-1])
+
+def _mock_volt(st: Dict[str, Any], cmd: str, u: str) -> None:
+    st["v"][st["ch"]] = float(cmd.split()[-1])
+
+def _mock_curr(st: Dict[str, Any], cmd: str, u: str) -> None:
+    st["i"][st["ch"]] = float(cmd.split()[-1])
+
+def _mock_out_all(st: Dict[str, Any], cmd: str, u: str) -> None:
+    val = "ON" in u
+    for k in st["out"]:
+        st["out"][k] = val
+
+def _mock_out_ch(st: Dict[str, Any], cmd: str, u: str) -> None:
+    ch = int(cmd.split()[1][2:].rstrip(",ONoff"))
+    st["out"][ch] = u.strip().endswith("ON")
+
+def _mock_out(st: Dict[str, Any], cmd: str, u: str) -> None:
+    # OUTP, OUTP:STAT (and anything else under OUTP) act on the selected channel
+    st["out"][st["ch"]] = u.strip().endswith("ON")
+
+# (upper-case prefix, handler), first match wins: "OUTP:GEN" and "OUTP CH" before "OUTP"
+_MOCK_WRITE_DISPATCH = (
+    ("INST:NSEL", _mock_nsel),
+    ("INST:SEL", _mock_sel),
+    ("SOUR:VOLT ", _mock_volt),
+    ("SOUR:CURR ", _mock_curr),
+    ("OUTP:GEN", _mock_out_all),
+    ("OUTP CH", _mock_out_ch),
+    ("OUTP", _mock_out),
+)
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _mock_num_cached(v: float) -> str:
+    # Readbacks repeat the same few setpoints; keyed on the value, so direct
+    # edits of mock.state never see a stale reply
+    return f"{v}\n"
+
+def _mock_num_reply(v: float) -> str:
+    if not v:  # 0.0 == -0.0 as cache keys, but they print differently
+        return f"{v}\n"
+    return _mock_num_cached(v)
+
 class MockVisaResource:
     def __init__(self, idn: str = "RIGOL TECHNOLOGIES,DP832,DP8C000000,00.01.00"):
         self.idn = idn
@@ -1034,54 +1822,83 @@ class MockVisaResource:
         }
 
     def write(self, cmd: str):
-        cmd = cmd.strip()
-        if cmd.upper().startswith("INST:NSEL"):
-            self.state["ch"] = int(cmd.split()[-1])
-        elif cmd.upper().startswith("INST:SEL"):
-            self.state["ch"] = int(cmd.split("CH")[-1])
-        elif cmd.upper().startswith("SOUR:VOLT "):
-            self.state["v"][self.state["ch"]] = float(cmd.split()[-1])
-        elif cmd.upper().startswith("SOUR:CURR "):
-            self.state["i"][self.state["ch"]] = float(cmd.split()[-1])
-        elif cmd.upper().startswith("OUTP:GEN"):
-            val = "ON" in cmd.upper()
-            for k in self.state["out"]:
-                self.state["out"][k] = val
-        elif cmd.upper().startswith("OUTP CH"):
-            part = cmd.split()[1]
-            ch = int(part[2:].rstrip(",ONoff"))
-            val = cmd.strip().upper().endswith("ON")
-            self.state["out"][ch] = val
-        elif cmd.upper().startswith("OUTP:STAT") or cmd.upper().startswith("OUTP"):
-            val = cmd.strip().upper().endswith("ON")
-            self.state["out"][self.state["ch"]] = val
+        # compound messages: "SOUR:VOLT:PROT 5;:SOUR:VOLT:PROT:STAT ON"
+        for part in cmd.split(";"):
+            self._write_one(part.strip().lstrip(":"))
+
+    def _write_one(self, cmd: str):
+        u = cmd.upper()
+        for prefix, handler in _MOCK_WRITE_DISPATCH:
+            if u.startswith(prefix):
+                handler(self.state, cmd, u)
+                return
+        m = _MOCK_TTI_SET.match(cmd)
+        if m:  # CPX200DP: "V1 5.000", "I2 0.500"
+            self.state[m.group(1).lower()][int(m.group(2))] = float(m.group(3))
         # ignore others
 
     def query(self, cmd: str) -> str:
-        u = cmd.strip().upper()
-        if u == "*IDN?":
-            return self.idn + "\n"
-        if u == "*OPC?":
-            return "1\n"
-        if u == "SYST:ERR?":
-            if self.state["err"]:
-                return self.state["err"].pop(0) + "\n"
-            return "0,\"No error\"\n"
-        if u in {"OUTP?", "OUTP:STAT?"}:
-            return ("ON\n" if self.state["out"][self.state["ch"]] else "OFF\n")
+        if ";" in cmd:  # compound: run the writes, answer the queries, one reply line
+            out = []
+            for part in cmd.split(";"):
+                if "?" in part:
+                    out.append(self.query(part).rstrip("\n"))
+                else:
+                    self._write_one(part.strip().lstrip(":"))
+            return ";".join(out) + "\n"
+        u = cmd.strip().lstrip(":").upper()
+        handler = _MOCK_QUERY_EXACT.get(u)
+        if handler is not None:
+            return handler(self)
         if u.startswith("OUTP? CH"):
             ch = int(u.split("CH")[-1])
             return ("ON\n" if self.state["out"].get(ch, False) else "OFF\n")
-        if u == "MEAS:VOLT?":
-            return f"{self.state['v'][self.state['ch']]}\n"
-        if u == "MEAS:CURR?":
-            return f"{self.state['i'][self.state['ch']]}\n"
+        if u.startswith("MEAS:VOLT? (@"):  # channel list: "MEAS:VOLT? (@1,2)"
+            chs = u[u.index("@") + 1:].rstrip(")").split(",")
+            return ",".join(str(self.state["v"][int(c)]) for c in chs) + "\n"
+        m = _MOCK_TTI_QUERY.match(u)
+        if m:  # CPX200DP setpoint readback: "V1 5.000"
+            return f"{m.group(1)}{m.group(2)} {self.state[m.group(1).lower()][int(m.group(2))]:.3f}\n"
         return "\n"
 
     def close(self):
         pass
 
 
+def _mock_syst_err(mock: MockVisaResource) -> str:
+    if mock.state["err"]:
+        return mock.state["err"].pop(0) + "\n"
+    return "0,\"No error\"\n"
+
+def _mock_syst_err_all(mock: MockVisaResource) -> str:
+    errs, mock.state["err"] = mock.state["err"], []
+    return (",".join(errs) or "0,\"No error\"") + "\n"
+
+def _mock_out_q(mock: MockVisaResource) -> str:
+    return "ON\n" if mock.state["out"][mock.state["ch"]] else "OFF\n"
+
+def _mock_volt_q(mock: MockVisaResource) -> str:
+    return _mock_num_reply(mock.state["v"][mock.state["ch"]])
+
+def _mock_curr_q(mock: MockVisaResource) -> str:
+    return _mock_num_reply(mock.state["i"][mock.state["ch"]])
+
+# Exact (upper-case) queries answered with one dict lookup; prefix forms stay in query()
+_MOCK_QUERY_EXACT = {
+    "*IDN?": lambda mock: mock.idn + "\n",
+    "*OPC?": lambda mock: "1\n",
+    "*ESR?": lambda mock: "32\n" if mock.state["err"] else "0\n",  # CME while anything is queued
+    "SYST:ERR?": _mock_syst_err,
+    "SYST:ERR:ALL?": _mock_syst_err_all,
+    "OUTP?": _mock_out_q,
+    "OUTP:STAT?": _mock_out_q,
+    "MEAS:VOLT?": _mock_volt_q,
+    "SOUR:VOLT?": _mock_volt_q,
+    "MEAS:CURR?": _mock_curr_q,
+    "SOUR:CURR?": _mock_curr_q,
+}
+
+
 class MockResourceManager:
     def __init__(self, resource: Optional[MockVisaResource] = None):
         self._resource = resource or MockVisaResource()
@@ -0,0 +1,67 @@
+"""Compound-message fallback of the PSU session, against the built-in mock."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from labscpi.psu_scpi import MockResourceManager, MockVisaResource, PowerSupply
+
+
+class LoggingResource(MockVisaResource):
+    """Mock that records every message; refuses ';'-chained ones when chain=False."""
+
+    def __init__(self, chain=True):
+        super().__init__()
+        self.chain = chain
+        self.log = []
+
+    def write(self, cmd):
+        self.log.append(("W", cmd))
+        if not self.chain and ";" in cmd:
+            raise TimeoutError("VI_ERROR_TMO")
+        return super().write(cmd)
+
+    def query(self, cmd):
+        self.log.append(("Q", cmd))
+        if not self.chain and ";" in cmd:
+            raise TimeoutError("VI_ERROR_TMO")
+        return super().query(cmd)
+
+
+def _open(res):
+    psu = PowerSupply("MOCK", rm=MockResourceManager(res))
+    psu.connect()
+    psu.initialize()
+    res.log.clear()
+    return psu
+
+
+def test_write_many_joins_parts_when_chaining():
+    res = LoggingResource()
+    s = _open(res)._session
+    s.write_many(["VOLT 1", ":CURR 0.5"])
+    assert [m for _, m in res.log if m.startswith("VOLT")][0].startswith("VOLT 1;:CURR 0.5")
+
+
+def test_failed_compound_is_not_resent_and_queue_is_cleared():
+    res = LoggingResource(chain=False)
+    s = _open(res)._session
+    with pytest.raises(TimeoutError):
+        s.write("VOLT 1")
+    sent = [m for _, m in res.log]
+    assert sum(m.startswith("VOLT 1") for m in sent) == 1
+    probe = sent.index("*OPC?;*OPC?")
+    assert "SYST:ERR?" in sent[probe + 1:]
+    assert s._compound is False
+
+
+def test_write_many_sends_parts_separately_without_chaining():
+    res = LoggingResource(chain=False)
+    s = _open(res)._session
+    s._compound = False
+    s.write_many(["VOLT 1", ":CURR 0.5"])
+    writes = [m for k, m in res.log if k == "W"]
+    assert writes == ["VOLT 1", "CURR 0.5"]
+    assert not any(";" in m for _, m in res.log)
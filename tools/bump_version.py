@@ -6,25 +6,64 @@ Usage:
   python tools/bump_version.py 0.2.0
   python tools/bump_version.py 0.2.0 --from 0.1.0
 """
-import argparse, pathlib, re, shutil, hashlib, json, sys
+import argparse, os, pathlib, re, shutil, hashlib, json, mmap, sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # optional, faster serializer
+except Exception:
+    orjson = None
+
+def dumps_index(idx: dict) -> str:
+    """json.dumps(idx, indent=2), via orjson when installed (same text for ASCII content)."""
+    if orjson is not None:
+        s = orjson.dumps(idx, option=orjson.OPT_INDENT_2).decode("utf-8")
+        if s.isascii():  # json escapes non-ASCII as \uXXXX; orjson does not
+            return s
+    return json.dumps(idx, indent=2)
+
+try:
+    import fcntl
+except Exception:
+    fcntl = None  # not on Windows
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 PKG_INIT = ROOT / "src" / "labscpi" / "__init__.py"
 PYPROJECT = ROOT / "pyproject.toml"
 RULES_DIR = ROOT / "rules"
 
+_rules_entries: dict[str, bool] | None = None
+
+def rules_entries() -> dict[str, bool]:
+    """{name: is a folder} for RULES_DIR, scanned once; copy_rules adds the folder it creates."""
+    global _rules_entries
+    if _rules_entries is None:
+        try:
+            _rules_entries = {e.name: e.is_dir() for e in os.scandir(RULES_DIR)}
+        except FileNotFoundError:
+            _rules_entries = {}
+    return _rules_entries
+
 def read(p: pathlib.Path) -> str:
     return p.read_text(encoding="utf-8")
 
 def write(p: pathlib.Path, s: str) -> None:
     p.write_text(s, encoding="utf-8")
 
-def get_current_versions() -> tuple[str,str]:
-    # __version__ and __rules_version__ from __init__.py
+# __version__ / __rules_version__ assignments in __init__.py, matched in one pass
+_INIT_VER_RE = re.compile(r'(?m)^(__version__|__rules_version__)\s*=\s*"([^"]*)"')
+
+def _init_versions(init: str) -> dict[str, str]:
+    found: dict[str, str] = {}
+    for m in _INIT_VER_RE.finditer(init):
+        found.setdefault(m.group(1), m.group(2))
+    return found
+
+def get_current_versions() -> tuple[str,str,str]:
+    # __version__ and __rules_version__ from __init__.py, plus the text itself for bump_init
     init = read(PKG_INIT)
-    ver = re.search(r'^__version__\s*=\s*"([^"]+)"', init, re.M).group(1)
-    rver = re.search(r'^__rules_version__\s*=\s*"([^"]+)"', init, re.M).group(1)
-    return ver, rver
+    found = _init_versions(init)
+    return found["__version__"], found["__rules_version__"], init
 
 def bump_pyproject(newver: str):
     s = read(PYPROJECT)
@@ -34,48 +73,85 @@ def bump_pyproject(newver: str):
         sys.exit(2)
     write(PYPROJECT, s2)
 
-def bump_init(newver: str, rulesver: str):
-    s = read(PKG_INIT)
-    s = re.sub(r'(?m)^__version__\s*=\s*".*"', f'__version__ = "{newver}"', s, count=1)
-    s = re.sub(r'(?m)^__rules_version__\s*=\s*".*"', f'__rules_version__ = "{rulesver}"', s, count=1)
-    write(PKG_INIT, s)
+def bump_init(newver: str, rulesver: str, init: str | None = None):
+    s = read(PKG_INIT) if init is None else init
+    new = {"__version__": newver, "__rules_version__": rulesver}
+    done: set[str] = set()
+
+    def _sub(m: re.Match) -> str:
+        name = m.group(1)
+        if name in done:  # only the first assignment of each, as before
+            return m.group(0)
+        done.add(name)
+        return f'{name} = "{new[name]}"'
+
+    write(PKG_INIT, _INIT_VER_RE.sub(_sub, s))
+
+_FICLONE = 0x40049409  # linux/fs.h
+
+def _clone_or_copy(src: str, dst: str) -> str:
+    # Copy-on-write clone where the filesystem supports it (btrfs, XFS): no data is
+    # copied, and unlike a hard link the new version can be edited in place safely.
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            with open(src, "rb") as fs, open(dst, "wb") as fd:
+                fcntl.ioctl(fd.fileno(), _FICLONE, fs.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
 
 def copy_rules(from_ver: str, to_ver: str):
-    src = RULES_DIR / from_ver
-    dst = RULES_DIR / to_ver
-    if not src.exists():
+    entries = rules_entries()
+    if from_ver not in entries:
         print(f"error: rules/{from_ver} not found", file=sys.stderr)
         sys.exit(3)
-    if dst.exists():
+    if to_ver in entries:
         print(f"note: rules/{to_ver} already exists, leaving as-is")
         return
-    shutil.copytree(src, dst)
+    shutil.copytree(RULES_DIR / from_ver, RULES_DIR / to_ver, copy_function=_clone_or_copy)
+    entries[to_ver] = True
 
-def sha256(fp: pathlib.Path) -> str:
-    h = hashlib.sha256()
+def sha256(fp: os.PathLike) -> str:
     with open(fp, "rb") as f:
-        for chunk in iter(lambda: f.read(1<<20), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read/hash loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # Python 3.10: hash a read-only mapping in one call (mmap can't map an empty file)
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+def sha256_all(fps: list[os.PathLike]) -> list[str]:
+    """sha256() of each file, in order; hashed on a thread pool for larger folders."""
+    if len(fps) < 8:  # thread start-up costs more than hashing a few small files
+        return [sha256(f) for f in fps]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        return list(ex.map(sha256, fps))
 
 def make_rules_index(ver: str):
     d = RULES_DIR / ver
-    if not d.exists():
+    if ver not in rules_entries():
         print(f"error: rules/{ver} not found to index", file=sys.stderr)
         sys.exit(4)
-    files = [f for f in d.iterdir() if f.is_file() and f.name != "rules_index.json"]
+    files = sorted((e for e in os.scandir(d) if e.is_file() and e.name != "rules_index.json"),
+                   key=lambda e: e.name)
     idx = {
         "driver_version": ver,
         "rules_version": ver,
-        "files": [{"name": f.name, "sha256": sha256(f)} for f in sorted(files, key=lambda p: p.name)],
+        "files": [{"name": f.name, "sha256": h} for f, h in zip(files, sha256_all(files))],
     }
-    (d / "rules_index.json").write_text(json.dumps(idx, indent=2), encoding="utf-8")
+    (d / "rules_index.json").write_text(dumps_index(idx), encoding="utf-8")
+
+_DIGITS_RE = re.compile(r'(\d+)')
+
+def _natural_key(s: str) -> list:
+    # "0.10.0" > "0.9.1": digit runs compare as ints (split keeps str/int positions aligned)
+    return [int(x) if x.isdigit() else x for x in _DIGITS_RE.split(s)]
 
 def detect_latest_rules_version() -> str | None:
-    if not RULES_DIR.exists():
-        return None
-    vers = [p.name for p in RULES_DIR.iterdir() if p.is_dir()]
-    return sorted(vers, key=lambda s: [int(x) if x.isdigit() else x for x in re.split(r'(\d+)', s)])[-1] if vers else None
+    return max((name for name, is_dir in rules_entries().items() if is_dir), key=_natural_key, default=None)
 
 def main():
     ap = argparse.ArgumentParser()
@@ -84,7 +160,7 @@ def main():
     args = ap.parse_args()
 
     newver = args.new_version
-    cur_pkg_ver, cur_rules_ver = get_current_versions()
+    cur_pkg_ver, cur_rules_ver, init_text = get_current_versions()
 
     from_ver = args.from_ver or cur_rules_ver or detect_latest_rules_version()
     if not from_ver:
@@ -95,7 +171,7 @@ def main():
     print(f"rules:   {from_ver} -> {newver}")
 
     bump_pyproject(newver)
-    bump_init(newver, newver)
+    bump_init(newver, newver, init_text)
     copy_rules(from_ver, newver)
     make_rules_index(newver)
 
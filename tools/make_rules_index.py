@@ -1,6 +1,20 @@
 #!/usr/bin/env python3
 """Generate rules_index.json with SHA-256 checksums for all .md files in a rules version folder."""
-import hashlib, json, pathlib, sys
+import hashlib, json, mmap, os, pathlib, sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # optional, faster serializer
+except Exception:
+    orjson = None
+
+def dumps_index(idx):
+    """json.dumps(idx, indent=2), via orjson when installed (same text for ASCII content)."""
+    if orjson is not None:
+        s = orjson.dumps(idx, option=orjson.OPT_INDENT_2).decode("utf-8")
+        if s.isascii():  # json escapes non-ASCII as \uXXXX; orjson does not
+            return s
+    return json.dumps(idx, indent=2)
 
 # Get version from command line or default to latest
 ver = sys.argv[1] if len(sys.argv) > 1 else "0.4.0"
@@ -8,26 +22,37 @@ ver = sys.argv[1] if len(sys.argv) > 1 else "0.4.0"
 # Path: tools -> labscpi -> src/labscpi/rules/<ver>
 p = pathlib.Path(__file__).parents[1] / "src" / "labscpi" / "rules" / ver
 
+def sha256_all(fps):
+    """sha256() of each file, in order; hashed on a thread pool for larger folders."""
+    if len(fps) < 8:  # thread start-up costs more than hashing a few small files
+        return [sha256(f) for f in fps]
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+        return list(ex.map(sha256, fps))
+
 def sha256(fp):
-    h = hashlib.sha256()
     with open(fp, "rb") as f:
-        for b in iter(lambda: f.read(1<<20), b""):
-            h.update(b)
-    return h.hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read/hash loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # Python 3.10: hash a read-only mapping in one call (mmap can't map an empty file)
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
 
 if not p.exists():
     print(f"Error: Rules folder not found: {p}")
     sys.exit(1)
 
-# Only index .md files
-files = [f for f in p.iterdir() if f.is_file() and f.suffix == ".md"]
+# Only index .md files. One os.scandir pass: the file type comes from the directory
+# entry (no stat per file), and there is no fnmatch/Path overhead as with p.glob("*.md").
+files = sorted((e for e in os.scandir(p) if e.is_file() and os.path.splitext(e.name)[1] == ".md"), key=lambda e: e.name)
 idx = {
     "driver_version": ver,
     "rules_version": ver,
-    "files": [{"name": f.name, "sha256": sha256(f)} for f in sorted(files)],
+    "files": [{"name": f.name, "sha256": h} for f, h in zip(files, sha256_all(files))],
 }
 
 # Write to src/labscpi/rules/rules_index.json
 out_path = p.parent / "rules_index.json"
-out_path.write_text(json.dumps(idx, indent=2))
+out_path.write_text(dumps_index(idx))
 print(f"wrote {out_path}")
@@ -8,10 +8,20 @@ from typing import Optional, Tuple
 
 TRIPLE_RE = r'("""|\'\'\')'
 
+# Motifs compilés une fois pour toutes (pas de recherche dans le cache de re)
+_MD_OPEN = re.compile(r"^\ufeff?---\r?\n")
+_PY_OPEN = re.compile(rf"^\ufeff?(?P<quote>\"\"\"|\'\'\')\r?\n---\r?\n")
+_YAML_CLOSE = re.compile(r"^---\r?$", re.MULTILINE)
+_PY_CLOSE = {q: re.compile(r"\r?\n" + re.escape(q)) for q in ('"""', "'''")}
 
-def compute_checksum(body: str) -> str:
-    """Retourne le SHA-256 hexadécimal du corps."""
-    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+_BOM = b"\xef\xbb\xbf"
+
+
+def compute_checksum(body) -> str:
+    """Retourne le SHA-256 hexadécimal du corps (str, ou bytes UTF-8 déjà encodés)."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.sha256(body).hexdigest()
 
 
 def find_header(text: str) -> Optional[Tuple[str, int, int, int, Optional[str]]]:
@@ -28,53 +38,123 @@ def find_header(text: str) -> Optional[Tuple[str, int, int, int, Optional[str]]]
     """
 
     # 1) Markdown-style: --- ... --- en tout début de fichier
-    m = re.match(r"^\ufeff?---\r?\n", text)
+    m = _MD_OPEN.match(text)
     if m:
-        start = m.end()  # début réel du YAML
-        m2 = re.search(r"^---\r?$", text[start:], flags=re.MULTILINE)
+        start = m.end()  # début réel du YAML (juste après un saut de ligne)
+        m2 = _YAML_CLOSE.search(text, start)
         if not m2:
             return None
         header_start = start
-        header_end = start + m2.start()
-        body_start = start + m2.end()
+        header_end = m2.start()
+        body_start = m2.end()
         return ("md", header_start, header_end, body_start, None)
 
     # 2) Python-style: docstring de tête avec front-matter YAML
     # Format attendu:
     #   """\n---\n<YAML>\n---\n"""\n<corps>
-    m = re.match(rf"^\ufeff?(?P<quote>\"\"\"|\'\'\')\r?\n---\r?\n", text)
+    m = _PY_OPEN.match(text)
     if m:
         quote = m.group("quote")
         header_start = m.end()  # après la ligne '---' d'ouverture interne
 
         # cherche la ligne '---' de fermeture du YAML
-        m2 = re.search(r"^---\r?$", text[header_start:], flags=re.MULTILINE)
+        m2 = _YAML_CLOSE.search(text, header_start)
         if not m2:
             return None
-        header_end = header_start + m2.start()
-        after = header_start + m2.end()
+        header_end = m2.start()
+        after = m2.end()
 
         # on s'attend à trouver: newline + triple-quote juste après
-        m3 = re.match(r"\r?\n" + re.escape(quote), text[after:])
+        m3 = _PY_CLOSE[quote].match(text, after)
         if not m3:
             return None
 
-        body_start = after + m3.end()
+        body_start = m3.end()
         return ("py", header_start, header_end, body_start, quote)
 
     return None
 
 
+def _find_yaml_close(raw: bytes, start: int) -> int:
+    """Offset de la première ligne '---' à partir de start (début de ligne), ou -1."""
+    i = start
+    n = len(raw)
+    while True:
+        i = raw.find(b"---", i)
+        if i < 0:
+            return -1
+        if (i == start or raw[i - 1] == 0x0A) and (i + 3 == n or raw[i + 3] == 0x0A):
+            return i
+        i += 1
+
+
+def find_header_bytes(raw: bytes) -> Optional[Tuple[str, int, int, int, Optional[bytes]]]:
+    """
+    find_header pour des bytes sans '\\r' (fins de ligne LF): mêmes offsets
+    (en octets), mais avec startswith/find sur les délimiteurs ASCII au lieu
+    du moteur de regex. Les fichiers CRLF passent par find_header.
+    """
+    p = 3 if raw.startswith(_BOM) else 0
+
+    # 1) Markdown-style
+    if raw.startswith(b"---\n", p):
+        start = p + 4
+        i = _find_yaml_close(raw, start)
+        if i < 0:
+            return None
+        return ("md", start, i, i + 3, None)
+
+    # 2) Python-style: '"""\n---\n' ou "'''\n---\n"
+    quote = raw[p:p + 3]
+    if quote in (b'"""', b"'''") and raw.startswith(b"\n---\n", p + 3):
+        header_start = p + 8
+        i = _find_yaml_close(raw, header_start)
+        if i < 0:
+            return None
+        after = i + 3
+        if not raw.startswith(b"\n" + quote, after):
+            return None
+        return ("py", header_start, i, after + 4, quote)
+
+    return None
+
+
+def _find_checksum_line(header: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Première ligne 'checksum<ws>:<ws><valeur>' du header, sans regex.
+    Retourne (début de ligne, début de la valeur, fin de ligne) ou None.
+    """
+    i = header.find("checksum")
+    while i >= 0:
+        if i == 0 or header[i - 1] == "\n":
+            end = header.find("\n", i)
+            if end < 0:
+                end = len(header)
+            j = i + 8
+            while j < end and header[j] in " \t":
+                j += 1
+            if j < end and header[j] == ":":
+                j += 1
+                while j < end and header[j] in " \t":
+                    j += 1
+                return i, j, end
+        i = header.find("checksum", i + 1)
+    return None
+
+
 def update_header_block(header: str, checksum: str) -> str:
     """
     Met à jour ou ajoute la ligne 'checksum: ...' dans le bloc YAML.
     - header = contenu YAML sans les lignes ---.
     """
-    # remplace n'importe quelle ligne existante commençant par 'checksum:'
-    pat = re.compile(r"^(?P<k>checksum\s*:\s*)(?P<v>.*)$", re.MULTILINE)
-
-    if pat.search(header):
-        return pat.sub(lambda m: m.group("k") + checksum, header, count=1)
+    # remplace la première ligne existante commençant par 'checksum:'
+    found = _find_checksum_line(header)
+    if found:
+        start, value, end = found
+        key = header[start:value]
+        if value == end and not key.endswith((" ", "\t")):
+            key += " "  # 'checksum:' vide -> 'checksum: <valeur>'
+        return header[:start] + key + checksum + header[end:]
 
     # pas de checksum existant -> on l'ajoute à la fin
     if not header.endswith("\n"):
@@ -82,6 +162,12 @@ def update_header_block(header: str, checksum: str) -> str:
     return header + f"checksum: {checksum}\n"
 
 
+def _checksum_is_current(header: str, checksum: str) -> bool:
+    """Vrai si la première ligne 'checksum:' du header vaut déjà checksum (rien à réécrire)."""
+    found = _find_checksum_line(header)
+    return found is not None and header[found[1]:found[2]] == checksum
+
+
 def rewrite_text_with_checksum(text: str) -> str:
     """
     Si un header front-matter valide est trouvé, recalcule le checksum
@@ -97,6 +183,8 @@ def rewrite_text_with_checksum(text: str) -> str:
     checksum = compute_checksum(body)
 
     original_header = text[header_start:header_end]
+    if _checksum_is_current(original_header, checksum):
+        return text
     new_header = update_header_block(original_header, checksum)
 
     # reconstruction:
@@ -118,14 +206,54 @@ def rewrite_text_with_checksum(text: str) -> str:
     return text
 
 
+def rewrite_bytes_with_checksum(raw: bytes) -> bytes:
+    """
+    Variante de rewrite_text_with_checksum pour un fichier UTF-8 sans '\\r'
+    (où la lecture texte ne change rien): le corps est haché directement sur
+    les octets lus, via un memoryview, sans copie ni aller-retour decode/encode.
+    Seul le header est décodé.
+    """
+    info = find_header_bytes(raw)
+    if not info:
+        return raw
+
+    kind, header_start, header_end, body_start, quote = info
+    with memoryview(raw) as mv:
+        checksum = compute_checksum(mv[body_start:])
+
+    original_header = raw[header_start:header_end].decode("utf-8")
+    if _checksum_is_current(original_header, checksum):
+        return raw
+    new_header = update_header_block(original_header, checksum)
+    return raw[:header_start] + new_header.encode("utf-8") + raw[header_end:]
+
+
 def process_file(path: str) -> None:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            original = f.read()
+        with open(path, "rb") as f:
+            raw = f.read()
+        if not raw.isascii():
+            raw.decode("utf-8")  # même refus qu'une lecture texte
     except (OSError, UnicodeDecodeError) as e:
         print(f"[SKIP] {path}: impossible de lire le fichier ({e})")
         return
 
+    if b"\r" not in raw:
+        # Cas courant (fins de ligne LF): tout se fait en bytes
+        updated = rewrite_bytes_with_checksum(raw)
+        if updated == raw:
+            print(f"[NO CHANGE] {path}")
+            return
+        try:
+            with open(path, "wb") as f:
+                f.write(updated)
+            print(f"[UPDATED] {path}")
+        except OSError as e:
+            print(f"[ERROR] {path}: impossible d'écrire le fichier ({e})")
+        return
+
+    # CRLF/CR: la lecture texte normalise les fins de ligne avant le hachage
+    original = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     updated = rewrite_text_with_checksum(original)
 
     if updated == original:
@@ -151,16 +279,36 @@ def iter_paths_from_args(args):
             return
     for p in args:
         if os.path.isdir(p):
-            for root, dirs, files in os.walk(p):
-                # Ignore common folders
-                dirs[:] = [d for d in dirs if d not in (".git", ".hg", ".svn", "__pycache__", ".venv", "venv", "node_modules")]
-                for name in files:
-                    if name.endswith((".md", ".py")):
-                        yield os.path.join(root, name)
+            yield from _scan_dir(p)
         else:
             yield p
 
 
+_SKIP_DIRS = (".git", ".hg", ".svn", "__pycache__", ".venv", "venv", "node_modules")
+
+
+def _scan_dir(root):
+    """
+    Fichiers .md/.py sous root, dans l'ordre d'os.walk (fichiers d'un dossier,
+    puis ses sous-dossiers). os.scandir donne le type de chaque entrée sans
+    stat() supplémentaire.
+    """
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return
+    subdirs = []
+    for e in entries:
+        if e.is_dir():
+            # Ignore common folders; like os.walk, do not follow directory symlinks
+            if e.name not in _SKIP_DIRS and not e.is_symlink():
+                subdirs.append(e.path)
+        elif e.name.endswith((".md", ".py")):
+            yield e.path
+    for d in subdirs:
+        yield from _scan_dir(d)
+
+
 def main():
     paths = list(iter_paths_from_args(sys.argv[1:]))
     if not paths: